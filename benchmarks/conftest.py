@@ -0,0 +1,160 @@
+import contextlib
+import json
+import os
+import time
+from typing import Iterator, Optional, TypedDict
+
+import pytest
+
+from benchmarks import sites
+from benchmarks.fake_webdriver import FakeWebDriver
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# Simulated latency, in seconds, of each WebDriver command. Navigation also waits
+#   for the page to load, so it's slower. The DOM is ready well before the load
+#   event, though (see BasePage.load_mode).
+COMMAND_LATENCY = 0.05
+NAVIGATION_LATENCY = 0.5
+DOM_READY_LATENCY = 0.15
+# The page load strategy of the fake sessions, as in the default driver profile
+#   (see misc.driver_factory).
+PAGE_LOAD_STRATEGY = 'eager'
+
+# A scenario fails if it sends more commands than its baseline, or if its
+#   simulated time exceeds the baseline by more than this fraction plus slack (the
+#   time also includes the Python side, which varies from machine to machine).
+TIME_TOLERANCE = 0.25
+TIME_SLACK = 0.25
+
+
+class BenchmarkResult(TypedDict):
+    round_trips: int
+    simulated_time: float
+
+
+# Results of this session's benchmarks, by scenario.
+results: dict[str, BenchmarkResult] = dict()
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption('--update-baseline', action='store_true', default=False,
+                     help='Write the benchmark results to benchmarks/baseline.json instead of checking them.')
+    return
+
+
+def load_baseline() -> dict[str, BenchmarkResult]:
+    if not os.path.exists(BASELINE_PATH):
+        return dict()
+    with open(BASELINE_PATH) as f:
+        return json.load(f)
+
+
+class Benchmark:
+    """
+    Measures a scenario run against FakeWebDrivers.
+
+        with benchmark.measure():
+            page.click_checkbox_1()
+
+    Only the commands sent inside measure() count. Commands sent to every tracked
+    driver are added up; the fake_driver fixture is tracked, and track() adds
+    more. Tracked drivers are assumed to run in parallel, so the simulated time
+    counts the latency of the slowest one. On exit, the result is checked against
+    the baseline unless --update-baseline was given.
+    """
+
+    def __init__(self, name: str, driver: FakeWebDriver, update_baseline: bool) -> None:
+        self.name = name
+        self.drivers = [driver]
+        self.update_baseline = update_baseline
+        self.result: Optional[BenchmarkResult] = None
+        return
+
+    def track(self, driver: FakeWebDriver) -> FakeWebDriver:
+        self.drivers.append(driver)
+        return driver
+
+    @contextlib.contextmanager
+    def measure(self) -> Iterator[None]:
+        start = {id(i): (i.command_count, i.simulated_time) for i in self.drivers}
+        start_time = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start_time
+        round_trips = 0
+        latency = 0.0
+        for i_driver in self.drivers:
+            start_count, start_simulated_time = start.get(id(i_driver), (0, 0.0))
+            round_trips += i_driver.command_count - start_count
+            latency = max(latency, i_driver.simulated_time - start_simulated_time)
+        self.result = {
+            'round_trips': round_trips,
+            'simulated_time': round(elapsed + latency, 3),
+        }
+        results[self.name] = self.result
+        if not self.update_baseline:
+            self.check()
+        return
+
+    def check(self) -> None:
+        baseline = load_baseline().get(self.name)
+        if baseline is None:
+            return
+        assert self.result['round_trips'] <= baseline['round_trips'], (
+            f"{self.name} sent {self.result['round_trips']} WebDriver commands; "
+            f"baseline is {baseline['round_trips']}.")
+        max_time = baseline['simulated_time'] * (1 + TIME_TOLERANCE) + TIME_SLACK
+        assert self.result['simulated_time'] <= max_time, (
+            f"{self.name} took {self.result['simulated_time']:.3f}s (simulated); "
+            f"baseline is {baseline['simulated_time']:.3f}s.")
+        return
+
+
+def new_fake_driver() -> FakeWebDriver:
+    return FakeWebDriver(site=sites.SITE, latency=COMMAND_LATENCY, command_latency={'get': NAVIGATION_LATENCY},
+                         dom_ready_latency=DOM_READY_LATENCY, page_load_strategy=PAGE_LOAD_STRATEGY)
+
+
+@pytest.fixture(scope='function')
+def fake_driver() -> FakeWebDriver:
+    driver = new_fake_driver()
+    yield driver
+    driver.quit()
+    return
+
+
+@pytest.fixture(scope='function')
+def benchmark(request, fake_driver) -> Benchmark:
+    name = request.node.nodeid.split('/')[-1]
+    update_baseline = request.config.getoption('--update-baseline', default=False)
+    return Benchmark(name=name, driver=fake_driver, update_baseline=update_baseline)
+
+
+def pytest_sessionfinish(session) -> None:
+    if not results or not session.config.getoption('--update-baseline', default=False):
+        return
+    baseline = load_baseline()
+    baseline.update(results)
+    with open(BASELINE_PATH, 'w') as f:
+        json.dump(dict(sorted(baseline.items())), f, indent=2)
+        f.write('\n')
+    return
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    if not results:
+        return
+    baseline = load_baseline()
+    terminalreporter.section('benchmarks')
+    terminalreporter.write_line(f"{'scenario':<70} {'round trips':>16} {'simulated time':>22}")
+    for i_name, i_result in sorted(results.items()):
+        i_baseline = baseline.get(i_name)
+        if i_baseline is None:
+            round_trips = f"{i_result['round_trips']} (new)"
+            simulated_time = f"{i_result['simulated_time']:.3f}s"
+        else:
+            round_trips = f"{i_result['round_trips']} ({i_result['round_trips'] - i_baseline['round_trips']:+d})"
+            simulated_time = (f"{i_result['simulated_time']:.3f}s "
+                              f"({i_result['simulated_time'] - i_baseline['simulated_time']:+.3f}s)")
+        terminalreporter.write_line(f"{i_name:<70} {round_trips:>16} {simulated_time:>22}")
+    return
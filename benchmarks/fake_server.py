@@ -0,0 +1,143 @@
+"""
+A WebDriver server (W3C HTTP protocol) backed by FakeWebDrivers.
+
+Lets clients that speak HTTP themselves, like page_objects.aio, run against the
+fake sites. Each new session gets its own FakeWebDriver, created by the given
+factory; the commands it receives are answered by the driver's fake command
+executor, so they're counted and timed the same way.
+
+    with FakeWebDriverServer(factory=...) as server:
+        driver = await AsyncWebDriver.start(server.url)
+"""
+
+import http.server
+import itertools
+import json
+import re
+import threading
+from typing import Callable, Optional
+
+from selenium.common.exceptions import (ElementNotInteractableException, InvalidSelectorException,
+                                        JavascriptException, NoSuchElementException,
+                                        StaleElementReferenceException)
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.remote_connection import remote_commands
+
+from misc.fixture_server import Server
+from page_objects.aio.webdriver import CHROMIUM_COMMANDS
+
+from benchmarks.fake_webdriver import FakeWebDriver
+
+# W3C error codes and HTTP statuses for the exceptions the fake driver raises.
+ERRORS = [
+    (NoSuchElementException, 'no such element', 404),
+    (StaleElementReferenceException, 'stale element reference', 404),
+    (InvalidSelectorException, 'invalid selector', 400),
+    (ElementNotInteractableException, 'element not interactable', 400),
+    (JavascriptException, 'javascript error', 500),
+]
+
+
+def _route_table() -> list[tuple[str, re.Pattern, str]]:
+    # (method, path pattern, command), most specific paths (fewest variables) first.
+    routes = []
+    for command, (method, template) in list(remote_commands.items()) + list(CHROMIUM_COMMANDS.items()):
+        pattern = re.compile('^' + re.sub(r'\\\$(\w+)', r'(?P<\1>[^/]+)', re.escape(template)) + '$')
+        routes.append((template.count('$'), method, pattern, command))
+    return [(method, pattern, command) for _, method, pattern, command in sorted(routes, key=lambda i: i[0])]
+
+
+class FakeWebDriverServer:
+
+    def __init__(self, factory: Callable[[], FakeWebDriver]) -> None:
+        self.factory = factory
+        self.sessions: dict[str, FakeWebDriver] = dict()
+        self._routes = _route_table()
+        self._session_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._server: Optional[Server] = None
+        self._thread: Optional[threading.Thread] = None
+        return
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> None:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                self._handle()
+
+            def do_POST(self) -> None:
+                self._handle()
+
+            def do_DELETE(self) -> None:
+                self._handle()
+
+            def _handle(self) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                params = json.loads(self.rfile.read(length)) if length else dict()
+                status, value = server.dispatch(method=self.command, path=self.path, params=params)
+                body = json.dumps({'value': value}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                return
+
+            def log_message(self, format, *args) -> None:
+                return
+
+        self._server = Server(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        return
+
+    def dispatch(self, method: str, path: str, params: dict) -> tuple[int, object]:
+        for i_method, i_pattern, i_command in self._routes:
+            match = i_pattern.match(path)
+            if i_method == method and match:
+                params.update(match.groupdict())
+                return self._execute(command=i_command, params=params)
+        return 404, {'error': 'unknown command', 'message': f'{method} {path}', 'stacktrace': ''}
+
+    def _execute(self, command: str, params: dict) -> tuple[int, object]:
+        if command == Command.NEW_SESSION:
+            with self._lock:
+                session_id = f'fake-session-{next(self._session_ids)}'
+                self.sessions[session_id] = self.factory()
+            return 200, {'sessionId': session_id, 'capabilities': dict(self.sessions[session_id].caps)}
+
+        driver = self.sessions.get(params.pop('sessionId'))
+        if driver is None:
+            return 404, {'error': 'invalid session id', 'message': 'No such session.', 'stacktrace': ''}
+        if command == Command.QUIT:
+            return 200, None
+
+        try:
+            return 200, driver.command_executor.execute(command, params)['value']
+        except Exception as e:
+            for i_exception, i_error, i_status in ERRORS:
+                if isinstance(e, i_exception):
+                    return i_status, {'error': i_error, 'message': e.msg, 'stacktrace': ''}
+            return 500, {'error': 'unknown error', 'message': str(e), 'stacktrace': ''}
+
+    def __enter__(self) -> 'FakeWebDriverServer':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+        return
@@ -0,0 +1,751 @@
+"""
+A fake WebDriver with an in-memory DOM, for running page objects offline.
+
+FakeWebDriver subclasses Selenium's WebDriver, so page objects and Selenium's
+own WebElement code run unchanged: every call still goes through
+WebDriver.execute(), where it's counted (and can be instrumented). Only the
+command executor is fake. Instead of sending HTTP requests to a browser, it
+answers commands from a tree of FakeNodes built by a site (see sites.py).
+
+JavaScript can't run here, so each script the page objects send (see
+page_objects.scripts) is recognized by its exact text and answered by a Python
+equivalent. Unknown scripts raise JavascriptException; a new script needs a
+handler before page objects using it can be benchmarked.
+
+Latency isn't slept by default. Each command adds its latency to a simulated
+clock, so runs are fast and repeatable.
+"""
+
+import re
+import time
+import urllib.parse
+from typing import Any, Callable, Iterator, Optional
+
+from selenium.common.exceptions import (ElementNotInteractableException, InvalidSelectorException,
+                                        JavascriptException, NoSuchElementException,
+                                        StaleElementReferenceException, WebDriverException)
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.file_detector import LocalFileDetector
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webdriver import WebDriver
+
+import page_objects.scripts
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+# Tags rendered on their own line by WebDriver's getText().
+BLOCK_TAGS = ['div', 'p', 'li', 'ul', 'h1', 'h2', 'h3', 'form', 'label', 'select', 'option', 'br']
+
+
+class FakeNode:
+    """
+    An element in the fake DOM.
+
+    Form state (value, checked, selected, disabled) is kept as properties, like
+    in a browser, separate from the attributes the node was created with.
+    input_value is the value as the page's own scripts see it when they track
+    'input' events, like React-controlled inputs: typing and FILL_FIELDS update
+    it, but WebDriver's clear() doesn't.
+    on_click, if given, is called with (driver, node) instead of the default
+    click behaviour.
+    """
+
+    def __init__(self, tag: str, attrs: Optional[dict[str, str]] = None, text: str = '',
+                 children: Optional[list['FakeNode']] = None, hidden: bool = False,
+                 on_click: Optional[Callable[['FakeWebDriver', 'FakeNode'], None]] = None) -> None:
+        self.tag = tag.lower()
+        self.attrs = dict(attrs or dict())
+        self.own_text = text
+        self.children = []
+        self.parent = None
+        self.hidden = hidden
+        self.on_click = on_click
+        self.value = self.attrs.get('value', '')
+        self.input_value = self.value
+        self.checked = 'checked' in self.attrs
+        self.selected = 'selected' in self.attrs
+        self.disabled = 'disabled' in self.attrs
+        for i_child in children or []:
+            self.append(i_child)
+        return
+
+    # Tree
+
+    def append(self, child: 'FakeNode') -> 'FakeNode':
+        child.parent = self
+        self.children.append(child)
+        return child
+
+    def remove(self) -> None:
+        if self.parent is not None:
+            self.parent.children.remove(self)
+            self.parent = None
+        return
+
+    def descendants(self) -> Iterator['FakeNode']:
+        for i_child in self.children:
+            yield i_child
+            yield from i_child.descendants()
+
+    def ancestors(self) -> Iterator['FakeNode']:
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    @property
+    def root(self) -> 'FakeNode':
+        node = self
+        while node.parent is not None:
+            node = node.parent
+        return node
+
+    # Attributes
+
+    @property
+    def classes(self) -> list[str]:
+        return self.attrs.get('class', '').split()
+
+    def add_class(self, name: str) -> None:
+        if name not in self.classes:
+            self.attrs['class'] = ' '.join(self.classes + [name])
+        return
+
+    def remove_class(self, name: str) -> None:
+        self.attrs['class'] = ' '.join(i for i in self.classes if i != name)
+        return
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """Same rules as Selenium's getAttribute atom (property first, then attribute)."""
+        if name in ['checked', 'selected', 'disabled']:
+            return 'true' if getattr(self, name) else None
+        if name == 'value':
+            return self.value
+        return self.attrs.get(name)
+
+    def has_attribute(self, name: str) -> bool:
+        if name in ['checked', 'selected', 'disabled']:
+            return getattr(self, name)
+        return name in self.attrs
+
+    # Rendering
+
+    def is_displayed(self) -> bool:
+        if self.tag in ['option', 'optgroup']:
+            select = next((i for i in self.ancestors() if i.tag == 'select'), None)
+            return select is not None and select.is_displayed()
+        return not self.hidden and not any(i.hidden for i in self.ancestors()) and self.root.tag == 'html'
+
+    @property
+    def text(self) -> str:
+        """Same idea as WebDriver's getText(): visible text only, trimmed."""
+        if self.hidden:
+            return ''
+        parts = [self.own_text]
+        for i_child in self.children:
+            child_text = i_child.text
+            if child_text and i_child.tag in BLOCK_TAGS and ''.join(parts).strip():
+                parts.append('\n')
+            parts.append(child_text)
+        return ''.join(parts).strip()
+
+    @property
+    def text_content(self) -> str:
+        return self.own_text + ''.join(i.text_content for i in self.children)
+
+    def __repr__(self) -> str:
+        return f"<FakeNode {self.tag} {self.attrs}>"
+
+
+# CSS selectors
+#   Enough of CSS for the selectors used in this repo: tag, #id, .class, [attr],
+#   [attr="value"], descendant and child combinators, and comma-separated lists.
+
+_COMPOUND = re.compile(r'^(?P<tag>\*|[a-zA-Z][\w-]*)?(?P<rest>(?:#[\w-]+|\.[\w-]+|\[[^\]]+\])*)$')
+_SIMPLE = re.compile(r'#[\w-]+|\.[\w-]+|\[[^\]]+\]')
+_ATTRIBUTE = re.compile(r'^\[\s*([\w-]+)\s*(?:=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\]\s]*)))?\s*\]$')
+
+
+def _parse_compound(compound: str) -> Callable[[FakeNode], bool]:
+    match = _COMPOUND.match(compound)
+    if not match:
+        raise InvalidSelectorException(f"Unsupported selector '{compound}'.")
+    tag = match.group('tag')
+    checks = []
+    if tag and tag != '*':
+        checks.append(lambda node, tag=tag.lower(): node.tag == tag)
+    for i_simple in _SIMPLE.findall(match.group('rest')):
+        if i_simple.startswith('#'):
+            checks.append(lambda node, id_=i_simple[1:]: node.attrs.get('id') == id_)
+        elif i_simple.startswith('.'):
+            checks.append(lambda node, name=i_simple[1:]: name in node.classes)
+        else:
+            attribute = _ATTRIBUTE.match(i_simple)
+            if not attribute:
+                raise InvalidSelectorException(f"Unsupported selector '{i_simple}'.")
+            name = attribute.group(1)
+            expected = next((i for i in attribute.groups()[1:] if i is not None), None)
+            if expected is None:
+                checks.append(lambda node, name=name: node.has_attribute(name))
+            else:
+                checks.append(lambda node, name=name, expected=expected: node.attrs.get(name) == expected)
+    return lambda node: all(i(node) for i in checks)
+
+
+def _parse_selector(selector: str) -> list[tuple[Callable[[FakeNode], bool], Optional[str]]]:
+    # Returns (compound matcher, combinator to the compound on its left) pairs,
+    #   right-most compound first.
+    tokens = re.findall(r'\s*>\s*|\s+|[^\s>]+', selector.strip())
+    parts = []
+    combinator = None
+    for i_token in tokens:
+        if i_token.strip() == '>':
+            combinator = '>'
+        elif not i_token.strip():
+            combinator = combinator or ' '
+        else:
+            parts.append((i_token, combinator))
+            combinator = None
+    return [(_parse_compound(compound), combinator) for compound, combinator in reversed(parts)]
+
+
+def _matches(node: FakeNode, matchers: list) -> bool:
+    matcher, combinator = matchers[0]
+    if not matcher(node):
+        return False
+    if len(matchers) == 1:
+        return True
+    candidates = [node.parent] if combinator == '>' else list(node.ancestors())
+    return any(i is not None and _matches(i, matchers[1:]) for i in candidates)
+
+
+def select_all(root: FakeNode, selector: str) -> list[FakeNode]:
+    """Like root.querySelectorAll(selector)."""
+    selectors = [_parse_selector(i) for i in selector.split(',')]
+    return [i for i in root.descendants() if any(_matches(i, m) for m in selectors)]
+
+
+def find_all(root: FakeNode, by: str, value: str) -> list[FakeNode]:
+    """Python equivalent of pboFind() in page_objects.scripts."""
+    if by == 'css selector':
+        return select_all(root, value)
+    if by == 'id':
+        return [i for i in root.descendants() if i.attrs.get('id') == value]
+    if by == 'name':
+        return [i for i in root.descendants() if i.attrs.get('name') == value]
+    if by == 'class name':
+        return [i for i in root.descendants() if value in i.classes]
+    if by == 'tag name':
+        return [i for i in root.descendants() if i.tag == value.lower()]
+    if by == 'link text':
+        return [i for i in root.descendants() if i.tag == 'a' and i.text == value]
+    if by == 'partial link text':
+        return [i for i in root.descendants() if i.tag == 'a' and value in i.text]
+    raise InvalidSelectorException(f"Locator strategy '{by}' isn't supported by the fake driver.")
+
+
+class FakeSite:
+    """
+    Maps URLs to functions that build a page (an <html> FakeNode).
+
+    resources: what loading each URL fetches, as (URL, bytes) pairs, starting
+        with the document itself. Blocked URLs (see Network.setBlockedURLs) are
+        left out of what the page reports.
+    """
+
+    def __init__(self, pages: dict[str, Callable[[], FakeNode]],
+                 resources: Optional[dict[str, list[tuple[str, int]]]] = None) -> None:
+        self.pages = pages
+        self.resources = dict(resources or dict())
+        return
+
+    def build(self, url: str) -> FakeNode:
+        if url not in self.pages:
+            raise WebDriverException(f"The fake site has no page at '{url}'.")
+        return self.pages[url]()
+
+
+class FakeCommandExecutor:
+    """
+    Answers WebDriver commands from the fake DOM.
+
+    Stands in for Selenium's RemoteConnection; WebDriver.execute() calls
+    execute(command, params) for every command.
+    """
+
+    def __init__(self, driver: 'FakeWebDriver') -> None:
+        self.driver = driver
+        return
+
+    def execute(self, command: str, params: dict) -> dict:
+        self.driver.command_count += 1
+        latency = self._latency(command)
+        self.driver.simulated_time += latency
+        if self.driver.sleep:
+            time.sleep(latency)
+
+        handler = getattr(self, f'_{command}', None)
+        if handler is None:
+            # Window sizing, timeouts, etc.: nothing to do in the fake.
+            return {'value': None}
+        return {'value': self._wrap(handler(params))}
+
+    def _latency(self, command: str) -> float:
+        if command == Command.GET:
+            # get returns as the page load strategy says: at the load event (which
+            #   the 'get' latency stands for), when the DOM is ready, or right away.
+            load_latency = self.driver.command_latency.get(Command.GET, self.driver.latency)
+            return {'normal': load_latency,
+                    'eager': min(max(self.driver.dom_ready_latency, self.driver.latency), load_latency),
+                    'none': self.driver.latency}[self.driver.caps['pageLoadStrategy']]
+        return self.driver.command_latency.get(command, self.driver.latency)
+
+    # Conversion between FakeNodes and WebElement references
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, FakeNode):
+            return {ELEMENT_KEY: self.driver.element_id(value)}
+        if isinstance(value, dict):
+            return {key: self._wrap(val) for key, val in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(i) for i in value]
+        return value
+
+    def _unwrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return self.driver.node(value[ELEMENT_KEY])
+            return {key: self._unwrap(val) for key, val in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(i) for i in value]
+        return value
+
+    # Navigation
+
+    def _get(self, params: dict) -> None:
+        # The navigation started when the command was sent.
+        self.driver.navigate(url=params['url'], started=self.driver.simulated_time - self._latency(Command.GET))
+        return None
+
+    def _getCurrentUrl(self, params: dict) -> str:
+        return self.driver.url
+
+    def _getTitle(self, params: dict) -> str:
+        title = find_all(self.driver.document, 'tag name', 'title')
+        return title[0].text_content if title else ''
+
+    def _deleteAllCookies(self, params: dict) -> None:
+        self.driver.cookies.clear()
+        return None
+
+    def _setTimeouts(self, params: dict) -> None:
+        if params.get('implicit') is not None:
+            self.driver.implicit_wait = params['implicit'] / 1000
+        return None
+
+    # Finding elements
+
+    def _findElement(self, params: dict) -> FakeNode:
+        return self._first(self.driver.document, params)
+
+    def _findElements(self, params: dict) -> list[FakeNode]:
+        return self._all(self.driver.document, params)
+
+    def _findChildElement(self, params: dict) -> FakeNode:
+        return self._first(self.driver.node(params['id']), params)
+
+    def _findChildElements(self, params: dict) -> list[FakeNode]:
+        return self._all(self.driver.node(params['id']), params)
+
+    def _all(self, root: FakeNode, params: dict) -> list[FakeNode]:
+        found = find_all(root, params['using'], params['value'])
+        if not found:
+            # The fake DOM only changes in response to commands, so a browser
+            #   would wait out the whole implicit wait.
+            self.driver.simulated_time += self.driver.implicit_wait
+        return found
+
+    def _first(self, root: FakeNode, params: dict) -> FakeNode:
+        found = self._all(root, params)
+        if not found:
+            raise NoSuchElementException(f"Unable to locate element: {params['value']}")
+        return found[0]
+
+    # Element state
+
+    def _getElementText(self, params: dict) -> str:
+        return self.driver.node(params['id']).text
+
+    def _getElementTagName(self, params: dict) -> str:
+        return self.driver.node(params['id']).tag
+
+    def _getElementProperty(self, params: dict) -> Any:
+        node = self.driver.node(params['id'])
+        return getattr(node, params['name'], node.attrs.get(params['name']))
+
+    def _getElementAttribute(self, params: dict) -> Optional[str]:
+        return self.driver.node(params['id']).attrs.get(params['name'])
+
+    def _isElementSelected(self, params: dict) -> bool:
+        node = self.driver.node(params['id'])
+        return node.checked or node.selected
+
+    def _isElementEnabled(self, params: dict) -> bool:
+        return not self.driver.node(params['id']).disabled
+
+    # Interaction
+
+    def _clickElement(self, params: dict) -> None:
+        node = self.driver.node(params['id'])
+        if not node.is_displayed():
+            raise ElementNotInteractableException(f"{node} is not displayed.")
+        self.driver.click(node)
+        return None
+
+    def _clearElement(self, params: dict) -> None:
+        self.driver.node(params['id']).value = ''
+        return None
+
+    def _sendKeysToElement(self, params: dict) -> None:
+        node = self.driver.node(params['id'])
+        node.value += params['text']
+        node.input_value = node.value
+        return None
+
+    # Scripts
+
+    def _w3cExecuteScript(self, params: dict) -> Any:
+        return self.driver.run_script(params['script'], self._unwrap(params['args']))
+
+    def _w3cExecuteScriptAsync(self, params: dict) -> Any:
+        return self.driver.run_script(params['script'], self._unwrap(params['args']))
+
+    # Chrome DevTools Protocol
+
+    def _executeCdpCommand(self, params: dict) -> Any:
+        if params['cmd'] == 'Network.enable':
+            self.driver.network_enabled = True
+        elif params['cmd'] == 'Network.setBlockedURLs':
+            if not self.driver.network_enabled:
+                raise WebDriverException('Network.setBlockedURLs needs Network.enable first.')
+            self.driver.blocked_urls = list(params['params']['urls'])
+        else:
+            raise WebDriverException(f"CDP command '{params['cmd']}' isn't supported by the fake driver.")
+        return dict()
+
+
+class FakeWebDriver(WebDriver):
+    """
+    A WebDriver backed by FakeSite pages instead of a browser.
+
+    latency: simulated seconds per command
+    command_latency: per-command overrides of latency, e.g. {'get': 0.5}
+    dom_ready_latency: simulated seconds from the start of a navigation until the
+        DOM is parsed (readyState 'interactive'). The load event (and the last
+        resource) comes after the 'get' latency.
+    page_load_strategy: what driver.get() waits for: the load event ('normal'), the
+        DOM ('eager') or nothing ('none')
+    sleep: actually sleep for the latency, instead of only simulating it
+    """
+
+    def __init__(self, site: FakeSite, latency: float = 0.0, command_latency: Optional[dict[str, float]] = None,
+                 dom_ready_latency: float = 0.0, page_load_strategy: str = 'normal', sleep: bool = False) -> None:
+        # WebDriver.__init__() would start a browser session, so set up only what
+        #   WebDriver's methods need.
+        self.command_executor = FakeCommandExecutor(driver=self)
+        self.session_id = 'fake-session'
+        self.caps = {'browserName': 'fake', 'pageLoadStrategy': page_load_strategy}
+        self.pinned_scripts = dict()
+        self.error_handler = ErrorHandler()
+        self.file_detector = LocalFileDetector()
+        self.locator_converter = LocatorConverter()
+        self._is_remote = False
+        self._switch_to = SwitchTo(self)
+        self._websocket_connection = None
+
+        self.site = site
+        self.latency = latency
+        self.command_latency = dict(command_latency or dict())
+        self.dom_ready_latency = dom_ready_latency
+        self.sleep = sleep
+        self.command_count = 0
+        self.simulated_time = 0.0
+        self.implicit_wait = 0.0
+        self.url = 'about:blank'
+        self.document = FakeNode('html')
+        self.navigation_started = 0.0
+        # Set by MARK_NAVIGATION on the current document.
+        self.navigation_marker = None
+        self.cookies = dict()
+        self.local_storage = dict()
+        self.session_storage = dict()
+        self.network_enabled = False
+        self.blocked_urls = []
+        self.loaded_resources = []
+        # Fetch/XHR requests started by clicks, as (simulated end time, whether the
+        #   page's request tracker counted it).
+        self.requests_in_flight = []
+        self.request_tracker_installed = False
+        self._ids = dict()
+        self._nodes = dict()
+        self._scripts = {
+            page_objects.scripts.FIND_MANY: self._script_find_many,
+            page_objects.scripts.PROBE: self._script_probe,
+            page_objects.scripts.WAIT_FOR_CONDITION: self._script_wait_for_condition,
+            page_objects.scripts.SETTLE: self._script_settle,
+            page_objects.scripts.INSTALL_REQUEST_TRACKER: self._script_install_request_tracker,
+            page_objects.scripts.DROPDOWN_SNAPSHOT: self._script_dropdown_snapshot,
+            page_objects.scripts.CHECKBOX_GROUP_SNAPSHOT: self._script_checkbox_group_snapshot,
+            page_objects.scripts.NAV_TREE_SNAPSHOT: self._script_nav_tree_snapshot,
+            page_objects.scripts.CLEAR_STORAGE: self._script_clear_storage,
+            page_objects.scripts.FILL_FIELDS: self._script_fill_fields,
+            page_objects.scripts.READ_FIELDS: self._script_read_fields,
+            page_objects.scripts.MARK_NAVIGATION: self._script_mark_navigation,
+            page_objects.scripts.READINESS: self._script_readiness,
+            page_objects.scripts.RESOURCE_USAGE: self._script_resource_usage,
+        }
+        return
+
+    def quit(self) -> None:
+        return
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> dict:
+        # Same as ChromiumDriver.execute_cdp_cmd(): the fake stands in for Chrome.
+        return self.execute('executeCdpCommand', {'cmd': cmd, 'params': cmd_args})['value']
+
+    # DOM
+
+    def navigate(self, url: str, started: Optional[float] = None) -> None:
+        """
+        Replaces the document, unless only the URL's fragment changes. started is
+        the simulated time the navigation started; by default, now.
+        """
+        if '#' in url and urllib.parse.urldefrag(url)[0] == urllib.parse.urldefrag(self.url)[0]:
+            # Same document, scrolled to the fragment.
+            self.url = url
+            return
+        self.url = url
+        self.navigation_marker = None
+        self.document = self.site.build(url)
+        self.navigation_started = self.simulated_time if started is None else started
+        self.loaded_resources = [i for i in self.site.resources.get(url, []) if not self.is_blocked(i[0])]
+        self.requests_in_flight = []
+        self.request_tracker_installed = False
+        return
+
+    def start_request(self, duration: float) -> None:
+        """
+        Starts a fetch/XHR request that takes duration simulated seconds, e.g. from
+        a node's on_click. Like in a browser, the request tracker only counts it if
+        it was installed first.
+        """
+        self.requests_in_flight.append((self.simulated_time + duration, self.request_tracker_installed))
+        return
+
+    def is_blocked(self, url: str) -> bool:
+        # Blocked URL patterns only have the '*' wildcard.
+        for i_pattern in self.blocked_urls:
+            if re.fullmatch('.*'.join(re.escape(i) for i in i_pattern.split('*')), url):
+                return True
+        return False
+
+    def element_id(self, node: FakeNode) -> str:
+        if id(node) not in self._ids:
+            element_id = f'fake-{len(self._ids) + 1}'
+            self._ids[id(node)] = element_id
+            self._nodes[element_id] = node
+        return self._ids[id(node)]
+
+    def node(self, element_id: str) -> FakeNode:
+        node = self._nodes.get(element_id)
+        if node is None or node.root is not self.document:
+            raise StaleElementReferenceException(f"Element {element_id} is no longer attached to the DOM.")
+        return node
+
+    def click(self, node: FakeNode) -> None:
+        if node.on_click is not None:
+            node.on_click(self, node)
+        elif node.disabled:
+            pass
+        elif node.tag == 'input' and node.attrs.get('type') in ['checkbox', 'radio']:
+            node.checked = not node.checked
+        elif node.tag == 'option':
+            select = next(i for i in node.ancestors() if i.tag == 'select')
+            for i_option in find_all(select, 'tag name', 'option'):
+                i_option.selected = i_option is node
+        return
+
+    # Scripts
+
+    def run_script(self, script: str, args: list) -> Any:
+        if script in self._scripts:
+            return self._scripts[script](*args)
+        if script.startswith('/* getAttribute */'):
+            return args[0].get_attribute(args[1])
+        if script.startswith('/* isDisplayed */'):
+            return args[0].is_displayed()
+        if script == 'arguments[0].setAttribute(arguments[1], arguments[2])':
+            args[0].attrs[args[1]] = args[2]
+            return None
+        if script.startswith('arguments[0].scrollIntoView(') or script.startswith('scrollBy('):
+            return None
+        first_line = script.strip().splitlines()[0] if script.strip() else ''
+        raise JavascriptException(f"The fake driver has no handler for script: {first_line[:80]}")
+
+    def _scope_root(self, scope: str, scope_element: Optional[FakeNode]) -> FakeNode:
+        return scope_element if scope == 'element' else self.document
+
+    def _script_find_many(self, locators: list, scope_element: Optional[FakeNode]) -> list[Optional[FakeNode]]:
+        results = []
+        for scope, by, value in locators:
+            found = find_all(self._scope_root(scope, scope_element), by, value)
+            results.append(found[0] if found else None)
+        return results
+
+    def _script_probe(self, locators: list, scope_element: Optional[FakeNode]) -> list[dict]:
+        results = []
+        for scope, by, value in locators:
+            found = find_all(self._scope_root(scope, scope_element), by, value)
+            results.append({'exists': bool(found), 'displayed': bool(found) and found[0].is_displayed()})
+        return results
+
+    def _script_wait_for_condition(self, condition: list, scope_element: Optional[FakeNode], timeout_ms: int) -> dict:
+        # The fake DOM only changes in response to commands, so whatever holds now
+        #   holds until the timeout. Simulate waiting it out if it doesn't.
+        scope, by, value, check, name, expected = condition
+        found = find_all(self._scope_root(scope, scope_element), by, value)
+        node = found[0] if found else None
+        checks = {
+            'exists': lambda: node is not None,
+            'absent': lambda: node is None,
+            'displayed': lambda: node is not None and node.is_displayed(),
+            'not_displayed': lambda: node is None or not node.is_displayed(),
+            'class_contains': lambda: node is not None and name in node.classes,
+            'class_not_contains': lambda: node is not None and name not in node.classes,
+            'attribute_present': lambda: node is not None and node.has_attribute(name),
+            'attribute_absent': lambda: node is not None and not node.has_attribute(name),
+            'attribute_equals': lambda: node is not None and node.attrs.get(name) == expected,
+            'text_equals': lambda: node is not None and node.text == expected,
+        }
+        satisfied = checks[check]()
+        if not satisfied:
+            self.simulated_time += timeout_ms / 1000
+        return {'satisfied': satisfied, 'checks': 1}
+
+    def _script_mark_navigation(self, marker: str) -> str:
+        self.navigation_marker = marker
+        return self.url
+
+    def _script_readiness(self, marker: str, ready_state: Optional[str], quiet_ms: int, timeout_ms: int) -> dict:
+        # The fake replaces the document as soon as get is sent, so the marker is
+        #   only still there if the document wasn't replaced at all. READINESS
+        #   accounts for the time the browser would take to load the new one.
+        if marker and marker == self.navigation_marker:
+            return {'navigated': False, 'ready': False, 'readyState': 'complete'}
+        load_latency = self.command_latency.get(Command.GET, self.latency)
+        ready_at = {None: 0.0, 'interactive': self.dom_ready_latency, 'complete': load_latency}[ready_state]
+        if quiet_ms:
+            # Resources finish by the load event.
+            ready_at = max(ready_at, load_latency + quiet_ms / 1000)
+        wait = max(ready_at - (self.simulated_time - self.navigation_started), 0.0)
+        ready = wait <= timeout_ms / 1000
+        self.simulated_time += min(wait, timeout_ms / 1000)
+
+        elapsed = self.simulated_time - self.navigation_started
+        if elapsed >= load_latency:
+            state = 'complete'
+        elif elapsed >= self.dom_ready_latency:
+            state = 'interactive'
+        else:
+            state = 'loading'
+        return {'navigated': True, 'ready': ready, 'readyState': state}
+
+    def _script_resource_usage(self) -> dict:
+        return {'requests': len(self.loaded_resources), 'bytes': sum(i[1] for i in self.loaded_resources)}
+
+    def _script_install_request_tracker(self) -> None:
+        self.request_tracker_installed = True
+        return None
+
+    def _script_settle(self, policy: str, quiet_ms: int, timeout_ms: int, element: Optional[FakeNode]) -> dict:
+        if policy == 'idle':
+            self.request_tracker_installed = True
+            pending = [end for end, tracked in self.requests_in_flight if tracked and end > self.simulated_time]
+            wait = max(pending, default=self.simulated_time) - self.simulated_time
+            self.simulated_time += min(wait, timeout_ms / 1000)
+            return {'settled': wait <= timeout_ms / 1000}
+        # Nothing animates in the fake DOM. Account for the quiet period, though.
+        if policy == 'dom_quiet':
+            self.simulated_time += quiet_ms / 1000
+        return {'settled': True}
+
+    def _script_clear_storage(self) -> None:
+        self.local_storage.clear()
+        self.session_storage.clear()
+        return None
+
+    def _script_fill_fields(self, fields: list, scope_element: Optional[FakeNode]) -> dict:
+        nodes = []
+        missing = []
+        unwritable = []
+        for index, (node, scope, by, value, _) in enumerate(fields):
+            if node is None:
+                found = find_all(self._scope_root(scope, scope_element), by, value)
+                node = found[0] if found else None
+            if node is None:
+                missing.append(index)
+            elif node.tag not in ['input', 'textarea'] or node.disabled or node.has_attribute('readonly'):
+                unwritable.append(index)
+            nodes.append(node)
+        if not missing and not unwritable:
+            for node, field in zip(nodes, fields):
+                node.value = field[4]
+                node.input_value = node.value
+        return {'missing': missing, 'unwritable': unwritable}
+
+    def _script_read_fields(self, fields: list, scope_element: Optional[FakeNode]) -> list:
+        results = []
+        for scope, by, value, read, name in fields:
+            found = find_all(self._scope_root(scope, scope_element), by, value)
+            node = found[0] if found else None
+            reads = {
+                'exists': lambda: node is not None,
+                'displayed': lambda: node is not None and node.is_displayed(),
+                'text': lambda: node.text if node is not None else None,
+                'value': lambda: node.value if node is not None else None,
+                'attribute': lambda: node.attrs.get(name) if node is not None else None,
+            }
+            if read not in reads:
+                raise JavascriptException(f"Unsupported field read: {read}")
+            results.append(reads[read]())
+        return results
+
+    @staticmethod
+    def _script_checkbox_group_snapshot(container: FakeNode) -> list[dict]:
+        checkboxes = [i for i in find_all(container, 'tag name', 'input') if i.attrs.get('type') == 'checkbox']
+        return [{'index': index, 'checked': i.checked, 'disabled': i.disabled, 'displayed': i.is_displayed(),
+                 'element': i}
+                for index, i in enumerate(checkboxes)]
+
+    @staticmethod
+    def _script_dropdown_snapshot(select: FakeNode) -> list[dict]:
+        return [{'index': index, 'text': i.text_content.strip(), 'value': i.value or i.text_content.strip(),
+                 'selected': i.selected, 'disabled': i.disabled, 'element': i}
+                for index, i in enumerate(find_all(select, 'tag name', 'option'))]
+
+    @staticmethod
+    def _script_nav_tree_snapshot(root: FakeNode, group_locator: list, header_locator: list,
+                                  list_locator: list, link_locator: list, expanded_class: str) -> list[dict]:
+        groups = []
+        for i_group in find_all(root, *group_locator):
+            header = find_all(i_group, *header_locator)
+            link_list = find_all(i_group, *list_locator)
+            groups.append({
+                'name': header[0].text_content.strip() if header else '',
+                'expanded': bool(link_list) and expanded_class in link_list[0].classes,
+                'element': i_group,
+                'links': [{'name': i.text_content.strip(), 'element': i} for i in find_all(i_group, *link_locator)],
+            })
+        return groups
@@ -0,0 +1,197 @@
+"""
+Fake versions of the pages used by the examples, built from FakeNodes.
+
+Each builder returns a fresh <html> node, so every navigation starts from the
+page's initial state and elements from the previous page go stale. Only the
+structure the page objects rely on is reproduced; see the real pages for the rest.
+"""
+
+from benchmarks.fake_webdriver import FakeNode, FakeSite, FakeWebDriver, find_all
+
+HEROKU_CHECKBOXES_URL = 'https://the-internet.herokuapp.com/checkboxes'
+HEROKU_DROPDOWN_URL = 'https://the-internet.herokuapp.com/dropdown'
+TOOLS_QA_TEXT_BOX_URL = 'https://demoqa.com/text-box'
+COMMON_ELEMENTS_URL = 'https://fake.test/common-elements'
+
+# Number of options in the dropdown on the common elements page. Large enough
+#   that per-option round trips would stand out.
+COMMON_DROPDOWN_OPTIONS = 200
+# Seconds the request started by the 'load' button on the common elements page
+#   takes.
+COMMON_REQUEST_DURATION = 0.3
+
+TOOLS_QA_NAV = {
+    'Elements': ['Text Box', 'Check Box', 'Radio Button', 'Web Tables', 'Buttons', 'Links',
+                 'Broken Links - Images', 'Upload and Download', 'Dynamic Properties'],
+    'Forms': ['Practice Form'],
+    'Alerts, Frame & Windows': ['Browser Windows', 'Alerts', 'Frames', 'Nested Frames', 'Modal Dialogs'],
+    'Widgets': ['Accordian', 'Auto Complete', 'Date Picker', 'Slider', 'Progress Bar', 'Tabs', 'Tool Tips',
+                'Menu', 'Select Menu'],
+    'Interactions': ['Sortable', 'Selectable', 'Resizable', 'Droppable', 'Dragabble'],
+    'Book Store Application': ['Login', 'Book Store', 'Profile', 'Book Store API'],
+}
+
+
+def _document(title: str, *body: FakeNode) -> FakeNode:
+    return FakeNode('html', children=[
+        FakeNode('head', children=[FakeNode('title', text=title)], hidden=True),
+        FakeNode('body', children=list(body)),
+    ])
+
+
+# The Internet (Heroku)
+
+def heroku_checkboxes() -> FakeNode:
+    return _document(
+        'The Internet',
+        FakeNode('h3', text='Checkboxes'),
+        FakeNode('form', attrs={'id': 'checkboxes'}, children=[
+            FakeNode('input', attrs={'type': 'checkbox'}),
+            FakeNode('span', text=' checkbox 1'),
+            FakeNode('br'),
+            FakeNode('input', attrs={'type': 'checkbox', 'checked': 'checked'}),
+            FakeNode('span', text=' checkbox 2'),
+        ]),
+    )
+
+
+def _select(select_id: str, options: list[str], placeholder: str) -> FakeNode:
+    select = FakeNode('select', attrs={'id': select_id})
+    select.append(FakeNode('option', attrs={'value': '', 'disabled': 'disabled', 'selected': 'selected'},
+                           text=placeholder))
+    for index, i_option in enumerate(options, start=1):
+        select.append(FakeNode('option', attrs={'value': str(index)}, text=i_option))
+    return select
+
+
+def heroku_dropdown() -> FakeNode:
+    return _document(
+        'The Internet',
+        FakeNode('h3', text='Dropdown List'),
+        _select(select_id='dropdown', options=['Option 1', 'Option 2'], placeholder='Please select an option'),
+    )
+
+
+# ToolsQA
+
+def _click_nav_group_header(driver: FakeWebDriver, header: FakeNode) -> None:
+    # Accordion: opening a group closes the others.
+    group = header.parent
+    side_nav = group.parent
+    for i_group in find_all(side_nav, 'css selector', 'div.element-group'):
+        link_list = find_all(i_group, 'css selector', 'div.element-list')[0]
+        if i_group is group and 'show' not in link_list.classes:
+            link_list.add_class('show')
+            link_list.hidden = False
+        else:
+            link_list.remove_class('show')
+            link_list.hidden = True
+    return
+
+
+def _click_nav_link(driver: FakeWebDriver, link: FakeNode) -> None:
+    # demoqa.com is a single page app; following a link only re-renders the content.
+    title = find_all(driver.document, 'css selector', 'h1.text-center')[0]
+    title.own_text = link.text_content.strip()
+    return
+
+
+def _side_nav(expanded_group: str) -> FakeNode:
+    side_nav = FakeNode('div', attrs={'class': 'left-pannel'})
+    for i_group_name, i_link_names in TOOLS_QA_NAV.items():
+        expanded = i_group_name == expanded_group
+        link_list = FakeNode('div', attrs={'class': 'element-list collapse show' if expanded else 'element-list collapse'},
+                             hidden=not expanded)
+        menu = link_list.append(FakeNode('ul', attrs={'class': 'menu-list'}))
+        for i_link_name in i_link_names:
+            menu.append(FakeNode('li', attrs={'class': 'btn btn-light'}, on_click=_click_nav_link,
+                                 children=[FakeNode('span', attrs={'class': 'text'}, text=i_link_name)]))
+        side_nav.append(FakeNode('div', attrs={'class': 'element-group'}, children=[
+            FakeNode('span', attrs={'class': 'group-header'}, on_click=_click_nav_group_header, children=[
+                FakeNode('div', attrs={'class': 'header-text'}, text=i_group_name),
+            ]),
+            link_list,
+        ]))
+    return side_nav
+
+
+def _submit_text_box_form(driver: FakeWebDriver, button: FakeNode) -> None:
+    # Only fields with a value are echoed back, each in its own <p>. Like the
+    #   real (React) form, it submits the values its input events reported.
+    document = driver.document
+    output = find_all(document, 'id', 'output')[0]
+    for i_child in list(output.children):
+        i_child.remove()
+    fields = [('userName', 'name', 'Name:'),
+              ('userEmail', 'email', 'Email:'),
+              ('currentAddress', 'currentAddress', 'Current Address :'),
+              ('permanentAddress', 'permanentAddress', 'Permananet Address :')]
+    for i_field_id, i_output_id, i_label in fields:
+        field = find_all(document, 'css selector', f'#{i_field_id}')[0]
+        if field.input_value:
+            output.append(FakeNode('p', attrs={'id': i_output_id, 'class': 'mb-1'},
+                                   text=i_label + field.input_value.replace('\n', ' ')))
+    return
+
+
+def tools_qa_text_box() -> FakeNode:
+    return _document(
+        'DEMOQA',
+        FakeNode('div', attrs={'class': 'body-height'}, children=[
+            _side_nav(expanded_group='Elements'),
+            FakeNode('div', attrs={'class': 'main-header'}, children=[
+                FakeNode('h1', attrs={'class': 'text-center'}, text='Text Box'),
+            ]),
+            FakeNode('form', attrs={'id': 'userForm'}, children=[
+                FakeNode('input', attrs={'id': 'userName', 'type': 'text'}),
+                FakeNode('input', attrs={'id': 'userEmail', 'type': 'email'}),
+                FakeNode('textarea', attrs={'id': 'currentAddress'}),
+                FakeNode('textarea', attrs={'id': 'permanentAddress'}),
+                FakeNode('button', attrs={'id': 'submit', 'type': 'button'}, text='Submit',
+                         on_click=_submit_text_box_form),
+            ]),
+            FakeNode('div', attrs={'id': 'output'}),
+        ]),
+    )
+
+
+# page_objects.common
+
+def common_elements() -> FakeNode:
+    options = [f'Option {i}' for i in range(1, COMMON_DROPDOWN_OPTIONS + 1)]
+    return _document(
+        'Common Elements',
+        FakeNode('input', attrs={'id': 'checkbox', 'type': 'checkbox'}),
+        _select(select_id='dropdown', options=options, placeholder='Please select an option'),
+        FakeNode('input', attrs={'id': 'text', 'type': 'text'}),
+        FakeNode('button', attrs={'id': 'load'}, text='Load',
+                 on_click=lambda driver, node: driver.start_request(duration=COMMON_REQUEST_DURATION)),
+    )
+
+
+# What a ToolsQA page fetches, roughly: the app itself, then ads and trackers.
+TOOLS_QA_RESOURCES = [
+    (TOOLS_QA_TEXT_BOX_URL, 12_000),
+    ('https://demoqa.com/main.js', 420_000),
+    ('https://demoqa.com/main.css', 38_000),
+    ('https://demoqa.com/images/Toolsqa.jpg', 16_000),
+    ('https://fonts.gstatic.com/s/montserrat/v25/montserrat.woff2', 35_000),
+    ('https://www.googletagmanager.com/gtag/js?id=UA-00000000-1', 95_000),
+    ('https://www.google-analytics.com/analytics.js', 20_000),
+    ('https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js', 150_000),
+    ('https://tpc.googlesyndication.com/simgad/1234567890', 60_000),
+    ('https://securepubads.g.doubleclick.net/tag/js/gpt.js', 110_000),
+    ('https://securepubads.g.doubleclick.net/gampad/ads?iu=/1234/demoqa', 25_000),
+    ('https://c.amazon-adsystem.com/aax2/apstag.js', 40_000),
+    ('https://demoqa.com/ads/preroll.mp4', 850_000),
+]
+
+
+SITE = FakeSite(pages={
+    HEROKU_CHECKBOXES_URL: heroku_checkboxes,
+    HEROKU_DROPDOWN_URL: heroku_dropdown,
+    TOOLS_QA_TEXT_BOX_URL: tools_qa_text_box,
+    COMMON_ELEMENTS_URL: common_elements,
+}, resources={
+    TOOLS_QA_TEXT_BOX_URL: TOOLS_QA_RESOURCES,
+})
@@ -0,0 +1,154 @@
+import asyncio
+
+from selenium.webdriver.common.by import By
+
+import page_objects.aio.base
+import page_objects.base
+import page_objects.blocking
+from page_objects.aio.http import ConnectionPool
+from page_objects.aio.webdriver import AsyncWebDriver
+from page_objects.base import Locator
+
+from benchmarks import conftest, sites
+from benchmarks.fake_server import FakeWebDriverServer
+from benchmarks.fake_webdriver import FakeWebDriver
+
+SESSIONS = 10
+
+
+class CheckboxesPage(page_objects.aio.base.AsyncBasePage):
+    """
+    Async version of examples.heroku_the_internet.page_objects.checkboxes.Page.
+    """
+
+    _locators = {
+        'checkboxes': Locator(scope='driver', by=By.CSS_SELECTOR, value='#checkboxes > input[type="checkbox"]'),
+    }
+
+    def __init__(self, driver: AsyncWebDriver) -> None:
+        super().__init__(driver=driver, url=sites.HEROKU_CHECKBOXES_URL)
+        self.name = 'Checkboxes Page'
+        return
+
+    async def checkbox_is_checked(self, index: int) -> bool:
+        checkboxes = await self.find_elements(locator=self._locators['checkboxes'])
+        return bool(await checkboxes[index].get_attribute('checked'))
+
+    async def click_checkbox(self, index: int) -> None:
+        checkboxes = await self.find_elements(locator=self._locators['checkboxes'])
+        checkbox = page_objects.aio.base.AsyncBaseElement(element=checkboxes[index])
+        checkbox.name = f'Checkbox {index + 1}'
+        await checkbox.click()
+        return
+
+    async def is_loaded(self) -> bool:
+        checkboxes = await self.find_elements(locator=self._locators['checkboxes'])
+        return len(checkboxes) == 2 and await checkboxes[0].is_displayed()
+
+
+class EagerCheckboxesPage(CheckboxesPage):
+    load_mode = 'eager'
+    request_blocking = page_objects.blocking.RequestBlocking(domains=('doubleclick.net',))
+
+
+class Checkbox(page_objects.aio.base.AsyncBaseOpenCloseElement):
+    """
+    A checkbox as an open/close element: checked is open.
+    """
+
+    settle_policy = 'none'
+
+    async def is_open(self) -> bool:
+        return bool(await self.element.get_attribute('checked'))
+
+    async def is_closed(self) -> bool:
+        return not await self.is_open()
+
+    async def open(self) -> None:
+        if await self.is_closed():
+            await self.click()
+        await self.wait_until_open()
+        return
+
+    async def close(self) -> None:
+        if await self.is_open():
+            await self.click()
+        await self.wait_until_closed()
+        return
+
+
+def run_session(scenario) -> FakeWebDriver:
+    """
+    Runs the coroutine function scenario(driver) in a session on a fake server, and
+    returns the session's fake driver.
+    """
+    async def run() -> None:
+        driver = await AsyncWebDriver.start(server.url)
+        try:
+            await scenario(driver)
+        finally:
+            await driver.quit()
+        return
+
+    with FakeWebDriverServer(factory=conftest.new_fake_driver) as server:
+        asyncio.run(run())
+    return next(iter(server.sessions.values()))
+
+
+async def toggle_checkbox(http: ConnectionPool) -> bool:
+    driver = await AsyncWebDriver.start(http=http)
+    page = CheckboxesPage(driver=driver)
+    await page.load_page()
+    await page.click_checkbox(index=0)
+    checked = await page.checkbox_is_checked(index=0)
+    await driver.quit()
+    return checked
+
+
+def test_concurrent_sessions_on_one_event_loop(benchmark) -> None:
+    def new_tracked_driver():
+        return benchmark.track(conftest.new_fake_driver())
+
+    async def scenario() -> list[bool]:
+        http = ConnectionPool(url=server.url)
+        try:
+            return await asyncio.gather(*[toggle_checkbox(http=http) for _ in range(SESSIONS)])
+        finally:
+            await http.close()
+
+    with FakeWebDriverServer(factory=new_tracked_driver) as server:
+        with benchmark.measure():
+            checked = asyncio.run(scenario())
+    assert checked == [True] * SESSIONS
+    assert len(server.sessions) == SESSIONS
+    return
+
+
+def test_open_close_element() -> None:
+    states = []
+
+    async def scenario(driver: AsyncWebDriver) -> None:
+        page = CheckboxesPage(driver=driver)
+        await page.load_page()
+        checkbox = Checkbox(element=(await page.find_elements(locator=page._locators['checkboxes']))[0])
+        await checkbox.expand()
+        states.append(await checkbox.is_expanded())
+        await checkbox.collapse()
+        states.append(await checkbox.is_collapsed())
+        states.append((await checkbox.wait_until_open(timeout=0.1, must_open=False)).satisfied)
+
+    run_session(scenario)
+    assert states == [True, True, False]
+    return
+
+
+def test_load_page_mode_and_request_blocking() -> None:
+    async def scenario(driver: AsyncWebDriver) -> None:
+        await EagerCheckboxesPage(driver=driver).load_page()
+
+    fake_driver = run_session(scenario)
+    assert fake_driver.network_enabled
+    assert '*://doubleclick.net/*' in fake_driver.blocked_urls
+    timings = page_objects.base.load_timings()[f'{__name__}.EagerCheckboxesPage']
+    assert list(timings) == ['eager']
+    return
@@ -0,0 +1,185 @@
+import logging
+
+import pytest
+from selenium.common.exceptions import InvalidElementStateException, NoSuchElementException
+from selenium.webdriver.common.by import By
+
+import page_objects.base
+import page_objects.common
+
+from benchmarks import sites
+
+
+class Form(page_objects.base.BaseElement):
+    _locators = {
+        'text': page_objects.base.Locator(scope='element', by=By.ID, value='text'),
+        'dropdown': page_objects.base.Locator(scope='driver', by=By.ID, value='dropdown'),
+        'missing': page_objects.base.Locator(scope='element', by=By.ID, value='missing'),
+    }
+
+
+def load_common_elements(driver) -> None:
+    driver.get(sites.COMMON_ELEMENTS_URL)
+    return
+
+
+def test_checkbox_toggle(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    checkbox = page_objects.common.Checkbox(element=fake_driver.find_element(By.ID, 'checkbox'))
+
+    with benchmark.measure():
+        checkbox.checked = True
+        assert checkbox.checked
+        checkbox.checked = False
+        assert not checkbox.checked
+    return
+
+
+def test_dropdown_read_options(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    dropdown = page_objects.common.Dropdown(element=fake_driver.find_element(By.ID, 'dropdown'))
+
+    with benchmark.measure():
+        options = dropdown.options
+        selected_option = dropdown.selected_option
+    assert len(options) == sites.COMMON_DROPDOWN_OPTIONS + 1
+    assert selected_option == 'Please select an option'
+    return
+
+
+def test_dropdown_select_options(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    dropdown = page_objects.common.Dropdown(element=fake_driver.find_element(By.ID, 'dropdown'))
+
+    with benchmark.measure():
+        for i_option in ['Option 1', f'Option {sites.COMMON_DROPDOWN_OPTIONS}', 'Option 100']:
+            dropdown.selected_option = i_option
+            assert dropdown.selected_option == i_option
+    return
+
+
+def test_option_wrappers(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    dropdown = page_objects.common.Dropdown(element=fake_driver.find_element(By.ID, 'dropdown'))
+
+    with benchmark.measure():
+        options = dropdown._get_options()
+        options[-1].click()
+    assert options[-1].is_selected()
+    return
+
+
+def test_find_many_and_prefetch(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    form = Form(element=fake_driver.find_element(By.TAG_NAME, 'body'))
+    locators = form._locators
+
+    with benchmark.measure():
+        elements = form.find_many(locators={'text': locators['text'], 'dropdown': locators['dropdown']})
+        with pytest.raises(NoSuchElementException):
+            form.find_many(locators={'text': locators['text'], 'missing': locators['missing']})
+        form.prefetch()
+        prefetched = [form.find_element(locator=locators['text']), form.find_element(locator=locators['dropdown'])]
+    # One round trip for each find_many() and prefetch(); none for the prefetched
+    #   elements.
+    assert benchmark.result['round_trips'] == 3
+    assert prefetched == [elements['text'], elements['dropdown']]
+    assert prefetched[1].get_attribute('id') == 'dropdown'
+
+    # Missing locators aren't prefetched, and prefetched elements are served once.
+    command_count = fake_driver.command_count
+    with pytest.raises(NoSuchElementException):
+        form.find_element(locator=locators['missing'])
+    assert form.find_element(locator=locators['text']) == elements['text']
+    assert fake_driver.command_count == command_count + 2
+    return
+
+
+def test_option_click_logs_option_text(fake_driver, caplog) -> None:
+    load_common_elements(fake_driver)
+    dropdown = page_objects.common.Dropdown(element=fake_driver.find_element(By.ID, 'dropdown'))
+    option_element = fake_driver.find_elements(By.TAG_NAME, 'option')[-1]
+
+    with caplog.at_level(logging.INFO):
+        # Named from the snapshot: no commands but the option's own checks and click.
+        option = dropdown._get_options()[1]
+        command_count = fake_driver.command_count
+        option.click()
+        assert fake_driver.command_count == command_count + 3
+        # Built from a bare element: the text is read once, for the log.
+        page_objects.common.Option(element=option_element).click()
+    assert "Clicking 'Option: 'Option 1''..." in caplog.text
+    assert f"Clicking 'Option: 'Option {sites.COMMON_DROPDOWN_OPTIONS}''..." in caplog.text
+    assert '<Option>' not in caplog.text
+    return
+
+
+def test_text_field_set_and_read(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    text_field = page_objects.common.TextField(element=fake_driver.find_element(By.ID, 'text'))
+
+    with benchmark.measure():
+        for i_value in ['Alpha', 'Bravo Charlie', 'Delta']:
+            text_field.value = i_value
+            assert text_field.value == i_value
+    return
+
+
+def test_fill_text_fields(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    page = page_objects.base.BaseElement(element=fake_driver.find_element(By.TAG_NAME, 'body'))
+    text_field = page_objects.common.TextField(element=fake_driver.find_element(By.ID, 'text'))
+    missing = page_objects.base.Locator(scope='element', by=By.ID, value='missing')
+
+    with benchmark.measure():
+        page_objects.common.fill_text_fields(parent=page, values={text_field: 'Alpha'})
+        with pytest.raises(NoSuchElementException):
+            page_objects.common.fill_text_fields(parent=page, values={text_field: 'Bravo', missing: 'Charlie'})
+        fake_driver.node(text_field.element.id).disabled = True
+        with pytest.raises(InvalidElementStateException):
+            page_objects.common.fill_text_fields(parent=page, values={text_field: 'Delta'})
+    assert text_field.value == 'Alpha'
+    return
+
+
+def test_fill_text_fields_rejects_other_elements(fake_driver) -> None:
+    load_common_elements(fake_driver)
+    page = page_objects.base.BaseElement(element=fake_driver.find_element(By.TAG_NAME, 'body'))
+    text_field = page_objects.base.Locator(scope='element', by=By.ID, value='text')
+    dropdown = page_objects.base.Locator(scope='element', by=By.ID, value='dropdown')
+
+    with pytest.raises(InvalidElementStateException):
+        page_objects.common.fill_text_fields(parent=page, values={text_field: 'Alpha', dropdown: 'Option 1'})
+    assert fake_driver.find_element(By.ID, 'text').get_attribute('value') in [None, '']
+    return
+
+
+def test_click_settle_policy_is_case_insensitive(fake_driver) -> None:
+    load_common_elements(fake_driver)
+    checkbox = page_objects.base.BaseElement(element=fake_driver.find_element(By.ID, 'checkbox'))
+
+    # The scroll and the click, with no settling after either.
+    command_count = fake_driver.command_count
+    checkbox.click(scroll_into_view=True, settle='NONE')
+    checkbox.settle_policy = 'None'
+    checkbox.click(scroll_into_view=True)
+    assert fake_driver.command_count == command_count + 4
+
+    with pytest.raises(ValueError):
+        checkbox.click(scroll_into_view=True, settle='eventually')
+    assert fake_driver.command_count == command_count + 4
+    return
+
+
+def test_click_settle_idle_waits_for_request_from_click(fake_driver, benchmark) -> None:
+    load_common_elements(fake_driver)
+    button = page_objects.base.BaseElement(element=fake_driver.find_element(By.ID, 'load'))
+
+    with benchmark.measure():
+        button.click(settle='idle')
+    # The tracker is installed before the click, so the request is counted and
+    #   settling waits for it.
+    [(request_end, tracked)] = fake_driver.requests_in_flight
+    assert tracked
+    assert fake_driver.simulated_time >= request_end
+    return
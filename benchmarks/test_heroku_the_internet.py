@@ -0,0 +1,118 @@
+import page_objects.base
+from examples.heroku_the_internet.page_objects import checkboxes
+from examples.heroku_the_internet.page_objects import dropdown
+
+from benchmarks import sites
+
+
+def test_checkboxes_load_page(fake_driver, benchmark) -> None:
+    page = checkboxes.Page(fake_driver)
+
+    with benchmark.measure():
+        page.load_page()
+    return
+
+
+def test_checkboxes_click_multiple_times(fake_driver, benchmark) -> None:
+    page = checkboxes.Page(fake_driver)
+    page.load_page()
+
+    with benchmark.measure():
+        for i in range(10):
+            page.click_checkbox_1()
+            assert page.checkbox_1_is_checked() == (i % 2 == 0)
+        page.click_checkbox_2()
+        assert not page.checkbox_2_is_checked()
+    return
+
+
+def test_dropdown_load_page(fake_driver, benchmark) -> None:
+    page = dropdown.Page(fake_driver)
+
+    with benchmark.measure():
+        page.load_page()
+    return
+
+
+def test_dropdown_select_enabled_and_disabled_options(fake_driver, benchmark) -> None:
+    page = dropdown.Page(fake_driver)
+    page.load_page()
+
+    with benchmark.measure():
+        for i_option, i_expected in [('Option 1', 'Option 1'),
+                                     ('Please select an option', 'Option 1'),
+                                     ('Option 2', 'Option 2')]:
+            page.set_selection(option=i_option)
+            assert page.current_selection() == i_expected
+    return
+
+
+def test_checkboxes_reset(fake_driver, benchmark) -> None:
+    page = checkboxes.Page(fake_driver)
+    page.load_page()
+    page.click_checkbox_1()
+    page.click_checkbox_2()
+
+    with benchmark.measure():
+        was_reset = page.load_or_reset()
+    assert was_reset
+    assert not page.checkbox_1_is_checked()
+    assert page.checkbox_2_is_checked()
+    return
+
+
+def test_checkboxes_set_group_state(fake_driver, benchmark) -> None:
+    page = checkboxes.Page(fake_driver)
+    page.load_page()
+
+    with benchmark.measure():
+        checkbox_group = page.get_checkbox_group()
+        checkbox_group.set_checked([True, False])
+        checkbox_group.set_checked([True, None])
+        checked = checkbox_group.checked
+    assert checked == [True, False]
+    # Snapshot, 2 clicks (no settling) and a verifying snapshot; then a snapshot
+    #   with nothing to click, and the read.
+    assert benchmark.result['round_trips'] == 6
+    return
+
+
+def test_checkboxes_element_cache(fake_driver, monkeypatch) -> None:
+    monkeypatch.setattr(page_objects.base, '_element_cache_totals', dict())
+    page = checkboxes.Page(fake_driver)
+    page.load_page()
+    group = page.get_checkbox_group().element
+    hits, misses = page.element_cache_stats['hits'], page.element_cache_stats['misses']
+
+    # Served from the cache, without a round trip.
+    command_count = fake_driver.command_count
+    assert page.get_checkbox_group().element == group
+    page.get_checkbox_1()
+    page.get_checkbox_2()
+    assert fake_driver.command_count == command_count + 1
+    assert page.element_cache_stats == {'hits': hits + 2, 'misses': misses + 1, 'size': 2}
+
+    # Dropped explicitly, one locator or all of them.
+    page.invalidate_element_cache(locator=page._locators['checkboxes'])
+    assert page.element_cache_stats['size'] == 1
+    page.invalidate_element_cache()
+    assert page.element_cache_stats['size'] == 0
+
+    # Dropped by load_page(), which finds the new document's elements.
+    page.get_checkbox_group()
+    page.load_page()
+    assert page.get_checkbox_group().element != group
+
+    # Dropped when an element goes stale behind the page's back; the method is
+    #   retried once with fresh elements.
+    group = page.get_checkbox_group().element
+    fake_driver.navigate(sites.HEROKU_CHECKBOXES_URL)
+    page.click_checkbox_1()
+    assert page.checkbox_1_is_checked()
+    assert page.get_checkbox_group().element != group
+
+    stats = page.element_cache_stats
+    assert page_objects.base.element_cache_report() == {
+        'examples.heroku_the_internet.page_objects.checkboxes.Page': {'hits': stats['hits'], 'misses': stats['misses']},
+    }
+    return
@@ -0,0 +1,64 @@
+from selenium.webdriver.common.by import By
+
+import examples.tools_qa.page_objects.common
+import examples.tools_qa.page_objects.elements.text_box
+import page_objects.instrumentation
+
+
+def test_commands_attributed_to_outermost_page_object_method(fake_driver) -> None:
+    page = examples.tools_qa.page_objects.common.Page(fake_driver)
+    page.load_page()
+    nav = page.get_side_nav()
+    recorder = page_objects.instrumentation.CommandRecorder()
+    recorder.install(fake_driver)
+
+    commands_before = fake_driver.command_count
+    # SideNav.expand_group() goes through SideNavGroup.click_header_button(),
+    #   BaseElement.click() and settle(), all of which count as expand_group().
+    nav.expand_group(group_name='Interactions')
+    expand_commands = fake_driver.command_count - commands_before
+    nav.snapshot(refresh=True)
+    fake_driver.find_element(By.TAG_NAME, 'body')
+    recorder.uninstall(fake_driver)
+
+    report = recorder.report()
+    assert set(report['callers']) == {'SideNav.expand_group', 'SideNav.snapshot',
+                                      page_objects.instrumentation.NO_CALLER}
+    assert report['callers']['SideNav.expand_group']['count'] == expand_commands
+    assert report['callers']['SideNav.snapshot'] == {'count': 1, 'time': report['callers']['SideNav.snapshot']['time'],
+                                                     'commands': {'w3cExecuteScript': 1}}
+    assert report['callers'][page_objects.instrumentation.NO_CALLER]['commands'] == {'findElement': 1}
+    assert report['total']['count'] == expand_commands + 2
+    assert report['top_offenders'][0]['caller'] == 'SideNav.expand_group'
+    return
+
+
+def test_install_is_idempotent_and_uninstall_stops_recording(fake_driver) -> None:
+    recorder = page_objects.instrumentation.CommandRecorder()
+    recorder.install(fake_driver)
+    recorder.install(fake_driver)
+
+    fake_driver.title
+    assert len(recorder.records) == 1
+
+    recorder.uninstall(fake_driver)
+    fake_driver.title
+    assert len(recorder.records) == 1
+    return
+
+
+def test_commands_attributed_through_stale_retry_wrappers(fake_driver) -> None:
+    # cache_elements pages wrap their public methods and properties for stale
+    #   retries; the commands belong to the wrapped method, not the wrapper.
+    page = examples.tools_qa.page_objects.elements.text_box.Page(fake_driver)
+    page.load_page()
+    recorder = page_objects.instrumentation.CommandRecorder()
+    recorder.install(fake_driver)
+
+    page.full_name_input = 'Name'
+    assert page.full_name_input == 'Name'
+    page.click_submit_button()
+    recorder.uninstall(fake_driver)
+
+    assert set(recorder.report()['callers']) == {'Page.full_name_input', 'Page.click_submit_button'}
+    return
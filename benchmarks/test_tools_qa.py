@@ -0,0 +1,319 @@
+import logging
+import time
+
+import pytest
+
+import examples.tools_qa.page_objects.common
+import examples.tools_qa.page_objects.elements.text_box
+import page_objects.base
+import page_objects.blocking
+
+
+def load_side_nav(driver) -> examples.tools_qa.page_objects.common.SideNav:
+    page = examples.tools_qa.page_objects.common.Page(driver)
+    page.load_page()
+    return page.get_side_nav()
+
+
+def test_side_nav_read_state(fake_driver, benchmark) -> None:
+    nav = load_side_nav(fake_driver)
+
+    with benchmark.measure():
+        expanded_groups = nav.expanded_groups
+        collapsed_groups = nav.collapsed_groups
+        visible_links = nav.visible_links
+    assert expanded_groups == ['Elements']
+    assert len(collapsed_groups) == 5
+    assert 'Text Box' in visible_links
+    return
+
+
+def test_side_nav_click_group_headers(fake_driver, benchmark) -> None:
+    nav = load_side_nav(fake_driver)
+
+    with benchmark.measure():
+        for i_group_name in ['Forms', 'Alerts, Frame & Windows', 'Widgets', 'Interactions', 'Elements']:
+            nav.click_group_header_button(group_name=i_group_name)
+            assert nav.group_is_expanded(group_name=i_group_name)
+            assert len(nav.expanded_groups) == 1
+    return
+
+
+def test_side_nav_expand_and_collapse(fake_driver, benchmark) -> None:
+    nav = load_side_nav(fake_driver)
+
+    with benchmark.measure():
+        nav.collapse_group(group_name='Elements')
+        nav.expand_group(group_name='Interactions')
+        nav.expand_group(group_name='Interactions')
+    assert nav.expanded_groups == ['Interactions']
+    return
+
+
+def test_side_nav_click_link(fake_driver, benchmark) -> None:
+    nav = load_side_nav(fake_driver)
+    page = examples.tools_qa.page_objects.common.Page(fake_driver)
+
+    with benchmark.measure():
+        nav.click_link_button(link_name='Check Box')
+    assert page.find_element(locator=page._locators['title']).text == 'Check Box'
+    return
+
+
+def test_text_box_fill_and_submit(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+
+    with benchmark.measure():
+        page.full_name_input = 'Alpha Bravo'
+        page.email_input = 'charlie@deltaecho.com'
+        page.current_address_textarea = '123 Foxtrot\nGolf, HO 12345'
+        page.permanent_address_textarea = '123 India\nJuliet, KI 12345'
+        page.click_submit_button()
+        submitted_name = page.submitted_name
+        submitted_email = page.submitted_email
+    assert submitted_name == 'Name:Alpha Bravo'
+    assert submitted_email == 'Email:charlie@deltaecho.com'
+    return
+
+
+def test_text_box_fill_form_and_submit(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+
+    with benchmark.measure():
+        page.fill_form(full_name='Alpha Bravo', email='charlie@deltaecho.com',
+                       current_address='123 Foxtrot\nGolf, HO 12345', permanent_address='123 India\nJuliet, KI 12345')
+        page.click_submit_button()
+        submitted_name = page.submitted_name
+        submitted_email = page.submitted_email
+    assert submitted_name == 'Name:Alpha Bravo'
+    assert submitted_email == 'Email:charlie@deltaecho.com'
+    assert page.current_address_textarea == '123 Foxtrot\nGolf, HO 12345'
+    return
+
+
+def test_text_box_prefetch(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+    page.invalidate_element_cache()
+
+    with benchmark.measure():
+        page.prefetch()
+    assert benchmark.result['round_trips'] == 1
+    # Everything but the 4 submitted values, which aren't shown before a submit.
+    assert page.element_cache_stats['size'] == len(page._locators) - 4
+
+    # load_page() prefetches the form, so its helpers send no commands.
+    page.load_page()
+    command_count = fake_driver.command_count
+    fields = [page._get_full_name_input(), page._get_email_input(), page._get_current_address_textarea(),
+              page._get_permanent_address_textarea(), page._get_submit_button()]
+    assert fake_driver.command_count == command_count
+    assert [i.element.get_attribute('id') for i in fields] == ['userName', 'userEmail', 'currentAddress',
+                                                                'permanentAddress', 'submit']
+    return
+
+
+def test_text_box_snapshot_fields(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+    page.fill_form(full_name='Alpha Bravo', email='charlie@deltaecho.com')
+    page.click_submit_button()
+
+    with benchmark.measure():
+        snapshot = page.snapshot_fields()
+    assert snapshot == {
+        'full_name': 'Alpha Bravo',
+        'email': 'charlie@deltaecho.com',
+        'current_address': '',
+        'permanent_address': '',
+        'submitted_name': 'Name:Alpha Bravo',
+        'submitted_email': 'Email:charlie@deltaecho.com',
+        'submitted_current_address': None,
+        'submitted_permanent_address': None,
+    }
+    return
+
+
+@pytest.mark.parametrize('mode', page_objects.base.LOAD_MODES)
+def test_text_box_load_page(fake_driver, benchmark, mode) -> None:
+    # Each mode in a session with the matching page load strategy.
+    fake_driver.caps['pageLoadStrategy'] = mode
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+
+    with benchmark.measure():
+        page.load_page(mode=mode)
+    assert page.snapshot_fields('full_name') == {'full_name': ''}
+    timings = page_objects.base.load_timings()['examples.tools_qa.page_objects.elements.text_box.Page'][mode]
+    assert timings['count'] >= 1
+    return
+
+
+def test_text_box_load_mode_without_effect(fake_driver, caplog, monkeypatch) -> None:
+    # An eager page in a session whose driver.get() waits for the load event.
+    monkeypatch.setattr(page_objects.base, '_load_mode_warnings', set())
+    fake_driver.caps['pageLoadStrategy'] = 'normal'
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+
+    with caplog.at_level(logging.WARNING):
+        page.load_page()
+        page.load_page()
+    assert caplog.text.count("load mode 'eager' has no effect") == 1
+    timings = page_objects.base.load_timings()['examples.tools_qa.page_objects.elements.text_box.Page']
+    assert timings['normal']['count'] >= 2
+    return
+
+
+def test_text_box_load_page_same_document(fake_driver) -> None:
+    # Navigating to a fragment of the current page keeps the document, and the
+    #   navigation marker with it; load_page() mustn't wait for it to go away.
+    fake_driver.caps['pageLoadStrategy'] = 'none'
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page(mode='none')
+    page._url += '#app'
+    page.load_timeout = 1.0
+
+    start_time = time.monotonic()
+    page.load_page(mode='none')
+    assert time.monotonic() - start_time < page.load_timeout
+    assert fake_driver.url == 'https://demoqa.com/text-box#app'
+    return
+
+
+def test_text_box_load_page_network_idle(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.network_idle = 0.5
+
+    with benchmark.measure():
+        page.load_page(mode='eager')
+    return
+
+
+def test_text_box_load_page_request_blocking(fake_driver, benchmark, monkeypatch) -> None:
+    monkeypatch.setattr(page_objects.blocking, '_usage', dict())
+    monkeypatch.setattr(page_objects.blocking, 'measure_usage', True)
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    monkeypatch.setattr(page_objects.blocking, 'enabled', False)
+    page.load_page()
+    monkeypatch.setattr(page_objects.blocking, 'enabled', True)
+
+    with benchmark.measure():
+        page.load_page()
+    assert fake_driver.blocked_urls == page.request_blocking.patterns()
+    report = page_objects.blocking.usage_report()['examples.tools_qa.page_objects.elements.text_box.Page']
+    assert report['unblocked']['requests'] == 13
+    assert report['blocked']['requests'] == 5
+    assert report['saved'] == {'requests': 8, 'bytes': 1_350_000}
+    return
+
+
+def test_text_box_submitted_fields_hidden_on_init(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+
+    with benchmark.measure():
+        assert not page.submitted_name_field_is_visible()
+        assert not page.submitted_email_field_is_visible()
+        assert not page.submitted_current_address_field_is_visible()
+        assert not page.submitted_permanent_address_field_is_visible()
+    return
+
+
+def test_text_box_submitted_fields_hidden_with_implicit_wait(fake_driver, benchmark) -> None:
+    fake_driver.implicitly_wait(5)
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+
+    with benchmark.measure():
+        assert not any(page.submitted_fields_are_visible().values())
+        assert not page.element_exists(locator=page._locators['submitted_name'])
+    return
+
+
+def test_side_nav_reset(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.common.Page(fake_driver)
+    page.load_page()
+    page.get_side_nav().expand_group(group_name='Widgets')
+
+    with benchmark.measure():
+        was_reset = page.load_or_reset()
+    assert was_reset
+    assert page.get_side_nav().expanded_groups == ['Elements']
+    return
+
+
+def test_text_box_reset(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+    page.full_name_input = 'Alpha Bravo'
+    page.email_input = 'charlie@deltaecho.com'
+
+    with benchmark.measure():
+        was_reset = page.load_or_reset()
+    assert was_reset
+    assert page.full_name_input == ''
+    return
+
+
+def test_text_box_submit_after_reset_sends_empty_values(fake_driver) -> None:
+    # The form submits what its input events reported, so clearing the fields
+    #   in the DOM alone would submit the old values again.
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+    page.full_name_input = 'Alpha Bravo'
+    page.fill_form(email='charlie@deltaecho.com', current_address='123 Foxtrot\nGolf, HO 12345')
+
+    assert page.load_or_reset()
+    page.click_submit_button()
+    assert page.submitted_fields_are_visible() == {'submitted_name': False, 'submitted_email': False,
+                                                   'submitted_current_address': False,
+                                                   'submitted_permanent_address': False}
+    return
+
+
+def test_text_box_reset_falls_back_to_reload_after_submit(fake_driver, benchmark) -> None:
+    page = examples.tools_qa.page_objects.elements.text_box.Page(driver=fake_driver)
+    page.load_page()
+    page.full_name_input = 'Alpha Bravo'
+    page.click_submit_button()
+
+    with benchmark.measure():
+        was_reset = page.load_or_reset()
+    assert not was_reset
+    assert not page.submitted_name_field_is_visible()
+    return
+
+
+def test_side_nav_logging_sends_no_commands(fake_driver, benchmark) -> None:
+    nav = load_side_nav(fake_driver)
+    header_element = nav.find_element(locator=examples.tools_qa.page_objects.common.SideNavGroup._locators['header_button'])
+    header_button = examples.tools_qa.page_objects.common.SideNavGroupHeaderButton(element=header_element)
+
+    with benchmark.measure():
+        description = f'{header_button} {header_button!r} {nav}'
+    assert "'<SideNavGroupHeaderButton>'" in description
+    assert benchmark.result['round_trips'] == 0
+    return
+
+
+def test_side_nav_group_logs_its_name(fake_driver, caplog) -> None:
+    nav = load_side_nav(fake_driver)
+    elements_group = nav._get_nav_group(group_name='Elements')
+    # A group built from a bare element is named after its header when it acts.
+    forms_element = nav.find_elements(locator=nav._locators['group'])[1]
+    forms_group = examples.tools_qa.page_objects.common.SideNavGroup(element=forms_element)
+
+    with caplog.at_level(logging.DEBUG):
+        command_count = fake_driver.command_count
+        elements_group.open()
+        # The state check only (find and read the link list); the name came from
+        #   the snapshot.
+        assert fake_driver.command_count == command_count + 2
+        forms_group.close()
+        forms_group.open()
+    assert "Side Nav Group: 'Elements' already open." in caplog.text
+    assert "Side Nav Group: 'Forms' already closed." in caplog.text
+    assert "Clicking Side Nav Group Header Button: 'Forms'..." in caplog.text
+    assert '<SideNavGroup' not in caplog.text
+    return
@@ -1,20 +1,231 @@
-import logging.config
+import json
+import logging
+import os
+import re
+from typing import Optional
 
 import pytest
-from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 
+import misc.driver_factory
+import misc.driver_pool
+import misc.fixture_server
 import misc.logging_config
+import page_objects.base
+import page_objects.blocking
+import page_objects.instrumentation
 
-logging.config.dictConfig(misc.logging_config.config)
+# Where the DEBUG records of failed tests are written, one file per test.
+FAILURE_LOG_DIR = os.path.join('Logs', 'failures')
+
+# The sites the examples test, served by misc.fixture_server with --fixture-mode, and
+#   where their recordings are kept.
+FIXTURE_ORIGINS = ['https://demoqa.com', 'https://the-internet.herokuapp.com']
+FIXTURE_ARCHIVE = os.path.join(os.path.dirname(__file__), 'fixtures', 'sites.har')
+
+fixture_server: Optional[misc.fixture_server.FixtureServer] = None
+
+test_failed_key = pytest.StashKey[bool]()
+
+
+def pytest_addoption(parser) -> None:
+    parser.addoption('--logging-mode', action='store', default='queue', choices=misc.logging_config.LOGGING_MODES,
+                     help="'queue' (default): log from a background thread. 'sync': log in the test thread.")
+    parser.addoption('--debug-buffer-size', action='store', type=int,
+                     default=misc.logging_config.DEBUG_BUFFER_SIZE, metavar='N',
+                     help=f'Keep the last N DEBUG records of each test (default {misc.logging_config.DEBUG_BUFFER_SIZE}); '
+                          f'written to {FAILURE_LOG_DIR} if the test fails.')
+    parser.addoption('--command-report', action='store', default=None, metavar='DIR',
+                     help='Write a JSON report of the WebDriver commands sent by each test to DIR.')
+    parser.addoption('--load-timings', action='store', default=None, metavar='PATH',
+                     help='Write the time taken to load each page class, by load mode, to PATH (JSON).')
+    parser.addoption('--element-cache-report', action='store', default=None, metavar='PATH',
+                     help='Write the element cache hits (round trips saved) and misses of each page class to PATH (JSON).')
+    parser.addoption('--no-request-blocking', action='store_true', default=False,
+                     help="Don't block the requests page objects declare in request_blocking.")
+    parser.addoption('--blocking-report', action='store', default=None, metavar='PATH',
+                     help='Write the requests and bytes each page class loaded, with and without blocking, to PATH (JSON).')
+    parser.addoption('--driver-profile', action='store', default='headless-fast',
+                     choices=list(misc.driver_factory.PROFILES),
+                     help="Chrome launch profile (default 'headless-fast'). Use 'debug-visible' to watch the tests.")
+    parser.addoption('--driver-cache-dir', action='store', default=None, metavar='DIR',
+                     help="Keep the browsers' HTTP caches in DIR, between sessions and runs.")
+    parser.addoption('--driver-report', action='store', default=None, metavar='PATH',
+                     help='Write the startup time and memory of each browser session to PATH (JSON).')
+    parser.addoption('--fixture-mode', action='store', default='live', choices=['live'] + misc.fixture_server.FIXTURE_MODES,
+                     help="'live' (default): test the real sites. 'record': test them through a local server that "
+                          "saves what they return. 'replay': test against the saved copy, offline.")
+    parser.addoption('--fixture-archive', action='store', default=FIXTURE_ARCHIVE, metavar='PATH',
+                     help=f'HAR file --fixture-mode records to and replays from (default {FIXTURE_ARCHIVE}).')
+    parser.addoption('--fixture-latency', action='store', type=float, default=0.0, metavar='SECONDS',
+                     help='Add SECONDS to every response of the fixture server (default 0).')
+    parser.addoption('--driver-pool-size', action='store', type=int, default=1, metavar='N',
+                     help='Number of browser sessions per process (per xdist worker).')
+    parser.addoption('--driver-max-uses', action='store', type=int, default=0, metavar='N',
+                     help='Replace a browser session after N tests. 0 (default) means never.')
+    return
+
+
+def pytest_configure(config) -> None:
+    misc.logging_config.configure(mode=config.getoption('--logging-mode', default='queue'),
+                                  debug_buffer_size=config.getoption('--debug-buffer-size',
+                                                                     default=misc.logging_config.DEBUG_BUFFER_SIZE))
+    if config.getoption('--no-request-blocking', default=False):
+        page_objects.blocking.enabled = False
+    if config.getoption('--blocking-report', default=None):
+        page_objects.blocking.measure_usage = True
+
+    global fixture_server
+    mode = config.getoption('--fixture-mode', default='live')
+    if mode != 'live':
+        if mode == 'record' and os.environ.get('PYTEST_XDIST_WORKER'):
+            raise pytest.UsageError('--fixture-mode record needs a single process; each xdist worker would overwrite '
+                                    'the archive.')
+        fixture_server = misc.fixture_server.FixtureServer(archive_path=config.getoption('--fixture-archive'),
+                                                           origins=FIXTURE_ORIGINS,
+                                                           mode=mode,
+                                                           latency=config.getoption('--fixture-latency'))
+        fixture_server.start()
+        page_objects.base.set_url_rewrite(fixture_server.rewrite)
+    return
+
+
+def pytest_unconfigure(config) -> None:
+    if fixture_server is not None:
+        page_objects.base.set_url_rewrite(None)
+        fixture_server.stop()
+    path = config.getoption('--load-timings', default=None)
+    if path:
+        _write_json_report(path=path, report=page_objects.base.load_timings())
+    path = config.getoption('--element-cache-report', default=None)
+    if path:
+        _write_json_report(path=path, report=page_objects.base.element_cache_report())
+    path = config.getoption('--blocking-report', default=None)
+    if path:
+        # Combined with the last run's report, so a run with --no-request-blocking
+        #   and one without give the savings.
+        previous = _read_json_report(path=path)
+        _write_json_report(path=path, report=page_objects.blocking.usage_report(previous=previous))
+    # Write out whatever is still queued before pytest exits.
+    misc.logging_config.shutdown()
+    return
+
+
+def _read_json_report(path: str) -> Optional[dict]:
+    path = _worker_path(path=path)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def _write_json_report(path: str, report: dict) -> None:
+    path = _worker_path(path=path)
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return
+
+
+def _worker_path(path: str) -> str:
+    # Each xdist worker has its own file.
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+    if worker_id:
+        root, ext = os.path.splitext(path)
+        path = f'{root}.{worker_id}{ext}'
+    return path
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item) -> None:
+    # Start each test with an empty debug buffer. Flush first, or records of the
+    #   previous test still in the queue would land in this test's buffer.
+    misc.logging_config.flush()
+    debug_buffer = misc.logging_config.debug_buffer()
+    if debug_buffer is not None:
+        debug_buffer.clear()
+    return
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call) -> None:
+    """
+    Writes the test's DEBUG records to FAILURE_LOG_DIR if its setup, call or
+    teardown failed. Passing tests write nothing.
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed:
+        item.stash[test_failed_key] = True
+    if report.when != 'teardown' or not item.stash.get(test_failed_key, False):
+        return
+
+    debug_buffer = misc.logging_config.debug_buffer()
+    if debug_buffer is None:
+        return
+    misc.logging_config.flush()
+    path = os.path.join(FAILURE_LOG_DIR, re.sub(r'[^\w.-]+', '_', item.nodeid) + '.log')
+    count = debug_buffer.dump(path=path)
+    logging.info("%s failed; wrote its last %d DEBUG records to %s.", item.nodeid, count, path)
+    return
 
 
 @pytest.fixture(scope='session')
-def launch_chrome() -> WebDriver:
-    logging.debug('Launching Chrome...')
-    driver = webdriver.Chrome()
-    driver.set_window_size(width=1920, height=1080)
-    yield driver
+def driver_pool(request) -> misc.driver_pool.DriverPool:
+    """
+    The browser sessions of this process. Under pytest-xdist, each worker has its
+    own pool.
+    """
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER', 'main')
+    factory = misc.driver_factory.DriverFactory(profile=request.config.getoption('--driver-profile',
+                                                                                  default='headless-fast'),
+                                                cache_dir=request.config.getoption('--driver-cache-dir', default=None),
+                                                name=worker_id)
+    pool = misc.driver_pool.DriverPool(factory=factory,
+                                       size=request.config.getoption('--driver-pool-size', default=1),
+                                       max_uses=request.config.getoption('--driver-max-uses', default=0),
+                                       name=worker_id)
+    pool.start()
+    yield pool
     logging.debug('Closing Chrome...')
-    driver.quit()
+    pool.close()
+    path = request.config.getoption('--driver-report', default=None)
+    if path:
+        _write_json_report(path=path, report={'sessions': factory.sessions()})
+    return
+
+
+@pytest.fixture(scope='function')
+def launch_chrome(driver_pool) -> WebDriver:
+    """
+    Leases a browser session from driver_pool for the duration of the test.
+    """
+    with driver_pool.lease() as driver:
+        yield driver
+    return
+
+
+@pytest.fixture(scope='function', autouse=True)
+def command_report(request) -> Optional[page_objects.instrumentation.CommandRecorder]:
+    """
+    With --command-report, records the WebDriver commands each browser test sends
+    and writes a per-test JSON report (see page_objects.instrumentation).
+    """
+    report_dir = request.config.getoption('--command-report')
+    if not report_dir or 'launch_chrome' not in request.fixturenames:
+        yield None
+        return
+
+    driver = request.getfixturevalue('launch_chrome')
+    recorder = page_objects.instrumentation.CommandRecorder()
+    recorder.install(driver)
+    yield recorder
+    recorder.uninstall(driver)
+
+    os.makedirs(report_dir, exist_ok=True)
+    filename = re.sub(r'[^\w.-]+', '_', request.node.nodeid) + '.json'
+    recorder.to_json(path=os.path.join(report_dir, filename))
+    report = recorder.report(top=1)
+    logging.info("%s: %d WebDriver commands in %.3fs.",
+                 request.node.nodeid, report['total']['count'], report['total']['time'])
     return
@@ -9,22 +9,32 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 class Page(page_objects.base.BasePage):
 
+    # get_checkbox_1()/get_checkbox_2() share one find_elements() lookup, and the
+    #   checkbox group's form is only found once.
+    cache_elements = True
+
+    # Resetting means restoring the checkboxes to how they're loaded.
+    can_reset = True
+    initial_states = [False, True]
+
+    _locators = {
+        'checkbox_group': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='form#checkboxes'),
+        'checkboxes': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='#checkboxes > input[type="checkbox"]'),
+    }
+
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
         self._url = 'https://the-internet.herokuapp.com/checkboxes'
-        self._locators['checkboxes'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': '#checkboxes > input[type="checkbox"]'}
         self._name = 'Checkboxes Page'
         return
 
     # States
 
     def checkbox_1_is_checked(self) -> bool:
-        checkbox = self.get_checkbox_1()
-        return checkbox.checked
+        return self.get_checkbox_group().checked[0]
 
     def checkbox_2_is_checked(self) -> bool:
-        checkbox = self.get_checkbox_2()
-        return checkbox.checked
+        return self.get_checkbox_group().checked[1]
 
     # Actions
 
@@ -40,21 +50,37 @@ class Page(page_objects.base.BasePage):
 
     # Misc
 
+    def reset_state(self) -> None:
+        super().reset_state()
+        self.get_checkbox_group().set_checked(self.initial_states)
+        return
+
+    def is_reset(self) -> bool:
+        # One read covers both is_loaded() and the checked states.
+        snapshot = self.get_checkbox_group().snapshot()
+        return (all(i['displayed'] for i in snapshot) and
+                [i['checked'] for i in snapshot] == self.initial_states)
+
     def is_loaded(self) -> bool:
-        checkbox_1 = self.get_checkbox_1()
-        checkbox_2 = self.get_checkbox_2()
-        if not checkbox_1.element.is_displayed():
-            log_str = f'{self} not yet loaded; {checkbox_1} not displayed...'
-            logging.debug(log_str)
+        # Until the form exists, find_element() raises NoSuchElementException, which
+        #   wait_until_loaded() treats as not loaded yet.
+        snapshot = self.get_checkbox_group().snapshot()
+        if len(snapshot) != len(self.initial_states):
+            logging.debug('%s not yet loaded; %d of %d checkboxes found...', self, len(snapshot), len(self.initial_states))
             return False
-        if not checkbox_2.element.is_displayed():
-            log_str = f'{self} not yet loaded; {checkbox_2} not displayed...'
-            logging.debug(log_str)
-            return False
-        log_str = f'{self} loaded.'
-        logging.debug(log_str)
+        for i_state in snapshot:
+            if not i_state['displayed']:
+                logging.debug('%s not yet loaded; checkbox %d not displayed...', self, i_state['index'] + 1)
+                return False
+        logging.debug('%s loaded.', self)
         return True
 
+    def get_checkbox_group(self) -> page_objects.common.CheckboxGroup:
+        element = self.find_element(locator=self._locators['checkbox_group'])
+        checkbox_group = page_objects.common.CheckboxGroup(element=element)
+        checkbox_group.name = 'Checkboxes'
+        return checkbox_group
+
     def get_checkbox_1(self) -> page_objects.common.Checkbox:
         elements = self.find_elements(locator=self._locators['checkboxes'])
         return page_objects.common.Checkbox(element=elements[0])
@@ -9,10 +9,13 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 class Page(page_objects.base.BasePage):
 
+    _locators = {
+        'dropdown': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='#dropdown'),
+    }
+
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
         self._url = 'https://the-internet.herokuapp.com/dropdown'
-        self._locators['dropdown'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': '#dropdown'}
         self._name = 'Dropdown Page'
         return
 
@@ -30,11 +33,9 @@ class Page(page_objects.base.BasePage):
     def is_loaded(self) -> bool:
         dd = self._get_dropdown()
         if not dd.element.is_displayed():
-            log_str = f'{self} not yet loaded; {dd} not displayed...'
-            logging.debug(log_str)
+            logging.debug('%s not yet loaded; %s not displayed...', self, dd)
             return False
-        log_str = f'{self} loaded.'
-        logging.debug(log_str)
+        logging.debug('%s loaded.', self)
         return True
 
     def _get_dropdown(self) -> page_objects.common.Dropdown:
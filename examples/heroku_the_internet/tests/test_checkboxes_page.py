@@ -1,18 +1,18 @@
-import logging.config
+import logging
 
 import pytest
 
 from examples.heroku_the_internet.page_objects import checkboxes
 import misc.logging_config
 
-logging.config.dictConfig(misc.logging_config.config)
+misc.logging_config.configure()
 
 
 @pytest.fixture(scope='function')
 def navigate_to_page(launch_chrome) -> checkboxes.Page:
     driver = launch_chrome
     page = checkboxes.Page(driver)
-    page.load_page()
+    page.load_or_reset()
     return page
 
 
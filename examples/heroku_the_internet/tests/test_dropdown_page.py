@@ -1,11 +1,11 @@
-import logging.config
+import logging
 
 import pytest
 
 from examples.heroku_the_internet.page_objects import dropdown
 import misc.logging_config
 
-logging.config.dictConfig(misc.logging_config.config)
+misc.logging_config.configure()
 
 
 @pytest.fixture(scope='function')
@@ -1,9 +1,12 @@
 """This module contains code common to all ToolsQA pages."""
 
 import logging
-import time
+from typing import Optional, TypedDict
 
 import page_objects.base
+import page_objects.blocking
+import page_objects.scripts
+import page_objects.waits
 
 from selenium.common.exceptions import InvalidElementStateException
 from selenium.webdriver.common.by import By
@@ -13,13 +16,31 @@ from selenium.webdriver.remote.webelement import WebElement
 
 class Page(page_objects.base.BasePage):
 
+    # Resetting means putting the side nav back the way it's loaded, with these
+    #   groups expanded.
+    can_reset = True
+    initial_expanded_groups = ['Elements']
+
+    # The pages are usable long before every ad and tracker has loaded, and
+    #   is_loaded() checks for the content itself.
+    load_mode = 'eager'
+    # None of the tests need the ads or trackers, and they're most of what the
+    #   pages fetch. Images stay: some pages (e.g. broken images) test them.
+    request_blocking = page_objects.blocking.RequestBlocking(
+        domains=('doubleclick.net', 'googlesyndication.com', 'googletagservices.com', 'adservice.google.com',
+                 'google-analytics.com', 'googletagmanager.com', 'amazon-adsystem.com', 'adsafeprotected.com'),
+        resource_types=('media',))
+
+    _locators = {
+        'side_nav': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='div.left-pannel'),  # 'pannel' is not a typo
+        'title': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='h1.text-center'),
+    }
+
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
         # This class works for all pages, not just text-box. Defining this attribute in case
         #   you want to instantiate this class directly and load the page.
         self._url = 'https://demoqa.com/text-box'
-        self._locators['side_nav'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': 'div.left-pannel'}  # 'pannel' is not a typo
-        self._locators['title'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': 'h1.text-center'}
         self._name = 'ToolsQA Common Page'
         return
 
@@ -31,6 +52,34 @@ class Page(page_objects.base.BasePage):
         title_element = self.find_element(locator=self._locators['title'])
         return title_element.is_displayed()
 
+    def reset_state(self) -> None:
+        super().reset_state()
+        # Expand first: the nav is an accordion, so that usually collapses the rest.
+        nav = self.get_side_nav()
+        for i_group_name in self.initial_expanded_groups:
+            nav.expand_group(group_name=i_group_name)
+        for i_group_name in nav.expanded_groups:
+            if i_group_name not in self.initial_expanded_groups:
+                nav.collapse_group(group_name=i_group_name)
+        return
+
+    def is_reset(self) -> bool:
+        if not self.is_loaded():
+            return False
+        return self.get_side_nav().expanded_groups == self.initial_expanded_groups
+
+
+class SideNavLinkState(TypedDict):
+    name: str
+    element: WebElement
+
+
+class SideNavGroupState(TypedDict):
+    name: str
+    expanded: bool
+    element: WebElement
+    links: list[SideNavLinkState]
+
 
 class SideNav(page_objects.base.BaseElement):
     """
@@ -39,12 +88,19 @@ class SideNav(page_objects.base.BaseElement):
     The idea is to be able to get/do everything you need with this class since it
     encompasses the entirety of the nav. No need to get each individual SideNavGroup
     or SideNavLinkButton, etc.
+
+    Reads are served from snapshot(), which reads the whole nav tree in a single
+    round trip. The snapshot is reused until the next action through this object.
     """
 
+    _locators = {
+        'group': page_objects.base.Locator(scope='element', by=By.CSS_SELECTOR, value='div.element-group'),
+    }
+
     def __init__(self, element: WebElement) -> None:
         super().__init__(element=element)
-        self._locators['group'] = {'scope': 'element', 'by': By.CSS_SELECTOR, 'value': 'div.element-group'}
         self._name = 'Side Nav'
+        self._snapshot = None
         return
 
     # Properties
@@ -52,59 +108,104 @@ class SideNav(page_objects.base.BaseElement):
     @property
     def collapsed_groups(self) -> list[str]:
         groups = []
-        for i in self._get_nav_groups(state='collapsed'):
-            groups.append(i.name)
+        for i in self.snapshot():
+            if not i['expanded']:
+                groups.append(i['name'])
         return groups
 
     @property
     def expanded_groups(self) -> list[str]:
         groups = []
-        for i in self._get_nav_groups(state='expanded'):
-            groups.append(i.name)
+        for i in self.snapshot():
+            if i['expanded']:
+                groups.append(i['name'])
         return groups
 
     @property
     def visible_links(self) -> list[str]:
         links = []
-        for i in self._get_visible_link_buttons():
-            links.append(i.name)
+        for i_group in self.snapshot():
+            if i_group['expanded']:
+                for i_link in i_group['links']:
+                    links.append(i_link['name'])
         return links
 
     def group_is_collapsed(self, group_name: str) -> bool:
-        group = self._get_nav_group(group_name=group_name)
-        return group.is_collapsed()
+        return not self._get_nav_group_state(group_name=group_name)['expanded']
 
     def group_is_expanded(self, group_name: str) -> bool:
-        group = self._get_nav_group(group_name=group_name)
-        return group.is_expanded()
+        return self._get_nav_group_state(group_name=group_name)['expanded']
 
     # Actions
 
     def click_group_header_button(self, group_name: str) -> None:
         nav_group = self._get_nav_group(group_name=group_name)
+        self.invalidate_snapshot()
         nav_group.click_header_button()
         return
 
     def expand_group(self, group_name: str) -> None:
+        # Same as SideNavGroup.expand(), but the state check comes from the snapshot.
+        if self.group_is_expanded(group_name=group_name):
+            logging.debug("Group '%s' already expanded. Doing nothing.", group_name)
+            return
         nav_group = self._get_nav_group(group_name=group_name)
-        nav_group.expand()
+        self.invalidate_snapshot()
+        nav_group.click_header_button()
+        nav_group.wait_until_expanded()
         return
 
     def collapse_group(self, group_name: str) -> None:
+        # Same as SideNavGroup.collapse(), but the state check comes from the snapshot.
+        if self.group_is_collapsed(group_name=group_name):
+            logging.debug("Group '%s' already collapsed. Doing nothing.", group_name)
+            return
         nav_group = self._get_nav_group(group_name=group_name)
-        nav_group.collapse()
+        self.invalidate_snapshot()
+        nav_group.click_header_button()
+        nav_group.wait_until_collapsed()
         return
 
     def click_link_button(self, link_name: str) -> None:
-        if len(self.visible_links) != len(set(self.visible_links)):
-            log_str = f'Found duplicate link buttons in nav. {self.visible_links}'
+        visible_links = self.visible_links
+        if len(visible_links) != len(set(visible_links)):
+            log_str = f'Found duplicate link buttons in nav. {visible_links}'
             logging.error(log_str)
             raise Exception(log_str)
 
         link_button = self._get_link_button(link_name=link_name)
+        self.invalidate_snapshot()
         link_button.click(scroll_into_view=True)
         return
 
+    # Snapshot
+
+    def snapshot(self, refresh: bool = False) -> list[SideNavGroupState]:
+        """
+        Reads every group's name and expanded state, and every link's name, along
+        with their WebElements, in a single round trip.
+
+        The result is reused until the next action through this object, or until
+        refresh is set. If the nav is changed some other way (e.g. through a
+        SideNavGroup you're holding on to), call invalidate_snapshot().
+        """
+        if self._snapshot is None or refresh:
+            def by_value(locator: page_objects.base.Locator) -> list[str]:
+                return [locator.by, locator.value]
+
+            self._snapshot = self.driver.execute_script(page_objects.scripts.NAV_TREE_SNAPSHOT,
+                                                        self.element,
+                                                        by_value(self._locators['group']),
+                                                        by_value(SideNavGroup._locators['header_button']),
+                                                        by_value(SideNavGroup._locators['link_list']),
+                                                        by_value(SideNavGroup._locators['link_button']),
+                                                        'show')
+        return self._snapshot
+
+    def invalidate_snapshot(self) -> None:
+        self._snapshot = None
+        return
+
     # Misc
 
     def _get_nav_group(self, group_name: str) -> 'SideNavGroup':
@@ -115,6 +216,14 @@ class SideNav(page_objects.base.BaseElement):
         logging.error(log_str)
         raise ValueError(log_str)
 
+    def _get_nav_group_state(self, group_name: str) -> SideNavGroupState:
+        for i in self.snapshot():
+            if i['name'].lower() == group_name.lower():
+                return i
+        log_str = f"No group found with name '{group_name}'."
+        logging.error(log_str)
+        raise ValueError(log_str)
+
     def _get_nav_groups(self, state: str = 'all') -> list['SideNavGroup']:
         valid_nav_group_states = ['all', 'expanded', 'collapsed']
         if state.lower() not in valid_nav_group_states:
@@ -123,11 +232,12 @@ class SideNav(page_objects.base.BaseElement):
             raise ValueError(log_str)
 
         groups = []
-        for i_element in self.find_elements(locator=self._locators['group']):
-            i_group = SideNavGroup(element=i_element)
+        for i_state in self.snapshot():
             if (state.lower() == 'all' or
-                    (state.lower() == 'expanded' and i_group.is_expanded()) or
-                    (state.lower() == 'collapsed' and i_group.is_collapsed())):
+                    (state.lower() == 'expanded' and i_state['expanded']) or
+                    (state.lower() == 'collapsed' and not i_state['expanded'])):
+                i_group = SideNavGroup(element=i_state['element'])
+                i_group.name = i_state['name']
                 groups.append(i_group)
         return groups
 
@@ -142,22 +252,29 @@ class SideNav(page_objects.base.BaseElement):
 
     def _get_visible_link_buttons(self) -> list['SideNavLinkButton']:
         all_link_buttons = []
-        for i_group in self._get_nav_groups(state='expanded'):
-            group_link_buttons = i_group.get_link_buttons()
-            for i_link_button in group_link_buttons:
+        for i_group in self.snapshot():
+            if not i_group['expanded']:
+                continue
+            for i_link in i_group['links']:
+                i_link_button = SideNavLinkButton(element=i_link['element'])
+                i_link_button.name = i_link['name']
                 all_link_buttons.append(i_link_button)
         return all_link_buttons
 
 
 class SideNavGroup(page_objects.base.BaseOpenCloseElement):
 
-    def __init__(self, element: WebElement) -> None:
-        super().__init__(element=element)
-        self._locators['header_button'] = {'scope': 'element', 'by': By.CSS_SELECTOR, 'value': 'span.group-header'}
-        self._locators['link_list'] = {'scope': 'element', 'by': By.CSS_SELECTOR, 'value': 'div.element-list'}
-        self._locators['link_button'] = {'scope': 'element', 'by': By.CSS_SELECTOR, 'value': 'li.btn'}
-        self._name = self.name
-        return
+    # The link list gets the 'show' class when the group is open. Let the browser
+    #   watch for it rather than polling is_open()/is_closed().
+    wait_mode = 'observe'
+    open_condition = page_objects.waits.DomCondition(locator='link_list', check='class_contains', name='show')
+    closed_condition = page_objects.waits.DomCondition(locator='link_list', check='class_not_contains', name='show')
+
+    _locators = {
+        'header_button': page_objects.base.Locator(scope='element', by=By.CSS_SELECTOR, value='span.group-header'),
+        'link_list': page_objects.base.Locator(scope='element', by=By.CSS_SELECTOR, value='div.element-list'),
+        'link_button': page_objects.base.Locator(scope='element', by=By.CSS_SELECTOR, value='li.btn'),
+    }
 
     # Properties
 
@@ -171,8 +288,7 @@ class SideNavGroup(page_objects.base.BaseOpenCloseElement):
         classes = link_list.get_attribute('class')
         return 'show' in classes
 
-    @property
-    def name(self) -> str:
+    def _load_name(self) -> str:
         header_button = self._get_header_button()
         return header_button.name
 
@@ -180,6 +296,9 @@ class SideNavGroup(page_objects.base.BaseOpenCloseElement):
 
     def click_header_button(self) -> None:
         header_button = self._get_header_button()
+        if self._name is None:
+            # Name the group (and the click's log message) after its header.
+            self._name = header_button.name
         header_button.click(scroll_into_view=True)
         return
 
@@ -192,10 +311,13 @@ class SideNavGroup(page_objects.base.BaseOpenCloseElement):
         link_button.click()
         return
 
+    # close() and open() send commands anyway, so they name the group in their
+    #   logs: free if it came from a SideNav snapshot, a read of its header (once)
+    #   if not.
+
     def close(self) -> None:
         if self.is_closed():
-            log_str = f"{self} already closed. Doing nothing."
-            logging.debug(log_str)
+            logging.debug("Side Nav Group: '%s' already closed. Doing nothing.", self.name)
         else:
             self.click_header_button()
             self.wait_until_closed()
@@ -203,14 +325,13 @@ class SideNavGroup(page_objects.base.BaseOpenCloseElement):
 
     def open(self) -> None:
         if self.is_open():
-            log_str = f"{self} already open. Doing nothing."
-            logging.debug(log_str)
+            logging.debug("Side Nav Group: '%s' already open. Doing nothing.", self.name)
         else:
             self.click_header_button()
             self.wait_until_open()
         return
 
-    def click(self, scroll_into_view: bool = False) -> None:
+    def click(self, scroll_into_view: bool = False, settle: Optional[str] = None) -> None:
         """
         Overwriting inherited method. Recommend not using this method.
 
@@ -219,20 +340,24 @@ class SideNavGroup(page_objects.base.BaseOpenCloseElement):
         * open() or expand() - contains minimal logic
         * close() or collapse() - contains minimal logic
         """
-        log_str = f"This object {self.__class__} represents the entire group (header and links buttons).\n"
+        log_str = "This object %s represents the entire group (header and links buttons).\n"
         log_str += "  Clicking this element could produce an unexpected result.\n"
-        log_str += f"  Recommend clicking {self._get_header_button().__class__} instead.\n"
-        log_str += f"    Clicking {self} anyway..."
-        logging.warning(log_str)
+        log_str += "  Recommend clicking %s instead.\n"
+        log_str += "    Clicking %s anyway..."
+        logging.warning(log_str, self.__class__, SideNavGroupHeaderButton, self)
         self.element.click()
-        time.sleep(0.5)
+        self.settle(policy=settle)
         return
 
     # Misc
 
     def _get_header_button(self) -> 'SideNavGroupHeaderButton':
         element = self.find_element(locator=self._locators['header_button'])
-        return SideNavGroupHeaderButton(element=element)
+        header_button = SideNavGroupHeaderButton(element=element)
+        if self._name:
+            # The group's name is its header's text.
+            header_button.name = self._name
+        return header_button
 
     def _get_link_button(self, link_name: str) -> 'SideNavLinkButton':
         link_buttons = self.get_link_buttons()
@@ -251,46 +376,34 @@ class SideNavGroup(page_objects.base.BaseOpenCloseElement):
         return buttons
 
     def __repr__(self) -> str:
-        return f"{self.__class__} - '{self.name}'"
+        return f"{self.__class__} - '{self.log_name}'"
 
     def __str__(self) -> str:
-        return f"Side Nav Group: '{self.name}'"
+        return f"Side Nav Group: '{self.log_name}'"
 
 
 class SideNavGroupHeaderButton(page_objects.base.BaseElement):
 
-    def __init__(self, element: WebElement) -> None:
-        super().__init__(element=element)
-        self._name = self.name
-        return
-
-    @property
-    def name(self) -> str:
+    def _load_name(self) -> str:
         # For some reason this has a trailing newline and space, e.g. 'Elements\n '
         #   I can't imagine why we would ever need to reference that, so let's just
         #   strip it.
         return self.element.text.strip()
 
     def __repr__(self) -> str:
-        return f"{self.__class__} - '{self.name}'"
+        return f"{self.__class__} - '{self.log_name}'"
 
     def __str__(self) -> str:
-        return f"Side Nav Group Header Button: '{self.name}'"
+        return f"Side Nav Group Header Button: '{self.log_name}'"
 
 
 class SideNavLinkButton(page_objects.base.BaseElement):
 
-    def __init__(self, element: WebElement) -> None:
-        super().__init__(element=element)
-        self._name = self.name
-        return
-
-    @property
-    def name(self) -> str:
+    def _load_name(self) -> str:
         return self.element.text
 
     def __repr__(self) -> str:
-        return f"{self.__class__} - '{self.name}'"
+        return f"{self.__class__} - '{self.log_name}'"
 
     def __str__(self) -> str:
-        return f"Side Nav Link Button: '{self.name}'"
+        return f"Side Nav Link Button: '{self.log_name}'"
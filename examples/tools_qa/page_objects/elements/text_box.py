@@ -10,19 +10,46 @@ from selenium.webdriver.remote.webdriver import WebDriver
 
 class Page(examples.tools_qa.page_objects.common.Page):
 
+    # The form fields stay put between reads and writes, so there's no need to
+    #   find them again for every property access.
+    cache_elements = True
+
+    _locators = {
+        'full_name_input': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='#userName'),
+        'email_input': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='#userEmail'),
+        'current_address_textarea': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='textarea#currentAddress'),
+        'permanent_address_textarea': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='textarea#permanentAddress'),
+        'submit_button': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='#submit'),
+        'submitted_name': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='#name'),
+        'submitted_email': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='#email'),
+        'submitted_current_address': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='p#currentAddress'),
+        'submitted_permanent_address': page_objects.base.Locator(scope='driver', by=By.CSS_SELECTOR, value='p#permanentAddress'),
+    }
+
+    _fields = {
+        'full_name': page_objects.base.Field(locator='full_name_input', read='value'),
+        'email': page_objects.base.Field(locator='email_input', read='value'),
+        'current_address': page_objects.base.Field(locator='current_address_textarea', read='value'),
+        'permanent_address': page_objects.base.Field(locator='permanent_address_textarea', read='value'),
+        'submitted_name': page_objects.base.Field(locator='submitted_name', read='text'),
+        'submitted_email': page_objects.base.Field(locator='submitted_email', read='text'),
+        'submitted_current_address': page_objects.base.Field(locator='submitted_current_address', read='text'),
+        'submitted_permanent_address': page_objects.base.Field(locator='submitted_permanent_address', read='text'),
+    }
+
     def __init__(self, driver: WebDriver) -> None:
         super().__init__(driver)
         self._url = 'https://demoqa.com/text-box'
         self._name = 'Elements/Text-Box Page'
-        self._locators['full_name_input'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': '#userName'}
-        self._locators['email_input'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': '#userEmail'}
-        self._locators['current_address_textarea'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': 'textarea#currentAddress'}
-        self._locators['permanent_address_textarea'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': 'textarea#permanentAddress'}
-        self._locators['submit_button'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': '#submit'}
-        self._locators['submitted_name'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': '#name'}
-        self._locators['submitted_email'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': '#email'}
-        self._locators['submitted_current_address'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': 'p#currentAddress'}
-        self._locators['submitted_permanent_address'] = {'scope': 'driver', 'by': By.CSS_SELECTOR, 'value': 'p#permanentAddress'}
+        return
+
+    def load_page(self, mode: Optional[str] = None) -> None:
+        super().load_page(mode=mode)
+        # Resolve the form in one round trip, so the _get_*() helpers below are
+        #   served from the element cache. The submitted values only appear after
+        #   a submit, so they're left out.
+        self.prefetch('full_name_input', 'email_input', 'current_address_textarea', 'permanent_address_textarea',
+                      'submit_button')
         return
 
     # Properties
@@ -107,8 +134,33 @@ class Page(examples.tools_qa.page_objects.common.Page):
     def submitted_permanent_address_field_is_visible(self) -> bool:
         return self.element_exists_and_is_displayed(locator=self._locators['submitted_permanent_address'])
 
+    def submitted_fields_are_visible(self) -> dict[str, bool]:
+        """
+        Visibility of every submitted field, keyed by locator name, in one round trip.
+        """
+        keys = ['submitted_name', 'submitted_email', 'submitted_current_address', 'submitted_permanent_address']
+        states = self.probe(locators={key: self._locators[key] for key in keys})
+        return {key: state['displayed'] for key, state in states.items()}
+
     # Actions
 
+    def fill_form(self, full_name: Optional[str] = None, email: Optional[str] = None,
+                  current_address: Optional[str] = None, permanent_address: Optional[str] = None) -> None:
+        """
+        Sets the given fields in a single round trip (see
+        page_objects.common.fill_text_fields()). Fields left as None aren't changed.
+        """
+        values = {
+            'full_name_input': full_name,
+            'email_input': email,
+            'current_address_textarea': current_address,
+            'permanent_address_textarea': permanent_address,
+        }
+        page_objects.common.fill_text_fields(parent=self, values={self._locators[key]: value
+                                                                  for key, value in values.items()
+                                                                  if value is not None})
+        return
+
     def click_submit_button(self) -> None:
         self._get_submit_button().click(scroll_into_view=True)
         return
@@ -150,3 +202,19 @@ class Page(examples.tools_qa.page_objects.common.Page):
         if not title_element.is_displayed():
             return False
         return title_element.text == 'Text Box'
+
+    def reset_state(self) -> None:
+        # The submitted values can't be cleared without reloading; is_reset() fails
+        #   if any are showing, so load_or_reset() falls back to a reload.
+        # The form is React-controlled, and doesn't see WebElement.clear(); it would
+        #   submit the old values again. fill_form() fires the input events it needs.
+        super().reset_state()
+        self.fill_form(full_name='', email='', current_address='', permanent_address='')
+        return
+
+    def is_reset(self) -> bool:
+        if any(self.submitted_fields_are_visible().values()):
+            return False
+        if any([self.full_name_input, self.email_input, self.current_address_textarea, self.permanent_address_textarea]):
+            return False
+        return super().is_reset()
@@ -1,4 +1,4 @@
-import logging.config
+import logging
 
 import pytest
 from selenium.common.exceptions import InvalidElementStateException
@@ -15,14 +15,14 @@ import examples.tools_qa.page_objects.interactions.droppable
 import examples.tools_qa.page_objects.interactions.resizable
 import misc.logging_config
 
-logging.config.dictConfig(misc.logging_config.config)
+misc.logging_config.configure()
 
 
 @pytest.fixture(scope='function')
 def navigate_to_page(launch_chrome) -> examples.tools_qa.page_objects.common.Page:
     driver = launch_chrome
     page = examples.tools_qa.page_objects.common.Page(driver)
-    page.load_page()
+    page.load_or_reset()
     return page
 
 
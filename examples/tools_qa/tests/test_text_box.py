@@ -1,18 +1,18 @@
-import logging.config
+import logging
 
 import pytest
 
 import examples.tools_qa.page_objects.elements.text_box
 import misc.logging_config
 
-logging.config.dictConfig(misc.logging_config.config)
+misc.logging_config.configure()
 
 
 @pytest.fixture(scope='function')
 def navigate_to_page(launch_chrome) -> examples.tools_qa.page_objects.elements.text_box.Page:
     driver = launch_chrome
     page = examples.tools_qa.page_objects.elements.text_box.Page(driver=driver)
-    page.load_page()
+    page.load_or_reset()
     return page
 
 
@@ -92,3 +92,22 @@ class TestHappyPaths:
         assert not text_box_page.submitted_current_address_field_is_visible()
         assert text_box_page.submitted_permanent_address == cls.expected_submitted_permanent_address
         return
+
+    @classmethod
+    def test_fill_form(cls, navigate_to_page) -> None:
+        text_box_page = navigate_to_page
+
+        text_box_page.fill_form(full_name=cls.name_input, email=cls.email_input)
+        text_box_page.click_submit_button()
+
+        assert text_box_page.snapshot_fields() == {
+            'full_name': cls.name_input,
+            'email': cls.email_input,
+            'current_address': '',
+            'permanent_address': '',
+            'submitted_name': cls.expected_submitted_name,
+            'submitted_email': cls.expected_submitted_email,
+            'submitted_current_address': None,
+            'submitted_permanent_address': None,
+        }
+        return
@@ -0,0 +1,285 @@
+"""
+Starts Chrome sessions from named profiles, and records what each one costs.
+
+A profile is a set of launch options tuned for a purpose:
+    headless-fast: the default for test runs; no window, GPU, extensions or
+        background traffic, and the 'eager' page load strategy
+    debug-visible: a normal window, for watching or debugging a test; 'normal'
+        page loads
+    low-memory: like headless-fast, with fewer renderer processes, a smaller JS
+        heap and no images, for packing many sessions on one machine
+
+The page load strategy is when driver.get() returns: at the load event
+('normal'), at DOMContentLoaded ('eager') or right away ('none'). It's fixed for
+the session; BasePage.load_page() waits for the rest when a page's load_mode asks
+for more.
+
+The window size is set at launch rather than resized afterwards, which saves a
+round trip and a relayout. With a cache_dir, sessions keep their HTTP cache
+between sessions (and runs), so static assets are fetched once.
+
+A factory is a callable, so it can be given to DriverPool directly:
+
+    factory = DriverFactory(profile='headless-fast')
+    pool = misc.driver_pool.DriverPool(factory=factory, size=4)
+
+End sessions with the factory's quit() rather than the driver's (DriverPool
+does), so their memory is measured and their cache directory freed. Each
+session's startup time and resident memory (at start and at quit) are recorded;
+see sessions().
+"""
+
+import collections
+import logging
+import os
+import threading
+import time
+from typing import NamedTuple, Optional, TypedDict
+
+from selenium import webdriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class DriverProfile(NamedTuple):
+    """
+    headless: run without a window
+    window_size: (width, height), set at launch
+    arguments: Chrome command line switches
+    disable_images: don't load images (pages testing images will fail)
+    page_load_strategy: 'normal', 'eager' or 'none'
+    """
+    headless: bool
+    window_size: tuple[int, int] = (1920, 1080)
+    arguments: tuple[str, ...] = ()
+    disable_images: bool = False
+    page_load_strategy: str = 'normal'
+
+
+# Switches that cut startup work and background activity tests never need.
+TUNED_ARGUMENTS = (
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--mute-audio',
+    '--disable-dev-shm-usage',
+)
+
+PROFILES: dict[str, DriverProfile] = {
+    'headless-fast': DriverProfile(
+        headless=True,
+        arguments=TUNED_ARGUMENTS + (
+            # Headless windows count as hidden; keep them running at full speed.
+            '--disable-renderer-backgrounding',
+            '--disable-background-timer-throttling',
+            '--disable-backgrounding-occluded-windows',
+        ),
+        page_load_strategy='eager'),
+    'debug-visible': DriverProfile(
+        headless=False,
+        arguments=('--disable-extensions', '--no-first-run', '--no-default-browser-check')),
+    'low-memory': DriverProfile(
+        headless=True,
+        arguments=TUNED_ARGUMENTS + (
+            '--renderer-process-limit=2',
+            '--process-per-site',
+            '--js-flags=--max-old-space-size=256',
+        ),
+        disable_images=True,
+        page_load_strategy='eager'),
+}
+
+
+class SessionStats(TypedDict):
+    """
+    startup_time: seconds to start the session
+    rss_at_start, rss_at_quit: resident memory of the browser's processes, in
+        bytes (see process_tree_rss()); None if it couldn't be read
+    """
+    number: int
+    profile: str
+    startup_time: float
+    rss_at_start: Optional[int]
+    rss_at_quit: Optional[int]
+
+
+class DriverFactory:
+    """
+    profile: name in PROFILES
+    cache_dir: directory for the sessions' HTTP caches. None for Chrome's default
+        (a fresh cache per session).
+    name: used in log messages and cache directory names, e.g. the xdist worker
+        id. Factories in different processes need different names to use the
+        same cache_dir.
+    """
+
+    def __init__(self, profile: str = 'headless-fast', cache_dir: Optional[str] = None, name: str = 'main') -> None:
+        if profile not in PROFILES:
+            log_str = f"Invalid driver profile '{profile}'. Must be one of {list(PROFILES)}."
+            logging.error(log_str)
+            raise ValueError(log_str)
+
+        self.profile = profile
+        self.cache_dir = cache_dir
+        self.name = name
+        self._lock = threading.Lock()
+        self._sessions: list[SessionStats] = []
+        # Sessions not quit yet, with their stats and cache slot.
+        self._live: dict[WebDriver, tuple[SessionStats, Optional[int]]] = dict()
+        # Cache directories not in use by a live session. Chrome can't share one
+        #   between running browsers, so each session takes one for its lifetime.
+        self._free_cache_slots: list[int] = []
+        self._cache_slots = 0
+        return
+
+    def __call__(self) -> WebDriver:
+        """
+        Starts a session.
+        """
+        cache_slot = self._take_cache_slot() if self.cache_dir else None
+        logging.debug("%s: launching Chrome ('%s')...", self, self.profile)
+        start_time = time.monotonic()
+        try:
+            driver = webdriver.Chrome(options=self.options(cache_slot=cache_slot))
+        except Exception:
+            if cache_slot is not None:
+                self._release_cache_slot(cache_slot)
+            raise
+        startup_time = time.monotonic() - start_time
+        rss = browser_rss(driver)
+
+        with self._lock:
+            stats = SessionStats(number=len(self._sessions) + 1, profile=self.profile, startup_time=startup_time,
+                                 rss_at_start=rss, rss_at_quit=None)
+            self._sessions.append(stats)
+            self._live[driver] = (stats, cache_slot)
+        logging.debug("%s: started session %d in %.2fs (%s MB resident).", self, stats['number'], startup_time,
+                      _megabytes(rss))
+        return driver
+
+    def quit(self, driver: WebDriver) -> None:
+        """
+        Quits a session this factory started, measuring its memory first and
+        freeing its cache directory after.
+        """
+        with self._lock:
+            stats, cache_slot = self._live.pop(driver, (None, None))
+        if stats is None:
+            logging.warning("%s: %r wasn't started by this factory, or was already quit.", self, driver)
+            driver.quit()
+            return
+
+        stats['rss_at_quit'] = browser_rss(driver)
+        logging.debug("%s: quitting session %d (%s MB resident).", self, stats['number'],
+                      _megabytes(stats['rss_at_quit']))
+        try:
+            driver.quit()
+        finally:
+            if cache_slot is not None:
+                self._release_cache_slot(cache_slot)
+        return
+
+    def options(self, cache_slot: Optional[int] = None) -> webdriver.ChromeOptions:
+        """
+        The launch options for this factory's profile.
+        """
+        profile = PROFILES[self.profile]
+        options = webdriver.ChromeOptions()
+        if profile.headless:
+            options.add_argument('--headless=new')
+        options.add_argument(f'--window-size={profile.window_size[0]},{profile.window_size[1]}')
+        for i_argument in profile.arguments:
+            options.add_argument(i_argument)
+        options.page_load_strategy = profile.page_load_strategy
+        if profile.disable_images:
+            options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        if cache_slot is not None:
+            options.add_argument(f'--disk-cache-dir={os.path.join(self.cache_dir, f"{self.name}-{cache_slot}")}')
+        return options
+
+    def sessions(self) -> list[SessionStats]:
+        """
+        Stats of every session started, in order.
+        """
+        with self._lock:
+            return [SessionStats(**i) for i in self._sessions]
+
+    # Misc
+
+    def _take_cache_slot(self) -> int:
+        with self._lock:
+            if self._free_cache_slots:
+                return self._free_cache_slots.pop()
+            self._cache_slots += 1
+            return self._cache_slots
+
+    def _release_cache_slot(self, cache_slot: int) -> None:
+        with self._lock:
+            self._free_cache_slots.append(cache_slot)
+        return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(profile='{self.profile}', cache_dir={self.cache_dir!r}, name='{self.name}')"
+
+    def __str__(self) -> str:
+        return f"Driver factory '{self.name}'"
+
+
+def browser_rss(driver: WebDriver) -> Optional[int]:
+    """
+    Resident memory of the browser behind driver (every process started by its
+    chromedriver), in bytes. None if there's no local chromedriver process (e.g.
+    a remote session) or /proc isn't available.
+    """
+    service = getattr(driver, 'service', None)
+    process = getattr(service, 'process', None)
+    if process is None:
+        return None
+    return process_tree_rss(pid=process.pid, include_root=False)
+
+
+def process_tree_rss(pid: int, include_root: bool = True) -> Optional[int]:
+    """
+    Resident memory of a process and all its descendants, in bytes, from /proc.
+    Pages shared between processes are counted once per process, so this
+    overstates the total; it's meant for comparing sessions. None if /proc isn't
+    available (i.e. not Linux).
+    """
+    if not os.path.isdir('/proc'):
+        return None
+
+    children = collections.defaultdict(list)
+    for i_entry in os.listdir('/proc'):
+        if not i_entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{i_entry}/stat') as f:
+                stat = f.read()
+        except OSError:
+            # Exited since listdir().
+            continue
+        # The command name (2nd field) can contain spaces and parentheses; the
+        #   parent pid is the 2nd field after it.
+        parent_pid = int(stat.rsplit(')', 1)[1].split()[1])
+        children[parent_pid].append(int(i_entry))
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total = 0
+    to_visit = [pid] if include_root else list(children[pid])
+    while to_visit:
+        i_pid = to_visit.pop()
+        try:
+            with open(f'/proc/{i_pid}/statm') as f:
+                total += int(f.read().split()[1]) * page_size
+        except OSError:
+            continue
+        to_visit += children[i_pid]
+    return total
+
+
+def _megabytes(value: Optional[int]) -> str:
+    return '?' if value is None else f'{value / 2 ** 20:.0f}'
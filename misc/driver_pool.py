@@ -0,0 +1,247 @@
+"""
+A pool of WebDriver sessions, leased to tests one at a time.
+
+Starting a browser is the slowest part of most UI tests, so sessions are reused
+from test to test. Each lease health-checks the session first; a session that
+died (browser crash, closed window, lost connection) is quit and replaced. A
+session can also be recycled after max_uses leases, to keep long runs from
+accumulating browser state or memory.
+
+The pool belongs to one process. Under pytest-xdist every worker is its own
+process, with its own pool, so N workers drive N * size browsers in parallel:
+
+    with pool.lease() as driver:
+        driver.get(...)
+"""
+
+import concurrent.futures
+import contextlib
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterator, Optional, TypedDict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class PoolStats(TypedDict):
+    started: int
+    recycled: int
+    crashed: int
+    leases: int
+
+
+class PooledDriver:
+    """
+    A session in the pool, and how many times it's been leased.
+    """
+
+    def __init__(self, driver: WebDriver, number: int) -> None:
+        self.driver = driver
+        self.number = number
+        self.uses = 0
+        return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(number={self.number}, uses={self.uses})"
+
+
+class DriverPool:
+    """
+    factory: starts a new session, e.g. webdriver.Chrome or a
+        misc.driver_factory.DriverFactory. If it has a quit(driver) method, as
+        DriverFactory does, sessions are quit with it.
+    size: max number of sessions alive at once
+    max_uses: number of leases after which a session is quit and replaced; 0 means
+        never
+    name: used in log messages, e.g. the xdist worker id
+    """
+
+    def __init__(self, factory: Callable[[], WebDriver], size: int = 1, max_uses: int = 0, name: str = 'main') -> None:
+        if size < 1:
+            log_str = f"Invalid driver pool size {size}. Must be at least 1."
+            logging.error(log_str)
+            raise ValueError(log_str)
+        if max_uses < 0:
+            log_str = f"Invalid driver max uses {max_uses}. Must be 0 (unlimited) or more."
+            logging.error(log_str)
+            raise ValueError(log_str)
+
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.name = name
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._alive = 0
+        self._closed = False
+        self._stats: PoolStats = {'started': 0, 'recycled': 0, 'crashed': 0, 'leases': 0}
+        return
+
+    # Leasing
+
+    @contextlib.contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[WebDriver]:
+        """
+        Leases a healthy session for the duration of the with block.
+        """
+        pooled = self.acquire(timeout=timeout)
+        try:
+            yield pooled.driver
+        finally:
+            self.release(pooled)
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        """
+        Returns an idle session, or starts one if the pool isn't full. Otherwise,
+        waits up to timeout seconds (forever, if None) for one to be released.
+
+        Prefer lease(). A session acquired here must be given back with release().
+        """
+        if self._closed:
+            log_str = f"{self} is closed."
+            logging.error(log_str)
+            raise RuntimeError(log_str)
+
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                pooled = self._start_or_wait(timeout=timeout)
+                if pooled.uses == 0:
+                    break
+            if self._is_healthy(pooled):
+                break
+            logging.warning("%s: session %d is no longer responding. Replacing it...", self, pooled.number)
+            with self._lock:
+                self._stats['crashed'] += 1
+            self._discard(pooled)
+
+        with self._lock:
+            self._stats['leases'] += 1
+        logging.debug("%s: leasing session %d (use %d).", self, pooled.number, pooled.uses + 1)
+        return pooled
+
+    def release(self, pooled: PooledDriver) -> None:
+        with self._lock:
+            pooled.uses += 1
+            closed = self._closed
+            recycle = not closed and bool(self.max_uses) and pooled.uses >= self.max_uses
+            if recycle:
+                self._stats['recycled'] += 1
+        if closed:
+            self._discard(pooled)
+        elif recycle:
+            logging.debug("%s: session %d used %d times. Recycling it...", self, pooled.number, pooled.uses)
+            self._discard(pooled)
+        else:
+            self._idle.put(pooled)
+        return
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """
+        Starts sessions until the pool is full, in parallel, so the first tests
+        don't each wait for a browser.
+        """
+        with self._lock:
+            to_start = self.size - self._alive
+            self._alive += to_start
+        if to_start <= 0:
+            return
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=to_start) as executor:
+            futures = [executor.submit(self._launch) for _ in range(to_start)]
+        errors = []
+        for i_future in futures:
+            if i_future.exception() is None:
+                self._idle.put(i_future.result())
+            else:
+                with self._lock:
+                    self._alive -= 1
+                errors.append(i_future.exception())
+        if errors:
+            log_str = f"{self}: {len(errors)} of {to_start} sessions failed to start."
+            logging.error(log_str)
+            raise errors[0]
+        return
+
+    def close(self) -> None:
+        """
+        Quits every idle session. Sessions still leased are quit when released.
+        """
+        self._closed = True
+        while True:
+            try:
+                pooled = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(pooled)
+        logging.debug("%s closed. %s", self, self.stats())
+        return
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            return PoolStats(**self._stats)
+
+    # Misc
+
+    def _start_or_wait(self, timeout: Optional[float]) -> PooledDriver:
+        with self._lock:
+            can_start = self._alive < self.size
+            if can_start:
+                self._alive += 1
+        if not can_start:
+            try:
+                return self._idle.get(timeout=timeout)
+            except queue.Empty:
+                log_str = f"{self}: no session released within {timeout}s."
+                logging.error(log_str)
+                raise TimeoutError(log_str)
+        try:
+            return self._launch()
+        except Exception:
+            with self._lock:
+                self._alive -= 1
+            raise
+
+    def _launch(self) -> PooledDriver:
+        start_time = time.monotonic()
+        driver = self.factory()
+        with self._lock:
+            self._stats['started'] += 1
+            number = self._stats['started']
+        logging.debug("%s: started session %d in %.2fs.", self, number, time.monotonic() - start_time)
+        return PooledDriver(driver=driver, number=number)
+
+    def _discard(self, pooled: PooledDriver) -> None:
+        with self._lock:
+            self._alive -= 1
+        quit_ = getattr(self.factory, 'quit', None)
+        try:
+            if quit_ is not None:
+                quit_(pooled.driver)
+            else:
+                pooled.driver.quit()
+        except Exception as e:
+            # Most likely the browser is already gone.
+            logging.debug("%s: error quitting session %d: %r", self, pooled.number, e)
+        return
+
+    @staticmethod
+    def _is_healthy(pooled: PooledDriver) -> bool:
+        # Any failure counts: a dead browser can surface as a WebDriverException or
+        #   as a connection error from the HTTP client.
+        try:
+            pooled.driver.current_window_handle
+        except Exception:
+            return False
+        return True
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name='{self.name}', size={self.size}, max_uses={self.max_uses})"
+
+    def __str__(self) -> str:
+        return f"Driver pool '{self.name}'"
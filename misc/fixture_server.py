@@ -0,0 +1,303 @@
+"""
+Serves the example sites from localhost, recorded once and replayed after.
+
+Each origin (e.g. 'https://demoqa.com') gets a local port, and page URLs are
+rewritten to it (see rewrite(), and page_objects.base.set_url_rewrite()). The
+browser then fetches the page and its same-origin resources from the server:
+    record: the server fetches each request from the real origin, saves it to the
+        archive and returns it
+    replay: the server answers from the archive only; anything not recorded is a
+        404, so the tests never touch the network for these origins
+
+The archive is a HAR 1.2 file (a subset: URL, status, headers and content), so
+browser dev tools and HAR viewers can open it. Recording again adds to it.
+
+Absolute URLs to the recorded origins in HTML, JS, CSS and JSON responses (and
+redirects) are rewritten to the local ports too. Requests to other origins
+(CDNs, ads, trackers) still go to the network; block them with the page's
+request_blocking.
+
+    with FixtureServer(archive_path='sites.har', origins=['https://demoqa.com'], mode='replay') as server:
+        page_objects.base.set_url_rewrite(server.rewrite)
+"""
+
+import base64
+import http.server
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Optional, TypedDict
+
+FIXTURE_MODES = ['record', 'replay']
+
+# Response headers not recorded: hop-by-hop headers, the length and encoding
+#   (bodies are stored decoded and may be rewritten), and policies tied to the
+#   real origin.
+DROPPED_HEADERS = ['connection', 'keep-alive', 'transfer-encoding', 'content-length', 'content-encoding',
+                   'strict-transport-security', 'content-security-policy', 'content-security-policy-report-only',
+                   'alt-svc', 'report-to', 'nel']
+
+# Content types whose bodies are stored as text, and have URLs rewritten.
+TEXT_TYPES = ['text/', 'javascript', 'json', 'xml', 'css']
+
+
+class Response(TypedDict):
+    status: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class Server(http.server.ThreadingHTTPServer):
+    # A page load (or many sessions starting) opens many connections at once; the
+    #   default backlog (5) would leave some waiting for a SYN retry, about a second.
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class _NoRedirects(urllib.request.HTTPRedirectHandler):
+    # Record redirects as they are, instead of following them.
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl) -> None:
+        return None
+
+
+class FixtureServer:
+    """
+    archive_path: HAR file to record to or replay from
+    origins: scheme and host of each site to serve, e.g. 'https://demoqa.com'
+    mode: one of FIXTURE_MODES
+    latency: seconds added to every response, e.g. to approximate the real site
+    """
+
+    def __init__(self, archive_path: str, origins: list[str], mode: str = 'replay', latency: float = 0.0) -> None:
+        if mode not in FIXTURE_MODES:
+            log_str = f"Invalid fixture mode '{mode}'. Must be one of {FIXTURE_MODES}."
+            logging.error(log_str)
+            raise ValueError(log_str)
+
+        self.archive_path = archive_path
+        self.origins = [i.rstrip('/') for i in origins]
+        self.mode = mode
+        self.latency = latency
+        self.stats = {'served': 0, 'recorded': 0, 'missing': 0}
+        self._entries: dict[str, dict] = dict()
+        self._lock = threading.Lock()
+        self._servers: dict[str, Server] = dict()
+        self._opener = urllib.request.build_opener(_NoRedirects)
+        return
+
+    # Lifecycle
+
+    def start(self) -> None:
+        self._load_archive()
+        if self.mode == 'replay' and not self._entries:
+            logging.warning("%s: nothing recorded in '%s'; every request will be a 404.", self, self.archive_path)
+        for i_origin in self.origins:
+            self._servers[i_origin] = Server(('127.0.0.1', 0), self._handler_class(origin=i_origin))
+            threading.Thread(target=self._servers[i_origin].serve_forever, daemon=True).start()
+            logging.debug("%s: serving %s at %s.", self, i_origin, self.local_origin(i_origin))
+        return
+
+    def stop(self) -> None:
+        """
+        Stops serving and, when recording, writes the archive.
+        """
+        for i_server in self._servers.values():
+            i_server.shutdown()
+            i_server.server_close()
+        self._servers.clear()
+        if self.mode == 'record':
+            self.save()
+        logging.info("%s stopped. %s", self, self.stats)
+        return
+
+    def save(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+        os.makedirs(os.path.dirname(self.archive_path) or '.', exist_ok=True)
+        with open(self.archive_path, 'w', encoding='utf-8') as f:
+            json.dump({'log': {'version': '1.2', 'creator': {'name': __name__, 'version': '1.0'},
+                               'entries': entries}}, f, indent=1)
+        logging.debug("%s: wrote %d entries to '%s'.", self, len(entries), self.archive_path)
+        return
+
+    # URLs
+
+    def local_origin(self, origin: str) -> str:
+        host, port = self._servers[origin].server_address[:2]
+        return f'http://{host}:{port}'
+
+    def rewrite(self, url: str) -> str:
+        """
+        The local URL serving url, or url itself if its origin isn't served.
+        """
+        parsed_url = urllib.parse.urlsplit(url)
+        origin = f'{parsed_url.scheme}://{parsed_url.netloc}'
+        if origin not in self._servers:
+            return url
+        return self.local_origin(origin) + urllib.parse.urlunsplit(('', '', parsed_url.path or '/',
+                                                                     parsed_url.query, parsed_url.fragment))
+
+    def _rewrite_body(self, body: bytes) -> bytes:
+        text = body.decode('utf-8', errors='surrogateescape')
+        for i_origin in self.origins:
+            local_origin = self.local_origin(i_origin)
+            text = text.replace(i_origin, local_origin)
+            # Protocol-relative, e.g. '//demoqa.com/main.js'.
+            text = text.replace('//' + urllib.parse.urlsplit(i_origin).netloc, '//' + local_origin.split('//', 1)[1])
+        return text.encode('utf-8', errors='surrogateescape')
+
+    # Serving
+
+    def respond(self, origin: str, method: str, path: str) -> Response:
+        url = origin + path
+        with self._lock:
+            entry = self._entries.get(url)
+        if entry is None and self.mode == 'record':
+            entry = self._record(url=url, method=method)
+        if entry is None:
+            with self._lock:
+                self.stats['missing'] += 1
+            logging.warning("%s: %s %s isn't in the archive.", self, method, url)
+            return Response(status=404, headers=[('Content-Type', 'text/plain')], body=b'Not recorded.')
+
+        with self._lock:
+            self.stats['served'] += 1
+        response = self._from_entry(entry)
+        content_type = dict((k.lower(), v) for k, v in response['headers']).get('content-type', '')
+        if any(i in content_type for i in TEXT_TYPES):
+            response['body'] = self._rewrite_body(response['body'])
+        response['headers'] = [(k, self.rewrite(v) if k.lower() == 'location' else v) for k, v in response['headers']]
+        return response
+
+    def _record(self, url: str, method: str) -> Optional[dict]:
+        if method != 'GET':
+            # Only GETs are replayable as they are.
+            return None
+        request = urllib.request.Request(url, headers={'Accept-Encoding': 'identity', 'User-Agent': 'Mozilla/5.0'})
+        try:
+            with self._opener.open(request, timeout=30) as real_response:
+                status, headers, body = real_response.status, real_response.headers, real_response.read()
+        except urllib.error.HTTPError as e:
+            # Errors (and redirects, which aren't followed) are recorded too.
+            status, headers, body = e.code, e.headers, e.read()
+        except urllib.error.URLError as e:
+            logging.warning("%s: couldn't record %s (%s).", self, url, e.reason)
+            return None
+
+        entry = _to_entry(url=url, status=status, headers=list(headers.items()), body=body)
+        with self._lock:
+            self._entries[url] = entry
+            self.stats['recorded'] += 1
+        logging.debug("%s: recorded %s (%d, %d bytes).", self, url, status, len(body))
+        return entry
+
+    def _handler_class(self, origin: str) -> type:
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+                self._handle(send_body=True)
+
+            def do_HEAD(self) -> None:
+                self._handle(send_body=False)
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get('Content-Length', 0))
+                self.rfile.read(length)
+                self._handle(send_body=True)
+
+            def _handle(self, send_body: bool) -> None:
+                response = server.respond(origin=origin, method='GET' if self.command == 'HEAD' else self.command,
+                                          path=self.path)
+                if server.latency:
+                    time.sleep(server.latency)
+                self.send_response(response['status'])
+                for i_name, i_value in response['headers']:
+                    self.send_header(i_name, i_value)
+                self.send_header('Content-Length', str(len(response['body'])))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(response['body'])
+                return
+
+            def log_message(self, format, *args) -> None:
+                return
+
+        return Handler
+
+    # Archive
+
+    def _load_archive(self) -> None:
+        if not os.path.exists(self.archive_path):
+            return
+        with open(self.archive_path, encoding='utf-8') as f:
+            archive = json.load(f)
+        with self._lock:
+            for i_entry in archive['log']['entries']:
+                self._entries[i_entry['request']['url']] = i_entry
+        logging.debug("%s: loaded %d entries from '%s'.", self, len(self._entries), self.archive_path)
+        return
+
+    @staticmethod
+    def _from_entry(entry: dict) -> Response:
+        content = entry['response']['content']
+        if content.get('encoding') == 'base64':
+            body = base64.b64decode(content.get('text', ''))
+        else:
+            body = content.get('text', '').encode('utf-8')
+        return Response(status=entry['response']['status'],
+                        headers=[(i['name'], i['value']) for i in entry['response']['headers']],
+                        body=body)
+
+    def __enter__(self) -> 'FixtureServer':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+        return
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(archive_path='{self.archive_path}', mode='{self.mode}')"
+
+    def __str__(self) -> str:
+        return f"Fixture server ({self.mode})"
+
+
+def _to_entry(url: str, status: int, headers: list[tuple[str, str]], body: bytes) -> dict:
+    # A HAR entry, with the parts replay needs.
+    headers = [(k, v) for k, v in headers if k.lower() not in DROPPED_HEADERS]
+    content_type = dict((k.lower(), v) for k, v in headers).get('content-type', '')
+    content = {'size': len(body), 'mimeType': content_type}
+    text = None
+    if any(i in content_type for i in TEXT_TYPES):
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError:
+            # Mislabeled, or another charset; keep the bytes as they are.
+            pass
+    if text is not None:
+        content['text'] = text
+    else:
+        content['text'] = base64.b64encode(body).decode('ascii')
+        content['encoding'] = 'base64'
+    return {
+        'startedDateTime': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'time': 0,
+        'request': {'method': 'GET', 'url': url, 'httpVersion': 'HTTP/1.1', 'headers': [], 'queryString': [],
+                    'cookies': [], 'headersSize': -1, 'bodySize': 0},
+        'response': {'status': status, 'statusText': '', 'httpVersion': 'HTTP/1.1',
+                     'headers': [{'name': k, 'value': v} for k, v in headers], 'cookies': [], 'content': content,
+                     'redirectURL': dict((k.lower(), v) for k, v in headers).get('location', ''),
+                     'headersSize': -1, 'bodySize': len(body)},
+        'cache': {},
+        'timings': {'send': 0, 'wait': 0, 'receive': 0},
+    }
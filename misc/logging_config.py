@@ -1,5 +1,57 @@
+import atexit
+import collections
 import logging
+import logging.config
+import logging.handlers
 import os
+import queue
+from typing import Optional
+
+# Number of DEBUG records kept in memory per test (see DebugRingBufferHandler).
+DEBUG_BUFFER_SIZE = 5000
+
+
+class DebugRingBufferHandler(logging.Handler):
+    """
+    Keeps the last capacity records in memory instead of writing them out. The
+    test conftest clears it before each test and dumps it to a file only if the
+    test fails, so passing tests cost no debug I/O.
+    """
+
+    def __init__(self, capacity: int = DEBUG_BUFFER_SIZE) -> None:
+        super().__init__()
+        self.capacity = capacity
+        self.records = collections.deque(maxlen=capacity)
+        return
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        return
+
+    def clear(self) -> None:
+        self.acquire()
+        try:
+            self.records.clear()
+        finally:
+            self.release()
+        return
+
+    def dump(self, path: str) -> int:
+        """
+        Writes the buffered records to path, formatted, and returns how many there
+        were.
+        """
+        self.acquire()
+        try:
+            records = list(self.records)
+        finally:
+            self.release()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for i_record in records:
+                f.write(self.format(i_record) + '\n')
+        return len(records)
+
 
 config = {
     'version': 1,
@@ -18,14 +70,11 @@ config = {
             'formatter': 'console',
             'level': logging.WARNING
         },
-        'file_debug': {
-            'class': 'logging.handlers.RotatingFileHandler',
+        'debug_buffer': {
+            '()': DebugRingBufferHandler,
             'formatter': 'default',
             'level': logging.DEBUG,
-            'filename': 'Logs/log_debug.log',
-            'maxBytes': 5*1024*1024,
-            'backupCount': 9,
-            'mode': 'a'
+            'capacity': DEBUG_BUFFER_SIZE,
         },
         'file_info': {
             'class': 'logging.handlers.RotatingFileHandler',
@@ -49,7 +98,7 @@ config = {
     'root': {
         'handlers': [
             'console',
-            'file_debug',
+            'debug_buffer',
             'file_info',
             'file_warning',
         ],
@@ -68,3 +117,156 @@ for key in config['handlers']:
         # Delete log file if it exists (a new one will be created).
         if os.path.isfile(filename):
             os.remove(filename)
+
+# Logging modes; see configure().
+#   'sync': every handler runs in the thread that logs, as dictConfig(config) sets up.
+#   'queue': the root logger only enqueues records; a background thread formats
+#       them and runs the handlers (including file writes and rotation).
+LOGGING_MODES = ['sync', 'queue']
+
+# What a full queue does with a new record.
+#   'drop_oldest': discard the oldest queued record to make room
+#   'drop_newest': discard the new record
+#   'block': wait for room
+OVERFLOW_POLICIES = ['drop_oldest', 'drop_newest', 'block']
+
+_configured = False
+_listener = None
+_queue_handler = None
+_debug_buffer = None
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue, applying an overflow policy when it's full.
+    Records are queued as is: message formatting is left to the listener thread.
+    """
+
+    def __init__(self, queue_: queue.Queue, overflow: str = 'drop_oldest') -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            log_str = f"Invalid overflow policy '{overflow}'. Must be one of {OVERFLOW_POLICIES}."
+            raise ValueError(log_str)
+        super().__init__(queue_)
+        self.overflow = overflow
+        self.dropped = 0
+        return
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so there's no need to format (and
+        #   flatten) the record here, as QueueHandler does by default.
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.overflow == 'block':
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            if self.overflow == 'drop_oldest':
+                try:
+                    self.queue.get_nowait()
+                    self.queue.task_done()
+                except queue.Empty:
+                    pass
+                try:
+                    self.queue.put_nowait(record)
+                except queue.Full:
+                    pass
+        return
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    # QueueListener.stop() enqueues its sentinel with put_nowait(), which raises
+    #   queue.Full if the queue is full at that moment. Wait for room instead;
+    #   the listener thread is still draining it.
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
+        return
+
+
+def configure(mode: str = 'queue', queue_size: int = 10000, overflow: str = 'drop_oldest',
+              debug_buffer_size: int = DEBUG_BUFFER_SIZE) -> None:
+    """
+    Configures the root logger with config, in the given mode (see LOGGING_MODES).
+    DEBUG records go to an in-memory buffer of debug_buffer_size records; see
+    debug_buffer().
+
+    Only the first call does anything, so every test module can call it. Call
+    shutdown() when done to flush the queue.
+    """
+    global _configured, _listener, _queue_handler, _debug_buffer
+    if _configured:
+        return
+    if mode not in LOGGING_MODES:
+        log_str = f"Invalid logging mode '{mode}'. Must be one of {LOGGING_MODES}."
+        raise ValueError(log_str)
+    if debug_buffer_size < 1:
+        log_str = f"Invalid debug buffer size {debug_buffer_size}. Must be at least 1."
+        raise ValueError(log_str)
+
+    config['handlers']['debug_buffer']['capacity'] = debug_buffer_size
+    logging.config.dictConfig(config)
+    _configured = True
+    root = logging.getLogger()
+    for i_handler in root.handlers:
+        if isinstance(i_handler, DebugRingBufferHandler):
+            _debug_buffer = i_handler
+    if mode == 'sync':
+        return
+
+    handlers = list(root.handlers)
+    for i_handler in handlers:
+        root.removeHandler(i_handler)
+    _queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), overflow=overflow)
+    root.addHandler(_queue_handler)
+    _listener = _QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown)
+    return
+
+
+def shutdown() -> None:
+    """
+    Writes out every queued record and stops the listener thread. Records logged
+    afterwards are handled synchronously.
+    """
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+
+    root = logging.getLogger()
+    listener, queue_handler = _listener, _queue_handler
+    _listener = None
+    _queue_handler = None
+    root.removeHandler(queue_handler)
+    try:
+        # stop() handles everything already queued before returning.
+        listener.stop()
+    finally:
+        # Whatever happens, don't leave the root logger without handlers.
+        for i_handler in listener.handlers:
+            root.addHandler(i_handler)
+    if queue_handler.dropped:
+        logging.warning("%d log record(s) were dropped because the logging queue was full.", queue_handler.dropped)
+    return
+
+
+def flush() -> None:
+    """
+    Waits until the listener thread has handled every record queued so far. Does
+    nothing in 'sync' mode.
+    """
+    if _listener is not None:
+        _queue_handler.queue.join()
+    return
+
+
+def debug_buffer() -> Optional[DebugRingBufferHandler]:
+    """
+    The handler holding recent DEBUG records, or None if configure() hasn't been
+    called. Call flush() first so it includes everything logged so far.
+    """
+    return _debug_buffer
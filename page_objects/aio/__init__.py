@@ -0,0 +1,10 @@
+"""
+Asyncio page objects, for driving many browser sessions from one event loop.
+
+    page_objects.aio.http: pooled HTTP/1.1 client for the WebDriver server
+    page_objects.aio.webdriver: AsyncWebDriver and AsyncWebElement
+    page_objects.aio.base: async counterparts of the classes in page_objects.base
+
+The synchronous classes in page_objects.base are unchanged and still run on
+Selenium's WebDriver.
+"""
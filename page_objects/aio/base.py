@@ -0,0 +1,396 @@
+"""
+Async versions of the base classes in page_objects.base.
+
+They work the same way, and share Locator, the _locators tables, the scripts and
+the wait engine, but every method that talks to the browser is a coroutine:
+
+    class Page(page_objects.aio.base.AsyncBasePage):
+        _locators = {'title': Locator(scope='driver', by=By.CSS_SELECTOR, value='h1')}
+
+        async def is_loaded(self) -> bool:
+            return await self.element_exists_and_is_displayed(locator=self._locators['title'])
+
+    await Page(driver, url='https://demoqa.com/text-box').load_page()
+
+Names are never loaded from the DOM; set them when creating the object.
+"""
+
+import abc
+import asyncio
+import logging
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+
+from selenium.common.exceptions import (JavascriptException, NoSuchElementException, StaleElementReferenceException,
+                                        TimeoutException)
+
+import page_objects.base
+import page_objects.blocking
+import page_objects.scripts
+import page_objects.waits
+from page_objects.aio.webdriver import AsyncWebDriver, AsyncWebElement
+from page_objects.base import Locator
+
+
+class AsyncBaseMethods(metaclass=abc.ABCMeta):
+    """Methods used by all async Page Objects"""
+
+    # See page_objects.base.BaseMethods.
+    poll_profile = page_objects.waits.PollProfile()
+    wait_mode = 'poll'
+    _locators: dict[str, Locator] = dict()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._locators = page_objects.base.merge_class_locators(cls)
+        return
+
+    def __init__(self, driver: AsyncWebDriver, element: Optional[AsyncWebElement] = None) -> None:
+        self.driver = driver
+        self.element = element
+        self._locators = page_objects.base.LocatorTable(shared=type(self)._locators)
+        self._name = ''
+        return
+
+    async def element_exists(self, locator: Locator) -> bool:
+        return (await self.probe(locators={'element': locator}))['element']['exists']
+
+    async def element_exists_and_is_displayed(self, locator: Locator) -> bool:
+        return (await self.probe(locators={'element': locator}))['element']['displayed']
+
+    async def find_element(self, locator: Locator) -> AsyncWebElement:
+        locator = Locator.coerce(locator)
+        return await self._scope(locator=locator).find_element(by=locator.by, value=locator.value)
+
+    async def find_elements(self, locator: Locator) -> list[AsyncWebElement]:
+        locator = Locator.coerce(locator)
+        return await self._scope(locator=locator).find_elements(by=locator.by, value=locator.value)
+
+    async def find_many(self, locators: dict[str, Locator]) -> dict[str, AsyncWebElement]:
+        """
+        Finds an element for each of the given locators in a single round trip. See
+        page_objects.base.BaseMethods.find_many().
+        """
+        if not locators:
+            return dict()
+        results = await self.driver.execute_script(page_objects.scripts.FIND_MANY,
+                                                   page_objects.base.locator_args(locators), self.element)
+        elements = dict(zip(locators.keys(), results))
+        page_objects.base.verify_found(owner=self, elements=elements)
+        return elements
+
+    async def probe(self, locators: dict[str, Locator]) -> dict[str, page_objects.base.ElementState]:
+        """
+        Checks which locators match an element, and whether it's displayed, in a
+        single round trip. See page_objects.base.BaseMethods.probe().
+        """
+        if not locators:
+            return dict()
+        results = await self.driver.execute_script(page_objects.scripts.PROBE,
+                                                   page_objects.base.locator_args(locators), self.element)
+        return page_objects.base.probe_states(locators=locators, results=results)
+
+    def _scope(self, locator: Locator):
+        if locator.scope == 'driver':
+            return self.driver
+        elif locator.scope == 'element':
+            return self.element
+        else:
+            log_str = f"Unhandled exception in ._scope(). scope={locator.scope}"
+            logging.error(log_str)
+            raise Exception(log_str)
+
+    async def _wait_for(self, condition: Callable[[], Awaitable[bool]], timeout: float,
+                        profile: Optional[page_objects.waits.PollProfile] = None,
+                        dom_condition: Optional[page_objects.waits.DomCondition] = None,
+                        mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        """
+        See page_objects.base.BaseMethods._wait_for().
+        """
+        mode = (mode or self.wait_mode).lower()
+        page_objects.base.BaseMethods._verify_wait_mode(mode=mode)
+        if mode == 'observe':
+            if dom_condition is not None:
+                return await self._observe(condition=dom_condition, timeout=timeout)
+            logging.debug("No DOM condition declared for %s; polling instead.", self)
+
+        return await page_objects.waits.wait_for_async(condition=condition,
+                                                       timeout=timeout,
+                                                       profile=profile or self.poll_profile,
+                                                       ignored_exceptions=page_objects.base.WAIT_IGNORED_EXCEPTIONS)
+
+    async def _observe(self, condition: page_objects.waits.DomCondition,
+                       timeout: float) -> page_objects.waits.WaitResult:
+        script_args = page_objects.base.observe_args(owner=self, condition=condition)
+        start_time = time.monotonic()
+        try:
+            response = await self.driver.execute_async_script(page_objects.scripts.WAIT_FOR_CONDITION,
+                                                              script_args,
+                                                              self.element,
+                                                              int(timeout * 1000))
+        except TimeoutException:
+            response = {'satisfied': False}
+        return page_objects.base.script_wait_result(response=response, key='satisfied', start_time=start_time)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the page object, used in logs. Unlike the sync classes, it's never
+        loaded from the DOM.
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        return
+
+    def __repr__(self) -> str:
+        return f'{self.__class__}'
+
+    def __str__(self) -> str:
+        return self._name or f'<{self.__class__.__name__}>'
+
+
+class AsyncBaseLoadingMethods(AsyncBaseMethods, metaclass=abc.ABCMeta):
+    """Methods used by async Page Objects which have a loading state."""
+
+    poll_profile = page_objects.waits.PollProfile(initial_delay=0.1, backoff=1.5, max_delay=0.5)
+    loaded_condition: Optional[page_objects.waits.DomCondition] = None
+
+    @abc.abstractmethod
+    async def is_loaded(self) -> bool:
+        """Criteria to determine when the element is deemed loaded"""
+        pass
+
+    async def wait_until_loaded(self, timeout: float = 5.0, must_load: bool = True,
+                                profile: Optional[page_objects.waits.PollProfile] = None,
+                                mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        result = await self._wait_for(condition=self.is_loaded, timeout=timeout, profile=profile,
+                                      dom_condition=self.loaded_condition, mode=mode)
+        if result.satisfied:
+            logging.debug("'%s' loaded after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        elif must_load is True:
+            log_str = f"'{self}' did not load."
+            logging.error(log_str)
+            raise TimeoutError(log_str)
+        return result
+
+
+class AsyncBasePage(AsyncBaseLoadingMethods, metaclass=abc.ABCMeta):
+
+    # See page_objects.base.BasePage.
+    load_mode = 'normal'
+    network_idle = 0.0
+    load_timeout = 30.0
+    request_blocking: Optional[page_objects.blocking.RequestBlocking] = None
+
+    def __init__(self, driver: AsyncWebDriver, url: str = None) -> None:
+        super().__init__(driver=driver)
+        self._url = url
+        return
+
+    @property
+    def url(self) -> Optional[str]:
+        return page_objects.base.rewrite_url(self._url) if self._url else self._url
+
+    async def load_page(self, mode: Optional[str] = None) -> None:
+        """
+        Navigates to the page and waits until it's loaded. See
+        page_objects.base.BasePage.load_page().
+        """
+        if not self._url:
+            log_str = 'No URL was specified when this object was created.'
+            logging.error(log_str)
+            raise ValueError(log_str)
+        plan = page_objects.base.load_plan(page_class=type(self), mode=(mode or self.load_mode).lower(),
+                                           strategy=self.driver.capabilities.get('pageLoadStrategy'))
+
+        logging.debug("Navigating to %s ('%s')...", self, plan.mode)
+        blocked = await page_objects.blocking.apply_async(driver=self.driver, blocking=self.request_blocking)
+        start_time = time.monotonic()
+        loaded = False
+        try:
+            marker = ''
+            if plan.mark:
+                marker = uuid.uuid4().hex
+                current_url = await self.driver.execute_script(page_objects.scripts.MARK_NAVIGATION, marker)
+                if page_objects.base.is_same_document(current_url=current_url, url=self.url):
+                    marker = ''
+            await self.driver.get(url=self.url)
+            if marker or plan.ready_state or self.network_idle:
+                await self._wait_until_ready(marker=marker, ready_state=plan.ready_state)
+            await self.wait_until_loaded()
+            loaded = True
+        finally:
+            page_objects.base.record_load_timing(page_class=type(self), mode=plan.mode,
+                                                  elapsed=time.monotonic() - start_time, loaded=loaded)
+        if self.request_blocking is not None and page_objects.blocking.measure_usage:
+            await page_objects.blocking.record_usage_async(driver=self.driver, page_class=type(self), blocked=blocked)
+        return
+
+    async def _wait_until_ready(self, marker: str, ready_state: Optional[str]) -> None:
+        # See page_objects.base.BasePage._wait_until_ready().
+        deadline = time.monotonic() + self.load_timeout
+
+        async def is_ready() -> bool:
+            timeout_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            try:
+                response = await self.driver.execute_async_script(page_objects.scripts.READINESS, marker, ready_state,
+                                                                  int(self.network_idle * 1000), timeout_ms)
+            except TimeoutException:
+                return False
+            return bool(response['navigated'] and response['ready'])
+
+        result = await page_objects.waits.wait_for_async(
+            condition=is_ready,
+            timeout=self.load_timeout,
+            profile=self.poll_profile,
+            ignored_exceptions=page_objects.base.WAIT_IGNORED_EXCEPTIONS + (JavascriptException,))
+        if not result.satisfied:
+            log_str = f"'{self}' was not ready within {self.load_timeout}s."
+            logging.error(log_str)
+            raise TimeoutError(log_str)
+        logging.debug("'%s' ready after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        return
+
+
+class AsyncBaseElement(AsyncBaseMethods):
+
+    # See page_objects.base.BaseElement.
+    settle_policy = 'scroll_end'
+    settle_quiet_period = 0.1
+    settle_timeout = 2.0
+
+    def __init__(self, element: AsyncWebElement) -> None:
+        super().__init__(driver=element.parent, element=element)
+        return
+
+    @property
+    def element_to_click(self) -> AsyncWebElement:
+        return self.element
+
+    async def click(self, scroll_into_view: bool = False, scroll_align_top: bool = True,
+                    settle: Optional[str] = None) -> None:
+        """
+        Clicks the element. See page_objects.base.BaseElement.click().
+        """
+        policy = (settle or self.settle_policy).lower()
+        page_objects.base.verify_settle_policy(policy=policy)
+
+        if scroll_into_view:
+            logging.debug("Scrolling %s into view...", self)
+            await self.driver.execute_script(f"arguments[0].scrollIntoView({str(scroll_align_top).lower()});",
+                                             self.element_to_click)
+            await self.settle(policy=policy if policy in ['none', 'legacy'] else 'scroll_end')
+
+        if policy == 'idle':
+            await self.driver.execute_script(page_objects.scripts.INSTALL_REQUEST_TRACKER)
+        logging.info("Clicking %s...", self)
+        await self.element_to_click.click()
+        await self.settle(policy=policy)
+        return
+
+    async def settle(self, policy: Optional[str] = None) -> page_objects.waits.WaitResult:
+        """
+        Waits until the page is quiescent. See page_objects.base.BaseElement.settle().
+        """
+        policy = (policy or self.settle_policy).lower()
+        page_objects.base.verify_settle_policy(policy=policy)
+
+        if policy == 'none':
+            return page_objects.waits.WaitResult(satisfied=True, elapsed=0.0, polls=0)
+        if policy == 'legacy':
+            await asyncio.sleep(0.5)
+            return page_objects.waits.WaitResult(satisfied=True, elapsed=0.5, polls=0)
+
+        start_time = time.monotonic()
+        try:
+            response = await self.driver.execute_async_script(page_objects.scripts.SETTLE,
+                                                              *page_objects.base.settle_args(owner=self, policy=policy))
+        except (NoSuchElementException, StaleElementReferenceException, TimeoutException):
+            response = {'settled': False}
+        result = page_objects.base.script_wait_result(response=response, key='settled', start_time=start_time)
+        if not result.satisfied:
+            logging.debug("Page did not settle ('%s') within %ss after acting on %s.", policy, self.settle_timeout, self)
+        return result
+
+
+class AsyncBaseLoadingElement(AsyncBaseLoadingMethods, AsyncBaseElement, metaclass=abc.ABCMeta):
+    pass
+
+
+class AsyncBaseOpenCloseElement(AsyncBaseElement, metaclass=abc.ABCMeta):
+    """
+    Used for an element that has an opened/closed state. See
+    page_objects.base.BaseOpenCloseElement.
+    """
+
+    poll_profile = page_objects.base.BaseOpenCloseElement.poll_profile
+    open_condition: Optional[page_objects.waits.DomCondition] = None
+    closed_condition: Optional[page_objects.waits.DomCondition] = None
+
+    @abc.abstractmethod
+    async def is_closed(self) -> bool:
+        """Criteria to determine if the element is deemed closed."""
+        pass
+
+    @abc.abstractmethod
+    async def is_open(self) -> bool:
+        """Criteria to determine if the element is deemed open."""
+        pass
+
+    async def close(self) -> None:
+        raise NotImplementedError
+
+    async def open(self) -> None:
+        raise NotImplementedError
+
+    async def wait_until_closed(self, timeout: float = 5.0, must_close: bool = True,
+                                profile: Optional[page_objects.waits.PollProfile] = None,
+                                mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        result = await self._wait_for(condition=self.is_closed, timeout=timeout, profile=profile,
+                                      dom_condition=self.closed_condition, mode=mode)
+        if result.satisfied:
+            logging.debug("'%s' closed after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        elif must_close is True:
+            log_str = f"'{self}' did not close."
+            logging.error(log_str)
+            raise TimeoutError(log_str)
+        return result
+
+    async def wait_until_open(self, timeout: float = 5.0, must_open: bool = True,
+                              profile: Optional[page_objects.waits.PollProfile] = None,
+                              mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        result = await self._wait_for(condition=self.is_open, timeout=timeout, profile=profile,
+                                      dom_condition=self.open_condition, mode=mode)
+        if result.satisfied:
+            logging.debug("'%s' opened after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        elif must_open is True:
+            log_str = f"'{self}' did not open."
+            logging.error(log_str)
+            raise TimeoutError(log_str)
+        return result
+
+    async def collapse(self) -> None:
+        await self.close()
+        return
+
+    async def expand(self) -> None:
+        await self.open()
+        return
+
+    async def is_collapsed(self) -> bool:
+        return await self.is_closed()
+
+    async def is_expanded(self) -> bool:
+        return await self.is_open()
+
+    async def wait_until_collapsed(self, timeout: float = 5.0,
+                                   must_collapse: bool = True) -> page_objects.waits.WaitResult:
+        return await self.wait_until_closed(timeout=timeout, must_close=must_collapse)
+
+    async def wait_until_expanded(self, timeout: float = 5.0,
+                                  must_expand: bool = True) -> page_objects.waits.WaitResult:
+        return await self.wait_until_open(timeout=timeout, must_open=must_expand)
@@ -0,0 +1,132 @@
+"""
+A minimal asyncio HTTP/1.1 client for talking to a WebDriver server.
+
+WebDriver servers (chromedriver, geckodriver, Selenium Grid) speak plain JSON
+over HTTP/1.1, so the standard library's asyncio streams are enough. Connections
+are kept alive and reused. Many sessions can share one ConnectionPool, and
+max_connections caps how many requests are in flight at once.
+"""
+
+import asyncio
+import logging
+import ssl
+import urllib.parse
+from typing import Optional
+
+
+class ConnectionPool:
+    """
+    url: base URL of the WebDriver server, e.g. 'http://localhost:9515'
+    max_connections: max number of requests in flight at once
+    timeout: seconds to wait for each response
+    """
+
+    def __init__(self, url: str, max_connections: int = 32, timeout: float = 120.0) -> None:
+        parsed_url = urllib.parse.urlsplit(url)
+        if parsed_url.scheme not in ['http', 'https']:
+            log_str = f"Invalid WebDriver server URL '{url}'. Must be http or https."
+            logging.error(log_str)
+            raise ValueError(log_str)
+
+        self.url = url
+        self.host = parsed_url.hostname
+        self.port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
+        self.base_path = parsed_url.path.rstrip('/')
+        self.ssl_context = ssl.create_default_context() if parsed_url.scheme == 'https' else None
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._idle: list[tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        return
+
+    async def request(self, method: str, path: str, body: Optional[bytes] = None) -> tuple[int, bytes]:
+        """
+        Sends a request and returns (status code, response body).
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+
+        async with self._semaphore:
+            while True:
+                reader, writer, reused = await self._connect()
+                try:
+                    status, keep_alive, data = await asyncio.wait_for(
+                        self._exchange(reader=reader, writer=writer, method=method, path=path, body=body),
+                        timeout=self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    writer.close()
+                    if reused:
+                        # The server closed an idle keep-alive connection; retry on a new one.
+                        logging.debug("Kept-alive connection to %s was closed. Reconnecting...", self.url)
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, data
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+        return
+
+    async def _connect(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.open_connection(host=self.host, port=self.port, ssl=self.ssl_context)
+        return reader, writer, False
+
+    async def _exchange(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                        method: str, path: str, body: Optional[bytes]) -> tuple[int, bool, bytes]:
+        headers = [f"{method} {self.base_path}{path} HTTP/1.1",
+                   f"Host: {self.host}:{self.port}",
+                   "Accept: application/json",
+                   "Connection: keep-alive"]
+        if body is not None:
+            headers.append("Content-Type: application/json;charset=UTF-8")
+            headers.append(f"Content-Length: {len(body)}")
+        writer.write(('\r\n'.join(headers) + '\r\n\r\n').encode('ascii') + (body or b''))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError(f"{self.url} closed the connection.")
+        status = int(status_line.split()[1])
+
+        response_headers = dict()
+        while True:
+            line = await reader.readline()
+            if line in [b'\r\n', b'\n', b'']:
+                break
+            key, _, value = line.decode('latin-1').partition(':')
+            response_headers[key.strip().lower()] = value.strip()
+
+        keep_alive = response_headers.get('connection', '').lower() != 'close'
+        if response_headers.get('transfer-encoding', '').lower() == 'chunked':
+            data = b''
+            while True:
+                size = int((await reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    # Skip trailers.
+                    while (await reader.readline()) not in [b'\r\n', b'\n', b'']:
+                        pass
+                    break
+                data += await reader.readexactly(size)
+                await reader.readexactly(2)
+        elif 'content-length' in response_headers:
+            data = await reader.readexactly(int(response_headers['content-length']))
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return status, keep_alive, data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(url='{self.url}', max_connections={self.max_connections})"
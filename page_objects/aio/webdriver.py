@@ -0,0 +1,264 @@
+"""
+Awaitable counterparts of Selenium's WebDriver and WebElement.
+
+Commands, error handling, locator strategies and the getAttribute/isDisplayed
+atoms are Selenium's own, so an AsyncWebDriver behaves like a WebDriver; only the
+transport (page_objects.aio.http) is different. Only the commands the page
+objects need are wrapped. Anything else can be sent with execute(), e.g.
+    await driver.execute(Command.GET_WINDOW_HANDLES)
+
+Selenium properties become coroutines, e.g. `await driver.current_url()` and
+`await element.text()`.
+"""
+
+import json
+import logging
+import pkgutil
+import string
+from typing import Any, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.utils import keys_to_typing
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+from selenium.webdriver.remote.remote_connection import remote_commands
+
+from page_objects.aio.http import ConnectionPool
+
+ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+# Vendor commands, in addition to Selenium's remote_commands: those chromedriver
+#   (and other Chromium drivers) add, as Selenium's ChromiumRemoteConnection does.
+CHROMIUM_COMMANDS = {
+    'executeCdpCommand': ('POST', '/session/$sessionId/goog/cdp/execute'),
+}
+
+# The same atoms Selenium's WebElement.get_attribute() and is_displayed() run.
+GET_ATTRIBUTE_ATOM = pkgutil.get_data('selenium.webdriver.remote', 'getAttribute.js').decode('utf8')
+IS_DISPLAYED_ATOM = pkgutil.get_data('selenium.webdriver.remote', 'isDisplayed.js').decode('utf8')
+
+
+class AsyncWebDriver:
+    """
+    One WebDriver session. Create with start(), end with quit():
+        driver = await AsyncWebDriver.start('http://localhost:9515', {'browserName': 'chrome'})
+        await driver.get('https://demoqa.com/text-box')
+        await driver.quit()
+
+    Pass the same ConnectionPool to several sessions so they share connections.
+    """
+
+    def __init__(self, http: ConnectionPool, session_id: str, capabilities: dict, owns_http: bool = False) -> None:
+        self.http = http
+        self.session_id = session_id
+        self.capabilities = capabilities
+        self.error_handler = ErrorHandler()
+        self.locator_converter = LocatorConverter()
+        self._owns_http = owns_http
+        return
+
+    @classmethod
+    async def start(cls, url: str = 'http://localhost:9515', capabilities: Optional[dict] = None,
+                    http: Optional[ConnectionPool] = None) -> 'AsyncWebDriver':
+        """
+        Starts a new session on the WebDriver server at url (ignored if a shared
+        http pool is given).
+        """
+        owns_http = http is None
+        if http is None:
+            http = ConnectionPool(url=url)
+        params = {'capabilities': {'firstMatch': [dict()], 'alwaysMatch': capabilities or {'browserName': 'chrome'}}}
+        response = await cls._send(http=http, error_handler=ErrorHandler(), command=Command.NEW_SESSION, params=params)
+        driver = cls(http=http, session_id=response['sessionId'], capabilities=response.get('capabilities', dict()),
+                     owns_http=owns_http)
+        logging.debug("Started %s.", driver)
+        return driver
+
+    async def execute(self, command: str, params: Optional[dict] = None) -> Any:
+        """
+        Sends a Selenium Command (see selenium.webdriver.remote.command) and
+        returns its value, with element references converted to AsyncWebElements.
+        """
+        params = self._wrap(dict(params or dict()))
+        params['sessionId'] = self.session_id
+        value = await self._send(http=self.http, error_handler=self.error_handler, command=command, params=params)
+        return self._unwrap(value)
+
+    @staticmethod
+    async def _send(http: ConnectionPool, error_handler: ErrorHandler, command: str, params: dict) -> Any:
+        method, path_template = remote_commands.get(command) or CHROMIUM_COMMANDS[command]
+        path = string.Template(path_template).substitute(params)
+        body = None
+        if method == 'POST':
+            body = json.dumps({key: value for key, value in params.items() if key != 'sessionId'}).encode('utf-8')
+
+        status, data = await http.request(method=method, path=path, body=body)
+        text = data.decode('utf-8')
+        if status >= 300:
+            # Raises the same exception Selenium would (NoSuchElementException, etc.).
+            error_handler.check_response({'status': status, 'value': text})
+        response = json.loads(text) if text else dict()
+        value = response.get('value')
+        if isinstance(value, dict) and 'error' in value:
+            error_handler.check_response({'status': status, 'value': text})
+        return value
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, dict):
+            return {key: self._wrap(val) for key, val in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(i) for i in value]
+        return value
+
+    def _unwrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(parent=self, id_=value[ELEMENT_KEY])
+            return {key: self._unwrap(val) for key, val in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(i) for i in value]
+        return value
+
+    # Session
+
+    async def quit(self) -> None:
+        try:
+            await self.execute(Command.QUIT)
+        finally:
+            if self._owns_http:
+                await self.http.close()
+        logging.debug("Quit %s.", self)
+        return
+
+    async def set_window_size(self, width: int, height: int) -> None:
+        await self.execute(Command.SET_WINDOW_RECT, {'width': width, 'height': height})
+        return
+
+    async def set_script_timeout(self, seconds: float) -> None:
+        await self.execute(Command.SET_TIMEOUTS, {'script': int(seconds * 1000)})
+        return
+
+    async def delete_all_cookies(self) -> None:
+        await self.execute(Command.DELETE_ALL_COOKIES)
+        return
+
+    # Navigation
+
+    async def get(self, url: str) -> None:
+        await self.execute(Command.GET, {'url': url})
+        return
+
+    async def current_url(self) -> str:
+        return await self.execute(Command.GET_CURRENT_URL)
+
+    async def title(self) -> str:
+        return await self.execute(Command.GET_TITLE)
+
+    # Elements
+
+    async def find_element(self, by: str = By.ID, value: Optional[str] = None) -> 'AsyncWebElement':
+        by, value = self.locator_converter.convert(by, value)
+        return await self.execute(Command.FIND_ELEMENT, {'using': by, 'value': value})
+
+    async def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> list['AsyncWebElement']:
+        by, value = self.locator_converter.convert(by, value)
+        return await self.execute(Command.FIND_ELEMENTS, {'using': by, 'value': value}) or []
+
+    # Scripts
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.execute(Command.W3C_EXECUTE_SCRIPT, {'script': script, 'args': list(args)})
+
+    async def execute_async_script(self, script: str, *args) -> Any:
+        return await self.execute(Command.W3C_EXECUTE_SCRIPT_ASYNC, {'script': script, 'args': list(args)})
+
+    async def execute_cdp_cmd(self, cmd: str, cmd_args: dict) -> Any:
+        """
+        Sends a Chrome DevTools Protocol command. Chromium-based browsers only.
+        """
+        return await self.execute('executeCdpCommand', {'cmd': cmd, 'params': cmd_args})
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(session_id='{self.session_id}')"
+
+
+class AsyncWebElement:
+    """
+    A reference to an element in an AsyncWebDriver session. parent is the driver,
+    as with Selenium's WebElement.
+    """
+
+    def __init__(self, parent: AsyncWebDriver, id_: str) -> None:
+        self.parent = parent
+        self.id = id_
+        return
+
+    async def _execute(self, command: str, params: Optional[dict] = None) -> Any:
+        params = dict(params or dict())
+        params['id'] = self.id
+        return await self.parent.execute(command, params)
+
+    # State
+
+    async def text(self) -> str:
+        return await self._execute(Command.GET_ELEMENT_TEXT)
+
+    async def tag_name(self) -> str:
+        return await self._execute(Command.GET_ELEMENT_TAG_NAME)
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return await self.parent.execute_script(f"/* getAttribute */return ({GET_ATTRIBUTE_ATOM}).apply(null, arguments);",
+                                                self, name)
+
+    async def get_dom_attribute(self, name: str) -> Optional[str]:
+        return await self._execute(Command.GET_ELEMENT_ATTRIBUTE, {'name': name})
+
+    async def get_property(self, name: str) -> Any:
+        return await self._execute(Command.GET_ELEMENT_PROPERTY, {'name': name})
+
+    async def is_displayed(self) -> bool:
+        return await self.parent.execute_script(f"/* isDisplayed */return ({IS_DISPLAYED_ATOM}).apply(null, arguments);",
+                                                self)
+
+    async def is_enabled(self) -> bool:
+        return await self._execute(Command.IS_ELEMENT_ENABLED)
+
+    async def is_selected(self) -> bool:
+        return await self._execute(Command.IS_ELEMENT_SELECTED)
+
+    # Actions
+
+    async def click(self) -> None:
+        await self._execute(Command.CLICK_ELEMENT)
+        return
+
+    async def clear(self) -> None:
+        await self._execute(Command.CLEAR_ELEMENT)
+        return
+
+    async def send_keys(self, *value: str) -> None:
+        typing = keys_to_typing(value)
+        await self._execute(Command.SEND_KEYS_TO_ELEMENT, {'text': ''.join(typing), 'value': typing})
+        return
+
+    # Elements
+
+    async def find_element(self, by: str = By.ID, value: Optional[str] = None) -> 'AsyncWebElement':
+        by, value = self.parent.locator_converter.convert(by, value)
+        return await self._execute(Command.FIND_CHILD_ELEMENT, {'using': by, 'value': value})
+
+    async def find_elements(self, by: str = By.ID, value: Optional[str] = None) -> list['AsyncWebElement']:
+        by, value = self.parent.locator_converter.convert(by, value)
+        return await self._execute(Command.FIND_CHILD_ELEMENTS, {'using': by, 'value': value}) or []
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AsyncWebElement) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(session_id='{self.parent.session_id}', id='{self.id}')"
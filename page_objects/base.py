@@ -8,17 +8,28 @@ Your page objects must subclass one of the following:
 """
 
 import abc
+import copy
+import functools
+import inspect
 import logging
 import time
-from typing import Optional, TypedDict
+import urllib.parse
+import uuid
+from collections.abc import MutableMapping
+from typing import Any, Callable, NamedTuple, Optional, TypedDict, Union
 
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import (JavascriptException, NoSuchElementException, StaleElementReferenceException,
+                                        TimeoutException, WebDriverException)
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
+import page_objects.blocking
+import page_objects.scripts
+import page_objects.waits
 
-class Locator(TypedDict):
+
+class Locator:
     """
     Locators used to find elements.
 
@@ -35,143 +46,1017 @@ class Locator(TypedDict):
 
     So we really need a third argument to provide the scope of the search:
         'scope': 'driver' or 'element'
+
+    Locators are validated once, when they're created, and are immutable and
+    hashable. Declare them in a class-level _locators table so all instances
+    share them:
+        class Page(page_objects.base.BasePage):
+            _locators = {'title': Locator(scope='driver', by=By.CSS_SELECTOR, value='h1')}
+
+    Plain dicts with the same keys (the old style) are still accepted anywhere a
+    Locator is; see coerce(). Locators also support dict-style reads, e.g.
+    locator['scope'].
+    """
+    __slots__ = ('scope', 'by', 'value', '_hash')
+
+    def __init__(self, scope: str, by: str, value: str) -> None:
+        self.verify_scope(scope=scope)
+        object.__setattr__(self, 'scope', scope.lower())
+        object.__setattr__(self, 'by', by)
+        object.__setattr__(self, 'value', value)
+        object.__setattr__(self, '_hash', hash((self.scope, by, value)))
+        return
+
+    @classmethod
+    def coerce(cls, locator: Union['Locator', dict]) -> 'Locator':
+        """
+        Returns locator as a Locator. Dict-style locators are converted.
+        """
+        if isinstance(locator, Locator):
+            return locator
+        return cls(scope=locator['scope'], by=locator['by'], value=locator['value'])
+
+    @staticmethod
+    def verify_scope(scope: str) -> None:
+        log_str = f"Invalid scope param value '{scope}'. Must be one of ['driver', 'element']."
+
+        if not scope:
+            logging.error(log_str)
+            raise TypeError(log_str)
+
+        scope = scope.lower()
+        if scope not in ['driver', 'element']:
+            logging.error(log_str)
+            raise ValueError(log_str)
+
+    def __getitem__(self, key: str) -> str:
+        if key not in ['scope', 'by', 'value']:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setattr__(self, key, value) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __delattr__(self, key) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    # Immutable, so copies can be the Locator itself. Pickling goes through
+    #   __init__, since __setattr__ would refuse to restore the slots.
+
+    def __copy__(self) -> 'Locator':
+        return self
+
+    def __deepcopy__(self, memo: dict) -> 'Locator':
+        return self
+
+    def __reduce__(self) -> tuple:
+        return Locator, (self.scope, self.by, self.value)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Locator):
+            return NotImplemented
+        return (self.scope, self.by, self.value) == (other.scope, other.by, other.value)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"Locator(scope='{self.scope}', by='{self.by}', value='{self.value}')"
+
+
+class LocatorTable(MutableMapping):
+    """
+    A page object's locators.
+
+    Reads fall through to the class-level table shared by all instances of the
+    class. Locators assigned on an instance (e.g. the old style of filling
+    self._locators in __init__()) only affect that instance, and are converted to
+    Locators as they're assigned.
+    """
+    __slots__ = ('_shared', '_own')
+
+    def __init__(self, shared: dict[str, Locator]) -> None:
+        self._shared = shared
+        self._own = None
+        return
+
+    def __getitem__(self, key: str) -> Locator:
+        if self._own is not None and key in self._own:
+            return self._own[key]
+        return self._shared[key]
+
+    def __setitem__(self, key: str, locator: Union[Locator, dict]) -> None:
+        if self._own is None:
+            self._own = dict()
+        self._own[key] = Locator.coerce(locator)
+        return
+
+    def __delitem__(self, key: str) -> None:
+        if self._own is None or key not in self._own:
+            log_str = f"Locator '{key}' is declared on the class and can't be deleted from an instance."
+            logging.error(log_str)
+            raise KeyError(log_str)
+        del self._own[key]
+        return
+
+    def __iter__(self):
+        yield from self._shared
+        if self._own is not None:
+            for key in self._own:
+                if key not in self._shared:
+                    yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# Raised by is_loaded()/is_open()/is_closed() while the DOM is still changing.
+#   The wait methods treat them as "not yet".
+WAIT_IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+def merge_class_locators(cls: type) -> dict[str, Locator]:
+    """
+    Returns cls's _locators table merged over its bases' tables, with dict-style
+    locators coerced to Locators.
+    """
+    locators = dict()
+    for i_base in reversed(cls.__bases__):
+        locators.update(getattr(i_base, '_locators', dict()))
+    for key, locator in cls.__dict__.get('_locators', dict()).items():
+        locators[key] = Locator.coerce(locator)
+    return locators
+
+
+# How long BasePage.load_page() waits for the browser before checking is_loaded().
+#   'normal': until the page (including every image, script and iframe) has
+#       loaded (document.readyState 'complete')
+#   'eager': until the DOM is parsed (document.readyState 'interactive')
+#   'none': only until the new document has replaced the old one
+#   load_page() navigates with driver.get(), which returns as the session's page
+#   load strategy (also one of these) says; it's set when the session starts (see
+#   misc.driver_factory). If the strategy waits less than the mode, load_page()
+#   waits for the rest in the browser. If it waits more, the mode can't take
+#   effect, and the page loads as the strategy says.
+#   In every mode, the page object's is_loaded() criteria must also be met.
+LOAD_MODES = ['normal', 'eager', 'none']
+
+# document.readyState each load mode waits for.
+_LOAD_MODE_READY_STATES = {'normal': 'complete', 'eager': 'interactive', 'none': None}
+
+
+class LoadPlan(NamedTuple):
+    """
+    How load_page() loads a page, given its load mode and the session's page load
+    strategy.
+
+    mode: the load mode that takes effect
+    mark: whether to leave a navigation marker on the old document first, to tell
+        when it's been replaced (driver.get() doesn't wait for that with 'none')
+    ready_state: document.readyState to wait for after driver.get() returns, or
+        None if driver.get() already waited for it
+    """
+    mode: str
+    mark: bool
+    ready_state: Optional[str]
+
+
+# (page class, load mode, page load strategy) already warned about; see load_plan().
+_load_mode_warnings: set[tuple[type, str, str]] = set()
+
+
+def load_plan(page_class: type, mode: str, strategy: Optional[str]) -> LoadPlan:
+    """
+    How to load a page of page_class in the given load mode, in a session with the
+    given page load strategy (None for the W3C default, 'normal').
+    """
+    if mode not in LOAD_MODES:
+        log_str = f"Invalid load mode '{mode}'. Must be one of {LOAD_MODES}."
+        logging.error(log_str)
+        raise ValueError(log_str)
+    strategy = strategy or 'normal'
+    if strategy not in LOAD_MODES:
+        log_str = f"Invalid page load strategy '{strategy}'. Must be one of {LOAD_MODES}."
+        logging.error(log_str)
+        raise ValueError(log_str)
+
+    if LOAD_MODES.index(strategy) < LOAD_MODES.index(mode):
+        if (page_class, mode, strategy) not in _load_mode_warnings:
+            _load_mode_warnings.add((page_class, mode, strategy))
+            logging.warning("%s: load mode '%s' has no effect with the session's '%s' page load strategy; loading "
+                            "as '%s'.", page_class.__qualname__, mode, strategy, strategy)
+        mode = strategy
+    ready_state = _LOAD_MODE_READY_STATES[mode] if mode != strategy else None
+    return LoadPlan(mode=mode, mark=strategy == 'none', ready_state=ready_state)
+
+
+def is_same_document(current_url: str, url: str) -> bool:
+    """
+    Whether navigating from current_url to url only changes the fragment, which
+    scrolls the current document instead of loading a new one.
+    """
+    return '#' in url and urllib.parse.urldefrag(current_url)[0] == urllib.parse.urldefrag(url)[0]
+
+
+class LoadTimingStats(TypedDict):
+    count: int
+    failures: int
+    total: float
+    min: float
+    max: float
+
+
+# Time taken by load_page(), by page class and load mode; see load_timings().
+_load_timings: dict[str, dict[str, LoadTimingStats]] = dict()
+
+
+def load_timings() -> dict[str, dict[str, LoadTimingStats]]:
+    """
+    Time taken by every load_page() call so far, e.g.
+        {'examples.tools_qa.page_objects.elements.text_box.Page': {
+            'normal': {'count': 3, 'failures': 0, 'total': 7.2, 'min': 2.1, 'max': 2.8},
+            'eager': {'count': 3, 'failures': 0, 'total': 2.7, 'min': 0.8, 'max': 1.0}}}
+
+    Failed loads are counted in failures, not in the times.
+    """
+    return copy.deepcopy(_load_timings)
+
+
+def record_load_timing(page_class: type, mode: str, elapsed: float, loaded: bool) -> None:
+    """
+    Adds a load_page() call to load_timings().
+    """
+    by_mode = _load_timings.setdefault(f'{page_class.__module__}.{page_class.__qualname__}', dict())
+    stats = by_mode.setdefault(mode, LoadTimingStats(count=0, failures=0, total=0.0, min=0.0, max=0.0))
+    if not loaded:
+        stats['failures'] += 1
+        return
+    stats['min'] = elapsed if stats['count'] == 0 else min(stats['min'], elapsed)
+    stats['max'] = max(stats['max'], elapsed)
+    stats['count'] += 1
+    stats['total'] += elapsed
+    return
+
+
+# Applied to page URLs before load_page() navigates; see set_url_rewrite().
+_url_rewrite: Optional[Callable[[str], str]] = None
+
+
+def set_url_rewrite(rewrite: Optional[Callable[[str], str]]) -> None:
+    """
+    Makes every page load (and is_current_page() compare against) rewrite(url)
+    instead of its own URL, e.g. to serve the pages from a local fixture server
+    (see misc.fixture_server). None turns rewriting off.
+    """
+    global _url_rewrite
+    _url_rewrite = rewrite
+    return
+
+
+def rewrite_url(url: str) -> str:
+    return url if _url_rewrite is None else _url_rewrite(url)
+
+
+# What a Field reads from its element.
+#   'text': rendered text, as WebElement.text
+#   'value': the value property, e.g. of an <input>
+#   'attribute': the attribute given by the field's name
+#   'displayed': whether it's displayed
+#   'exists': whether it exists
+FIELD_READS = ['text', 'value', 'attribute', 'displayed', 'exists']
+
+
+class Field(NamedTuple):
+    """
+    A value read by BasePage.snapshot_fields().
+
+    locator: a key of the page object's _locators, or a Locator
+    read: one of FIELD_READS
+    name: attribute name, for 'attribute'
+
+    e.g. the text of the page title, and the href of a link:
+        Field(locator='title', read='text')
+        Field(locator='home_link', read='attribute', name='href')
+    """
+    locator: Union[str, Locator]
+    read: str
+    name: str = ''
+
+
+class ElementState(TypedDict):
+    """
+    Whether a locator matches an element, and whether that element is displayed,
+    as returned by BaseMethods.probe().
+    """
+    exists: bool
+    displayed: bool
+
+
+class ElementCacheStats(TypedDict):
+    hits: int
+    misses: int
+    size: int
+
+
+class ElementCacheTotals(TypedDict):
+    """
+    Element cache lookups of all instances of a page class. Each hit is a round
+    trip saved.
+    """
+    hits: int
+    misses: int
+
+
+# Element cache lookups, by page class; see element_cache_report().
+_element_cache_totals: dict[str, ElementCacheTotals] = dict()
+
+
+def element_cache_report() -> dict[str, ElementCacheTotals]:
+    """
+    Element cache hits and misses so far, by page class, e.g.
+        {'examples.tools_qa.page_objects.elements.text_box.Page': {'hits': 14, 'misses': 3}}
+    """
+    return copy.deepcopy(_element_cache_totals)
+
+
+def retry_on_stale(method: Callable) -> Callable:
+    """
+    Decorator for page object methods that use cached elements.
+
+    If the method raises StaleElementReferenceException, the object's element
+    cache is invalidated and the method is called once more.
+
+    Classes that set cache_elements get it on all their public methods and
+    properties (see retry_public_members_on_stale()), so it's only needed on
+    classes whose instances turn the cache on themselves.
+    """
+    if getattr(method, '_retries_on_stale', False):
+        return method
+
+    @functools.wraps(method)
+    def wrapper(self: 'BaseMethods', *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except StaleElementReferenceException:
+            logging.debug("Stale element in %s(); invalidating element cache and retrying...", method.__qualname__)
+            self.invalidate_element_cache()
+            return method(self, *args, **kwargs)
+    wrapper._retries_on_stale = True
+    return wrapper
+
+
+def retry_public_members_on_stale(cls: type) -> None:
+    """
+    Applies retry_on_stale to the public methods and property accessors cls
+    defines (not those it inherits; they're wrapped where they're defined, if
+    that class caches elements).
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith('_'):
+            continue
+        if isinstance(member, property):
+            setattr(cls, name, property(fget=member.fget and retry_on_stale(member.fget),
+                                        fset=member.fset and retry_on_stale(member.fset),
+                                        fdel=member.fdel,
+                                        doc=member.__doc__))
+        elif inspect.isfunction(member):
+            setattr(cls, name, retry_on_stale(member))
+    return
+
+
+# Building script arguments and reading script results, shared by the classes
+#   below and their async counterparts in page_objects.aio.base, which differ only
+#   in how they send the scripts.
+
+def locator_args(locators: dict[str, Locator]) -> list[list[str]]:
+    """
+    [scope, by, value] for each locator, as FIND_MANY and PROBE take them.
+    """
+    script_args = []
+    for i_locator in locators.values():
+        i_locator = Locator.coerce(i_locator)
+        script_args.append([i_locator.scope, i_locator.by, i_locator.value])
+    return script_args
+
+
+def verify_found(owner: Any, elements: dict[str, Any]) -> None:
+    """
+    Raises NoSuchElementException if any of the elements find_many() found is None.
+    """
+    missing = [key for key, element in elements.items() if element is None]
+    if missing:
+        log_str = f"Unable to locate element(s) {missing} for {owner}."
+        logging.error(log_str)
+        raise NoSuchElementException(log_str)
+    return
+
+
+def probe_states(locators: dict[str, Locator], results: list[dict]) -> dict[str, ElementState]:
+    return {key: ElementState(exists=bool(result['exists']), displayed=bool(result['displayed']))
+            for key, result in zip(locators.keys(), results)}
+
+
+def observe_args(owner: Any, condition: page_objects.waits.DomCondition) -> list:
+    """
+    The WAIT_FOR_CONDITION arguments (but the scope element and timeout) for
+    condition, whose locator is a key of owner._locators or a Locator.
+    """
+    if condition.check not in page_objects.waits.DOM_CONDITION_CHECKS:
+        log_str = f"Invalid DOM condition check '{condition.check}'. Must be one of {page_objects.waits.DOM_CONDITION_CHECKS}."
+        logging.error(log_str)
+        raise ValueError(log_str)
+
+    if isinstance(condition.locator, str):
+        locator = owner._locators[condition.locator]
+    else:
+        locator = Locator.coerce(condition.locator)
+    return [locator.scope, locator.by, locator.value, condition.check, condition.name, condition.expected]
+
+
+def verify_settle_policy(policy: str) -> None:
+    if policy not in page_objects.waits.SETTLE_POLICIES:
+        log_str = f"Invalid settle policy '{policy}'. Must be one of {page_objects.waits.SETTLE_POLICIES}."
+        logging.error(log_str)
+        raise ValueError(log_str)
+    return
+
+
+def settle_args(owner: Any, policy: str) -> list:
+    """
+    The SETTLE arguments for owner, an element object with settle_* attributes.
+    Only 'scroll_end' watches the element itself.
+    """
+    watched_element = owner.element_to_click if policy == 'scroll_end' else None
+    return [policy, int(owner.settle_quiet_period * 1000), int(owner.settle_timeout * 1000), watched_element]
+
+
+def script_wait_result(response: dict, key: str, start_time: float) -> page_objects.waits.WaitResult:
+    """
+    The WaitResult of a wait done in the browser by a single async script, whose
+    response has whether it was satisfied under key.
     """
-    scope: str
-    by: str
-    value: str
+    return page_objects.waits.WaitResult(satisfied=bool(response[key]), elapsed=time.monotonic() - start_time, polls=1)
 
 
 class BaseMethods(metaclass=abc.ABCMeta):
     """Methods used by all Page Objects"""
 
+    # Set to True (in a subclass, or on an instance) to cache resolved WebElements.
+    #   Entries are dropped on navigation, on invalidate_element_cache(), and when a
+    #   public method or property of a subclass that sets it hits a stale element
+    #   (it's then retried once; see retry_on_stale()).
+    cache_elements = False
+
+    # Default polling for the wait_until_*() methods. See page_objects.waits.
+    poll_profile = page_objects.waits.PollProfile()
+
+    # How the wait_until_*() methods wait: 'poll' or 'observe'. 'observe' needs the
+    #   corresponding DomCondition to be declared (e.g. loaded_condition), and
+    #   falls back to polling if it isn't.
+    wait_mode = 'poll'
+
+    # Locators shared by all instances, keyed by name. Each subclass's table is
+    #   merged with its parents' when the class is created, so a subclass only
+    #   declares the locators it adds or overrides.
+    _locators: dict[str, Locator] = dict()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._locators = merge_class_locators(cls)
+        if cls.cache_elements:
+            retry_public_members_on_stale(cls)
+        return
+
     def __init__(self, driver: WebDriver, element: Optional[WebElement] = None) -> None:
         self.driver = driver
         self.element = element
-        self._locators = dict()
-        self._name = ''
+        self._locators = LocatorTable(shared=type(self)._locators)
+        # None until first used; see the name property.
+        self._name = None
+        self._prefetched = dict()
+        self._element_cache = dict()
+        self._element_cache_hits = 0
+        self._element_cache_misses = 0
         return
 
+    # Both checks go through probe(): one round trip, and no implicit wait when the
+    #   element doesn't exist. probe() doesn't use the element cache, so there's
+    #   nothing to retry on a stale element.
+
     def element_exists(self, locator: Locator) -> bool:
-        try:
-            self.find_element(locator=locator)
-        except NoSuchElementException:
-            return False
-        else:
-            return True
+        return self.probe(locators={'element': locator})['element']['exists']
 
     def element_exists_and_is_displayed(self, locator: Locator) -> bool:
-        # This seems obvious enough to not warrant its own method.
-        #   However, calling _element_is_displayed() first could raise an unexpected exception.
-        if not self.element_exists(locator=locator):
-            return False
-        return self.find_element(locator=locator).is_displayed()
+        return self.probe(locators={'element': locator})['element']['displayed']
 
     def find_element(self, locator: Locator) -> WebElement:
         """
         Finds a WebElement at the given locator.
+
+        If the locator was resolved by prefetch(), the prefetched WebElement is
+        returned instead (once) without another round trip. If cache_elements is
+        set, WebElements are served from the element cache when possible.
         """
-        self._verify_scope_param(scope=locator['scope'])
-        locator['scope'] = locator['scope'].lower()
+        locator = Locator.coerce(locator)
 
-        if locator['scope'] == 'driver':
-            return self.driver.find_element(by=locator['by'], value=locator['value'])
-        elif locator['scope'] == 'element':
-            return self.element.find_element(by=locator['by'], value=locator['value'])
-        else:
-            log_str = f"Unhandled exception in .find_element(). scope={locator['scope']}"
-            logging.error(log_str)
-            raise Exception(log_str)
+        prefetched = self._prefetched.pop(locator, None)
+        if prefetched is not None:
+            return prefetched
+
+        if not self.cache_elements:
+            return self._find_element(locator=locator)
+
+        cache_key = ('element', locator)
+        if cache_key in self._element_cache:
+            self._count_cache_lookup(hit=True)
+            return self._element_cache[cache_key]
+        self._count_cache_lookup(hit=False)
+        element = self._find_element(locator=locator)
+        self._element_cache[cache_key] = element
+        return element
 
     def find_elements(self, locator: Locator) -> list[WebElement]:
         """
         Finds multiple WebElements at the given locator.
+
+        If cache_elements is set, WebElements are served from the element cache
+        when possible.
+        """
+        locator = Locator.coerce(locator)
+
+        if not self.cache_elements:
+            return self._find_elements(locator=locator)
+
+        cache_key = ('elements', locator)
+        if cache_key in self._element_cache:
+            self._count_cache_lookup(hit=True)
+            return list(self._element_cache[cache_key])
+        self._count_cache_lookup(hit=False)
+        elements = self._find_elements(locator=locator)
+        self._element_cache[cache_key] = list(elements)
+        return elements
+
+    def find_many(self, locators: dict[str, Locator]) -> dict[str, WebElement]:
         """
-        self._verify_scope_param(scope=locator['scope'])
-        locator['scope'] = locator['scope'].lower()
+        Finds a WebElement for each of the given locators in a single round trip.
 
-        if locator['scope'] == 'driver':
-            return self.driver.find_elements(by=locator['by'], value=locator['value'])
-        elif locator['scope'] == 'element':
-            return self.element.find_elements(by=locator['by'], value=locator['value'])
+        Returns a dict with the same keys as the locators param, e.g.
+            self.find_many({'title': self._locators['title'], 'submit': self._locators['submit_button']})
+
+        Driver- and element-scoped locators can be mixed. Raises
+        NoSuchElementException if any locator doesn't match an element.
+        """
+        elements = self._find_many(locators=locators)
+        verify_found(owner=self, elements=elements)
+        return elements
+
+    def probe(self, locators: dict[str, Locator]) -> dict[str, ElementState]:
+        """
+        Checks whether each of the given locators matches an element, and whether
+        the first match is displayed, in a single round trip.
+
+        Returns a dict with the same keys as the locators param, e.g.
+            states = self.probe({'name': self._locators['submitted_name'], 'email': self._locators['submitted_email']})
+            states['name']['displayed']
+
+        The check runs in the browser, so a missing element returns right away
+        instead of waiting out the driver's implicit wait.
+        """
+        if not locators:
+            return dict()
+
+        results = self.driver.execute_script(page_objects.scripts.PROBE, locator_args(locators), self.element)
+        return probe_states(locators=locators, results=results)
+
+    def prefetch(self, *keys: str) -> None:
+        """
+        Resolves locators from self._locators in a single round trip.
+
+        Resolves every locator if no keys are given. Locators that don't match an
+        element are skipped. The next find_element() call for each prefetched
+        locator is served without a round trip, so existing _get_*() helpers
+        benefit without any changes, e.g.
+            page.prefetch()
+            page.full_name_input = 'Alpha Bravo'
+            page.email_input = 'charlie@deltaecho.com'
+        """
+        if not keys:
+            keys = tuple(self._locators.keys())
+        locators = {key: self._locators[key] for key in keys}
+
+        # With the element cache enabled, prefetched elements go straight into the
+        #   cache so they can be reused more than once.
+        for key, element in self._find_many(locators=locators).items():
+            if element is None:
+                continue
+            locator = Locator.coerce(locators[key])
+            if self.cache_elements:
+                self._element_cache[('element', locator)] = element
+            else:
+                self._prefetched[locator] = element
+        logging.debug("Prefetched %d locator(s) for %s.", len(locators), self)
+        return
+
+    # Element Cache
+
+    @property
+    def element_cache_stats(self) -> ElementCacheStats:
+        """
+        Hit/miss counts for this object's element cache. Each hit is a round trip
+        saved. See element_cache_report() for the totals by page class.
+        """
+        return {'hits': self._element_cache_hits,
+                'misses': self._element_cache_misses,
+                'size': len(self._element_cache)}
+
+    def _count_cache_lookup(self, hit: bool) -> None:
+        totals = _element_cache_totals.setdefault(f'{type(self).__module__}.{type(self).__qualname__}',
+                                                  ElementCacheTotals(hits=0, misses=0))
+        if hit:
+            self._element_cache_hits += 1
+            totals['hits'] += 1
         else:
-            log_str = f"Unhandled exception in .find_elements(). scope={locator['scope']}"
+            self._element_cache_misses += 1
+            totals['misses'] += 1
+        return
+
+    def invalidate_element_cache(self, locator: Optional[Locator] = None) -> None:
+        """
+        Drops cached WebElements for the given locator, or all of them if no
+        locator is given. Prefetched elements are dropped as well.
+        """
+        if locator is None:
+            self._element_cache.clear()
+            self._prefetched.clear()
+            return
+
+        locator = Locator.coerce(locator)
+        self._element_cache.pop(('element', locator), None)
+        self._element_cache.pop(('elements', locator), None)
+        self._prefetched.pop(locator, None)
+        return
+
+    def _find_element(self, locator: Locator) -> WebElement:
+        if locator.scope == 'driver':
+            return self.driver.find_element(by=locator.by, value=locator.value)
+        elif locator.scope == 'element':
+            return self.element.find_element(by=locator.by, value=locator.value)
+        else:
+            log_str = f"Unhandled exception in .find_element(). scope={locator.scope}"
+            logging.error(log_str)
+            raise Exception(log_str)
+
+    def _find_elements(self, locator: Locator) -> list[WebElement]:
+        if locator.scope == 'driver':
+            return self.driver.find_elements(by=locator.by, value=locator.value)
+        elif locator.scope == 'element':
+            return self.element.find_elements(by=locator.by, value=locator.value)
+        else:
+            log_str = f"Unhandled exception in .find_elements(). scope={locator.scope}"
             logging.error(log_str)
             raise Exception(log_str)
 
+    def _find_many(self, locators: dict[str, Locator]) -> dict[str, Optional[WebElement]]:
+        if not locators:
+            return dict()
+
+        results = self.driver.execute_script(page_objects.scripts.FIND_MANY, locator_args(locators), self.element)
+        return dict(zip(locators.keys(), results))
+
+    def _wait_for(self, condition: Callable[[], bool], timeout: float,
+                  profile: Optional[page_objects.waits.PollProfile] = None,
+                  dom_condition: Optional[page_objects.waits.DomCondition] = None,
+                  mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        """
+        Waits for condition using this object's wait_mode and poll_profile, unless
+        they're given.
+
+        In 'observe' mode, dom_condition is evaluated in the browser instead of
+        polling condition. When polling, a stale element also drops the element
+        cache, so the next poll finds it again.
+        """
+        mode = (mode or self.wait_mode).lower()
+        self._verify_wait_mode(mode=mode)
+        if mode == 'observe':
+            if dom_condition is not None:
+                return self._observe(condition=dom_condition, timeout=timeout)
+            logging.debug("No DOM condition declared for %s; polling instead.", self)
+
+        def checked_condition() -> bool:
+            try:
+                return condition()
+            except StaleElementReferenceException:
+                self.invalidate_element_cache()
+                raise
+
+        return page_objects.waits.wait_for(condition=checked_condition,
+                                           timeout=timeout,
+                                           profile=profile or self.poll_profile,
+                                           ignored_exceptions=WAIT_IGNORED_EXCEPTIONS)
+
+    def _observe(self, condition: page_objects.waits.DomCondition, timeout: float) -> page_objects.waits.WaitResult:
+        """
+        Blocks in a single execute_async_script() call until condition holds in the
+        browser or the timeout expires.
+
+        The driver's script timeout (30s by default) must be longer than the wait.
+        If it isn't, the wait ends at the script timeout, unsatisfied.
+        """
+        script_args = observe_args(owner=self, condition=condition)
+        start_time = time.monotonic()
+        try:
+            response = self.driver.execute_async_script(page_objects.scripts.WAIT_FOR_CONDITION,
+                                                        script_args,
+                                                        self.element,
+                                                        int(timeout * 1000))
+        except TimeoutException:
+            response = {'satisfied': False}
+        return script_wait_result(response=response, key='satisfied', start_time=start_time)
+
+    @staticmethod
+    def _verify_wait_mode(mode: str) -> None:
+        if mode not in page_objects.waits.WAIT_MODES:
+            log_str = f"Invalid wait mode '{mode}'. Must be one of {page_objects.waits.WAIT_MODES}."
+            logging.error(log_str)
+            raise ValueError(log_str)
+
     def mouseover(self, element: WebElement) -> None:
         ActionChains(self.driver).move_to_element(element).perform()
         return
 
     @staticmethod
     def _verify_scope_param(scope: str) -> None:
-        log_str = f"Invalid scope param value '{scope}'. Must be one of ['driver', 'element']."
-
-        if not scope:
-            logging.error(log_str)
-            raise TypeError(log_str)
-
-        scope = scope.lower()
-        if scope not in ['driver', 'element']:
-            logging.error(log_str)
-            raise ValueError(log_str)
+        Locator.verify_scope(scope=scope)
 
     @property
     def name(self) -> str:
+        """
+        Name of the page object, used in logs.
+
+        If no name has been set, it's loaded on first use with _load_name() and
+        memoized, so creating a page object never costs a round trip.
+        """
+        if self._name is None:
+            self._name = self._load_name()
         return self._name
 
+    def _load_name(self) -> str:
+        """
+        Override in a subclass to derive the name from the DOM (e.g. the element's
+        text). Called at most once per instance, when the name is first needed.
+        """
+        return ''
+
     @name.setter
     def name(self, value: str) -> None:
         self._name = value
         return
 
+    @property
+    def log_name(self) -> str:
+        """
+        Name to use in log messages and str(). Unlike name, never talks to the
+        browser: falls back to the class name until a name has been set or loaded,
+        so logging (even at a disabled level) costs no round trips.
+        """
+        if self._name:
+            return self._name
+        return f'<{self.__class__.__name__}>'
+
     def __repr__(self) -> str:
         return f'{self.__class__}'
 
     def __str__(self) -> str:
-        return self.name
+        return self.log_name
 
 
 class BaseLoadingMethods(BaseMethods, metaclass=abc.ABCMeta):
     """Methods used by Page Objects which have a loading state."""
 
+    # Default polling for wait_until_loaded(). Override in a subclass to tune it.
+    poll_profile = page_objects.waits.PollProfile(initial_delay=0.1, backoff=1.5, max_delay=0.5)
+
+    # Equivalent of is_loaded() the browser can evaluate, for wait_mode = 'observe'.
+    loaded_condition: Optional[page_objects.waits.DomCondition] = None
+
     @abc.abstractmethod
     def is_loaded(self) -> bool:
         """Criteria to determine when the element is deemed loaded"""
         pass
 
-    def wait_until_loaded(self, timeout: float = 5.0, must_load: bool = True) -> None:
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            time.sleep(0.5)
-            if self.is_loaded():
-                return
-        if must_load is True:
+    def wait_until_loaded(self, timeout: float = 5.0, must_load: bool = True,
+                          profile: Optional[page_objects.waits.PollProfile] = None,
+                          mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        result = self._wait_for(condition=self.is_loaded, timeout=timeout, profile=profile,
+                                dom_condition=self.loaded_condition, mode=mode)
+        if result.satisfied:
+            logging.debug("'%s' loaded after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        elif must_load is True:
             log_str = f"'{self}' did not load."
             logging.error(log_str)
             raise TimeoutError(log_str)
+        return result
 
 
 class BasePage(BaseLoadingMethods, metaclass=abc.ABCMeta):
 
+    # Reset protocol; see load_or_reset().
+    #   Pages that can return to a clean state without reloading set can_reset and
+    #   override reset_state() (and is_reset(), to verify it).
+    can_reset = False
+    # Whether reset_state() clears cookies and local/session storage.
+    reset_clears_storage = False
+
+    # Values read by snapshot_fields(), by name.
+    _fields: dict[str, Field] = dict()
+
+    # How load_page() loads the page; one of LOAD_MODES. Use load_timings() to
+    #   compare modes for a page class.
+    load_mode = 'normal'
+    # If set, load_page() also waits until no resource has finished loading for
+    #   this many seconds (e.g. for pages that render from XHR responses).
+    network_idle = 0.0
+    # Seconds load_page() waits for the browser to be ready, before is_loaded().
+    load_timeout = 30.0
+    # Requests load_page() blocks (ads, analytics, images, ...), with Chromium
+    #   drivers. See page_objects.blocking.
+    request_blocking: Optional[page_objects.blocking.RequestBlocking] = None
+
     def __init__(self, driver: WebDriver, url: str = None) -> None:
         super().__init__(driver=driver)
         self._url = url
         return
 
-    def load_page(self) -> None:
+    @property
+    def url(self) -> Optional[str]:
+        """
+        The URL load_page() navigates to: the page's own, after set_url_rewrite().
+        """
+        return rewrite_url(self._url) if self._url else self._url
+
+    def load_page(self, mode: Optional[str] = None) -> None:
+        """
+        Navigates to the page and waits until it's loaded, using the given load
+        mode or load_mode (see LOAD_MODES). Blocks the requests declared in
+        request_blocking first. The time taken is recorded; see load_timings().
+        """
         if not self._url:
             log_str = 'No URL was specified when this object was created.'
             logging.error(log_str)
             raise ValueError(log_str)
+        plan = load_plan(page_class=type(self), mode=(mode or self.load_mode).lower(),
+                         strategy=self.driver.capabilities.get('pageLoadStrategy'))
+        logging.debug("Navigating to %s ('%s')...", self, plan.mode)
+        self.invalidate_element_cache()
+        blocked = page_objects.blocking.apply(driver=self.driver, blocking=self.request_blocking)
+        start_time = time.monotonic()
+        loaded = False
+        try:
+            marker = ''
+            if plan.mark:
+                marker = uuid.uuid4().hex
+                current_url = self.driver.execute_script(page_objects.scripts.MARK_NAVIGATION, marker)
+                if is_same_document(current_url=current_url, url=self.url):
+                    # Only the fragment changes; the marked document stays.
+                    marker = ''
+            self.driver.get(url=self.url)
+            if marker or plan.ready_state or self.network_idle:
+                self._wait_until_ready(marker=marker, ready_state=plan.ready_state)
+            self.wait_until_loaded()
+            loaded = True
+        finally:
+            record_load_timing(page_class=type(self), mode=plan.mode, elapsed=time.monotonic() - start_time,
+                                loaded=loaded)
+        if self.request_blocking is not None and page_objects.blocking.measure_usage:
+            page_objects.blocking.record_usage(driver=self.driver, page_class=type(self), blocked=blocked)
+        return
+
+    def _wait_until_ready(self, marker: str, ready_state: Optional[str]) -> None:
+        # The browser does the waiting (READINESS), but the first calls can still
+        #   reach the old document, or fail while it's being unloaded.
+        deadline = time.monotonic() + self.load_timeout
+
+        def is_ready() -> bool:
+            timeout_ms = max(int((deadline - time.monotonic()) * 1000), 0)
+            try:
+                response = self.driver.execute_async_script(page_objects.scripts.READINESS, marker, ready_state,
+                                                            int(self.network_idle * 1000), timeout_ms)
+            except TimeoutException:
+                return False
+            return bool(response['navigated'] and response['ready'])
+
+        result = page_objects.waits.wait_for(condition=is_ready,
+                                             timeout=self.load_timeout,
+                                             profile=self.poll_profile,
+                                             ignored_exceptions=WAIT_IGNORED_EXCEPTIONS + (JavascriptException,))
+        if not result.satisfied:
+            log_str = f"'{self}' was not ready within {self.load_timeout}s."
+            logging.error(log_str)
+            raise TimeoutError(log_str)
+        logging.debug("'%s' ready after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        return
+
+    def snapshot_fields(self, *keys: str) -> dict[str, Any]:
+        """
+        Reads the fields declared in _fields in a single round trip, and returns
+        them as a plain dict, e.g.
+            _fields = {
+                'name': Field(locator='name_input', read='value'),
+                'submitted_name': Field(locator='submitted_name', read='text'),
+            }
+            assert page.snapshot_fields() == {'name': 'Alpha', 'submitted_name': 'Name:Alpha'}
+
+        Reads every field if no keys are given. Fields whose element doesn't exist
+        read as None ('text', 'value', 'attribute') or False ('displayed',
+        'exists').
+        """
+        if not keys:
+            keys = tuple(self._fields.keys())
+
+        script_args = []
+        for i_key in keys:
+            i_field = self._fields[i_key]
+            if i_field.read not in FIELD_READS:
+                log_str = f"Invalid read '{i_field.read}' for field '{i_key}' of {self}. Must be one of {FIELD_READS}."
+                logging.error(log_str)
+                raise ValueError(log_str)
+            if isinstance(i_field.locator, str):
+                i_locator = self._locators[i_field.locator]
+            else:
+                i_locator = Locator.coerce(i_field.locator)
+            script_args.append([i_locator.scope, i_locator.by, i_locator.value, i_field.read, i_field.name])
+
+        results = self.driver.execute_script(page_objects.scripts.READ_FIELDS, script_args, self.element)
+        return dict(zip(keys, results))
+
+    def load_or_reset(self) -> bool:
+        """
+        Puts the page in its initial state, as load_page() would, but cheaply if
+        possible.
+
+        If the browser is already on this page and the page can_reset, it's reset
+        in place with reset_state() and checked with is_reset(). If that fails, or
+        isn't possible, the page is reloaded.
 
-        logging.debug(f'Navigating to {self}...')
-        self.driver.get(url=self._url)
-        self.wait_until_loaded()
+        Returns True if the page was reset, False if it was (re)loaded.
+        """
+        if self.can_reset and self.is_current_page():
+            logging.debug('Resetting %s...', self)
+            self.invalidate_element_cache()
+            try:
+                self.reset_state()
+                if self.is_reset():
+                    return True
+                logging.warning('%s not in its initial state after reset. Reloading...', self)
+            except (WebDriverException, TimeoutError) as e:
+                logging.warning('Resetting %s failed (%s). Reloading...', self, e.__class__.__name__)
+        self.load_page()
+        return False
+
+    def is_current_page(self) -> bool:
+        if not self._url:
+            return False
+        return self.driver.current_url.rstrip('/') == self.url.rstrip('/')
+
+    def reset_state(self) -> None:
+        """
+        Returns an already loaded page to its initial state, without navigating.
+
+        Override in a subclass (and set can_reset), e.g. to reset form fields or
+        collapse expanded sections. Call super().reset_state() to clear storage
+        when reset_clears_storage is set.
+        """
+        if self.reset_clears_storage:
+            self.clear_storage()
+        return
+
+    def is_reset(self) -> bool:
+        """
+        Whether the page is in its initial state. Override in a subclass to check
+        whatever reset_state() resets.
+        """
+        return self.is_loaded()
+
+    def clear_storage(self) -> None:
+        """
+        Deletes all cookies and clears local and session storage for the current
+        page.
+        """
+        logging.debug('Clearing cookies and storage for %s...', self)
+        self.driver.delete_all_cookies()
+        self.driver.execute_script(page_objects.scripts.CLEAR_STORAGE)
         return
 
 
 class BaseElement(BaseMethods):
 
+    # How click() waits for the page to settle; one of page_objects.waits.SETTLE_POLICIES.
+    #   Set it on BaseElement to change it globally, on a subclass to change it for
+    #   that class, or pass settle= to click() for a single call.
+    settle_policy = 'scroll_end'
+    settle_quiet_period = 0.1
+    settle_timeout = 2.0
+
     def __init__(self, element: WebElement) -> None:
         super().__init__(driver=element.parent, element=element)
         return
@@ -186,7 +1071,8 @@ class BaseElement(BaseMethods):
         """
         return self.element
 
-    def click(self, scroll_into_view: bool = False, scroll_align_top: bool = True, scroll_vertical_offset: int = 0) -> None:
+    def click(self, scroll_into_view: bool = False, scroll_align_top: bool = True, scroll_vertical_offset: int = 0,
+              settle: Optional[str] = None) -> None:
         """
         Clicks the element.
 
@@ -197,13 +1083,18 @@ class BaseElement(BaseMethods):
         scroll_align_top will scroll until the element to click is either at the
         top or bottom of the window. scroll_vertical_offset will then scroll
         the specified amount of pixels before clicking the element.
+
+        settle overrides settle_policy for this call. See settle().
         """
+        policy = (settle or self.settle_policy).lower()
+        verify_settle_policy(policy=policy)
+
         if scroll_into_view:
             if scroll_align_top:
                 top_or_bottom = 'top'
             else:
                 top_or_bottom = 'bottom'
-            logging.debug(f"Scrolling {self} into view, aligning to {top_or_bottom}...")
+            logging.debug("Scrolling %s into view, aligning to %s...", self, top_or_bottom)
             self.driver.execute_script(f"arguments[0].scrollIntoView({str(scroll_align_top).lower()});",
                                        self.element_to_click)
 
@@ -212,18 +1103,51 @@ class BaseElement(BaseMethods):
                     up_or_down = 'up'
                 else:
                     up_or_down = 'down'
-                logging.debug(f"Scrolling {up_or_down} {abs(scroll_vertical_offset)} pixels...")
+                logging.debug("Scrolling %s %d pixels...", up_or_down, abs(scroll_vertical_offset))
                 self.driver.execute_script(f"scrollBy(0, {scroll_vertical_offset})")
 
-            # Delay before clicking
-            #   Sometimes the scroll needs time to finish, despite what it seems.
-            time.sleep(0.5)
+            # Sometimes the scroll needs time to finish, despite what it seems.
+            #   Whatever the policy, all we need to wait for here is the scroll.
+            self.settle(policy=policy if policy in ['none', 'legacy'] else 'scroll_end')
 
-        logging.info(f"Clicking {self}...")
+        if policy == 'idle':
+            # Count the requests the click starts, not just those after it.
+            self.driver.execute_script(page_objects.scripts.INSTALL_REQUEST_TRACKER)
+        logging.info("Clicking %s...", self)
         self.element_to_click.click()
-        time.sleep(0.5)
+        self.settle(policy=policy)
         return
 
+    def settle(self, policy: Optional[str] = None) -> page_objects.waits.WaitResult:
+        """
+        Waits until the page is quiescent according to policy (or settle_policy if
+        no policy is given). One of page_objects.waits.SETTLE_POLICIES.
+
+        Settling is best effort: if the page doesn't settle within settle_timeout,
+        this logs it and returns anyway.
+        """
+        policy = (policy or self.settle_policy).lower()
+        verify_settle_policy(policy=policy)
+
+        if policy == 'none':
+            return page_objects.waits.WaitResult(satisfied=True, elapsed=0.0, polls=0)
+        if policy == 'legacy':
+            time.sleep(0.5)
+            return page_objects.waits.WaitResult(satisfied=True, elapsed=0.5, polls=0)
+
+        start_time = time.monotonic()
+        try:
+            response = self.driver.execute_async_script(page_objects.scripts.SETTLE,
+                                                        *settle_args(owner=self, policy=policy))
+        except (NoSuchElementException, StaleElementReferenceException, TimeoutException):
+            # The element may be gone (e.g. the click navigated away). Nothing to
+            #   wait for in that case.
+            response = {'settled': False}
+        result = script_wait_result(response=response, key='settled', start_time=start_time)
+        if not result.satisfied:
+            logging.debug("Page did not settle ('%s') within %ss after acting on %s.", policy, self.settle_timeout, self)
+        return result
+
     def highlight(self, duration=3):
         """
         Highlights the element. Used for debugging purposes. Make sure your locators are good!
@@ -258,6 +1182,16 @@ class BaseOpenCloseElement(BaseElement, metaclass=abc.ABCMeta):
     Also works for expanded/collapsed.
     """
 
+    # Default polling for wait_until_open()/wait_until_closed(). Open/close
+    #   transitions are usually short animations, so poll more eagerly than for
+    #   page loads.
+    poll_profile = page_objects.waits.PollProfile(initial_delay=0.05, backoff=1.5, max_delay=0.25)
+
+    # Equivalents of is_open()/is_closed() the browser can evaluate, for
+    #   wait_mode = 'observe'.
+    open_condition: Optional[page_objects.waits.DomCondition] = None
+    closed_condition: Optional[page_objects.waits.DomCondition] = None
+
     @abc.abstractmethod
     def is_closed(self) -> bool:
         """Criteria to determine if the element is deemed closed."""
@@ -283,27 +1217,31 @@ class BaseOpenCloseElement(BaseElement, metaclass=abc.ABCMeta):
         # wait_until_opened()
         raise NotImplementedError
 
-    def wait_until_closed(self, timeout: float = 5.0, must_close: bool = True) -> None:
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            time.sleep(0.5)
-            if self.is_closed():
-                return
-        if must_close is True:
+    def wait_until_closed(self, timeout: float = 5.0, must_close: bool = True,
+                          profile: Optional[page_objects.waits.PollProfile] = None,
+                          mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        result = self._wait_for(condition=self.is_closed, timeout=timeout, profile=profile,
+                                dom_condition=self.closed_condition, mode=mode)
+        if result.satisfied:
+            logging.debug("'%s' closed after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        elif must_close is True:
             log_str = f"'{self}' did not close."
             logging.error(log_str)
             raise TimeoutError(log_str)
-
-    def wait_until_open(self, timeout: float = 5.0, must_open: bool = True) -> None:
-        end_time = time.time() + timeout
-        while time.time() < end_time:
-            time.sleep(0.5)
-            if self.is_open():
-                return
-        if must_open is True:
+        return result
+
+    def wait_until_open(self, timeout: float = 5.0, must_open: bool = True,
+                        profile: Optional[page_objects.waits.PollProfile] = None,
+                        mode: Optional[str] = None) -> page_objects.waits.WaitResult:
+        result = self._wait_for(condition=self.is_open, timeout=timeout, profile=profile,
+                                dom_condition=self.open_condition, mode=mode)
+        if result.satisfied:
+            logging.debug("'%s' opened after %.3fs (%d polls).", self, result.elapsed, result.polls)
+        elif must_open is True:
             log_str = f"'{self}' did not open."
             logging.error(log_str)
             raise TimeoutError(log_str)
+        return result
 
     # The following methods are just wrappers. They can read easier for elements that
     #   open/close differently, e.g. an accordion-type element that expands/collapses.from
@@ -322,10 +1260,8 @@ class BaseOpenCloseElement(BaseElement, metaclass=abc.ABCMeta):
     def is_expanded(self) -> bool:
         return self.is_open()
 
-    def wait_until_collapsed(self, timeout: float = 5.0, must_collapse: bool = True) -> None:
-        self.wait_until_closed(timeout=timeout, must_close=must_collapse)
-        return
+    def wait_until_collapsed(self, timeout: float = 5.0, must_collapse: bool = True) -> page_objects.waits.WaitResult:
+        return self.wait_until_closed(timeout=timeout, must_close=must_collapse)
 
-    def wait_until_expanded(self, timeout: float = 5.0, must_expand: bool = True) -> None:
-        self.wait_until_open(timeout=timeout, must_open=must_expand)
-        return
+    def wait_until_expanded(self, timeout: float = 5.0, must_expand: bool = True) -> page_objects.waits.WaitResult:
+        return self.wait_until_open(timeout=timeout, must_open=must_expand)
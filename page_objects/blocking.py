@@ -0,0 +1,219 @@
+"""
+Blocking of requests a page doesn't need, like ads, analytics or images.
+
+Page objects declare what to block:
+
+    class Page(page_objects.base.BasePage):
+        request_blocking = page_objects.blocking.RequestBlocking(
+            domains=('doubleclick.net', 'google-analytics.com'),
+            resource_types=('font', 'media'))
+
+BasePage.load_page() (and AsyncBasePage.load_page()) applies it before
+navigating, using the Chrome DevTools Protocol (Network.setBlockedURLs), so it
+only works with Chromium-based drivers; others load everything. With
+measure_usage on, the requests and bytes each load did fetch are then recorded
+(from the Resource Timing API). Blocked requests
+leave no trace there, so to see what blocking saves, run once with blocking
+turned off (see enabled) and compare with usage_report().
+"""
+
+import copy
+import logging
+import weakref
+from typing import NamedTuple, Optional, TypedDict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+import page_objects.scripts
+
+# File extensions blocked for each resource type. Network.setBlockedURLs only
+#   matches URLs, so types are blocked by extension.
+RESOURCE_TYPES: dict[str, tuple[str, ...]] = {
+    'image': ('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico'),
+    'font': ('woff', 'woff2', 'ttf', 'otf', 'eot'),
+    'media': ('mp4', 'webm', 'ogg', 'mp3', 'wav', 'm4a'),
+    'stylesheet': ('css',),
+    'script': ('js',),
+}
+
+# Whether BasePage.load_page() blocks requests. Turn off to measure what pages
+#   load without blocking.
+enabled = True
+# Whether BasePage.load_page() records what pages with request_blocking load, for
+#   usage_report(). Costs a round trip per load.
+measure_usage = False
+
+
+class RequestBlocking(NamedTuple):
+    """
+    What a page object blocks.
+
+    url_patterns: URL patterns, with '*' matching anything, e.g. '*/ads/*'
+    resource_types: keys of RESOURCE_TYPES, e.g. 'image'
+    domains: domains whose requests (including subdomains) are blocked, e.g.
+        'doubleclick.net'
+    """
+    url_patterns: tuple[str, ...] = ()
+    resource_types: tuple[str, ...] = ()
+    domains: tuple[str, ...] = ()
+
+    def patterns(self) -> list[str]:
+        """
+        The URL patterns to give Network.setBlockedURLs.
+        """
+        patterns = list(self.url_patterns)
+        for i_type in self.resource_types:
+            if i_type not in RESOURCE_TYPES:
+                log_str = f"Invalid resource type '{i_type}'. Must be one of {list(RESOURCE_TYPES)}."
+                logging.error(log_str)
+                raise ValueError(log_str)
+            for i_extension in RESOURCE_TYPES[i_type]:
+                patterns += [f'*.{i_extension}', f'*.{i_extension}?*']
+        for i_domain in self.domains:
+            patterns += [f'*://{i_domain}/*', f'*://*.{i_domain}/*']
+        return patterns
+
+
+class ResourceUsage(TypedDict):
+    """
+    What one navigation loaded: the document and every resource, and their
+    transfer size. Cross-origin responses without a Timing-Allow-Origin header
+    count as requests but report 0 bytes.
+    """
+    requests: int
+    bytes: int
+
+
+class ResourceUsageStats(TypedDict):
+    navigations: int
+    requests: float
+    bytes: float
+
+
+class BlockingReport(TypedDict):
+    """
+    Average resource usage per navigation of a page class, with and without
+    blocking, and the difference once both are known.
+    """
+    blocked: Optional[ResourceUsageStats]
+    unblocked: Optional[ResourceUsageStats]
+    saved: Optional[ResourceUsage]
+
+
+# Blocked URL patterns currently set on each driver.
+_applied: 'weakref.WeakKeyDictionary[WebDriver, tuple[str, ...]]' = weakref.WeakKeyDictionary()
+
+# Totals by page class, then 'blocked'/'unblocked'.
+_usage: dict[str, dict[str, ResourceUsageStats]] = dict()
+
+
+def apply(driver: WebDriver, blocking: Optional[RequestBlocking]) -> bool:
+    """
+    Sets the driver to block what blocking declares (nothing if it's None or
+    blocking is turned off). Sends commands only when that changes what's
+    blocked. Returns whether anything is blocked.
+    """
+    patterns, commands = _commands(driver=driver, blocking=blocking)
+    if not commands:
+        return bool(patterns)
+
+    execute_cdp_cmd = getattr(driver, 'execute_cdp_cmd', None)
+    if execute_cdp_cmd is None:
+        logging.debug("%s doesn't support CDP; not blocking requests.", driver.__class__.__name__)
+        return False
+    for i_command, i_params in commands:
+        execute_cdp_cmd(i_command, i_params)
+    _set_applied(driver=driver, patterns=patterns)
+    return bool(patterns)
+
+
+async def apply_async(driver, blocking: Optional[RequestBlocking]) -> bool:
+    """
+    apply(), for a page_objects.aio.webdriver.AsyncWebDriver.
+    """
+    patterns, commands = _commands(driver=driver, blocking=blocking)
+    if not commands:
+        return bool(patterns)
+
+    for i_command, i_params in commands:
+        await driver.execute_cdp_cmd(i_command, i_params)
+    _set_applied(driver=driver, patterns=patterns)
+    return bool(patterns)
+
+
+def _commands(driver, blocking: Optional[RequestBlocking]) -> tuple[tuple[str, ...], list[tuple[str, dict]]]:
+    # The patterns to block, and the CDP commands that set them (none if they're
+    #   already set).
+    patterns = tuple(blocking.patterns()) if blocking is not None and enabled else ()
+    if _applied.get(driver, ()) == patterns:
+        return patterns, []
+    commands = []
+    if driver not in _applied:
+        commands.append(('Network.enable', dict()))
+    commands.append(('Network.setBlockedURLs', {'urls': list(patterns)}))
+    return patterns, commands
+
+
+def _set_applied(driver, patterns: tuple[str, ...]) -> None:
+    _applied[driver] = patterns
+    logging.debug('Blocking %d URL pattern(s).', len(patterns))
+    return
+
+
+def record_usage(driver: WebDriver, page_class: type, blocked: bool) -> ResourceUsage:
+    """
+    Reads what the current page loaded, in one round trip, and adds it to
+    usage_report().
+    """
+    usage = driver.execute_script(page_objects.scripts.RESOURCE_USAGE)
+    return _add_usage(page_class=page_class, blocked=blocked, usage=usage)
+
+
+async def record_usage_async(driver, page_class: type, blocked: bool) -> ResourceUsage:
+    """
+    record_usage(), for a page_objects.aio.webdriver.AsyncWebDriver.
+    """
+    usage = await driver.execute_script(page_objects.scripts.RESOURCE_USAGE)
+    return _add_usage(page_class=page_class, blocked=blocked, usage=usage)
+
+
+def _add_usage(page_class: type, blocked: bool, usage: dict) -> ResourceUsage:
+    usage = ResourceUsage(requests=int(usage['requests']), bytes=int(usage['bytes']))
+    by_state = _usage.setdefault(f'{page_class.__module__}.{page_class.__qualname__}', dict())
+    stats = by_state.setdefault('blocked' if blocked else 'unblocked',
+                                ResourceUsageStats(navigations=0, requests=0, bytes=0))
+    stats['navigations'] += 1
+    stats['requests'] += usage['requests']
+    stats['bytes'] += usage['bytes']
+    logging.info("%s loaded %d request(s), %d bytes (%s).", page_class.__qualname__, usage['requests'],
+                 usage['bytes'], 'blocking' if blocked else 'not blocking')
+    return usage
+
+
+def usage_report(previous: Optional[dict[str, BlockingReport]] = None) -> dict[str, BlockingReport]:
+    """
+    Average resource usage per navigation, by page class.
+
+    A run only sees one side (blocked or not), so pass the report of a run with
+    blocking turned the other way as previous; averages this run didn't measure
+    are taken from it, and saved is filled in.
+    """
+    report = dict()
+    previous = previous or dict()
+    for page_class in list(_usage) + [i for i in previous if i not in _usage]:
+        averages = dict()
+        for state, stats in copy.deepcopy(_usage.get(page_class, dict())).items():
+            averages[state] = ResourceUsageStats(navigations=stats['navigations'],
+                                                 requests=stats['requests'] / stats['navigations'],
+                                                 bytes=stats['bytes'] / stats['navigations'])
+        for state in ['blocked', 'unblocked']:
+            if state not in averages and previous.get(page_class, dict()).get(state) is not None:
+                averages[state] = previous[page_class][state]
+        blocked = averages.get('blocked')
+        unblocked = averages.get('unblocked')
+        saved = None
+        if blocked is not None and unblocked is not None:
+            saved = ResourceUsage(requests=round(unblocked['requests'] - blocked['requests']),
+                                  bytes=round(unblocked['bytes'] - blocked['bytes']))
+        report[page_class] = BlockingReport(blocked=blocked, unblocked=unblocked, saved=saved)
+    return report
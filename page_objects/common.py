@@ -4,11 +4,14 @@ Classes used for common HTML elements.
 
 import abc
 import logging
+from typing import Mapping, Optional, Sequence, TypedDict, Union
 
+from selenium.common.exceptions import InvalidElementStateException, NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 
 import page_objects.base
+import page_objects.scripts
 
 
 class CanDisable(page_objects.base.BaseElement, metaclass=abc.ABCMeta):
@@ -37,8 +40,7 @@ class Checkbox(page_objects.base.BaseElement):
     @property
     def checked(self) -> bool:
         checked_attribute = self.element.get_attribute('checked')
-        log_str = f'{self} value: {bool(checked_attribute)}.'
-        logging.debug(log_str)
+        logging.debug('%s value: %s.', self, bool(checked_attribute))
         return bool(checked_attribute)
 
     @checked.setter
@@ -46,21 +48,115 @@ class Checkbox(page_objects.base.BaseElement):
         if self.checked != value:
             self.click()
         else:
-            log_str = f'{self} value already {value}; no need to click.'
-            logging.debug(log_str)
+            logging.debug('%s value already %s; no need to click.', self, value)
         return
 
     # I would define a method that returns the label, but there's no standard DOM structure for that.
 
 
+class CheckboxState(TypedDict):
+    """
+    State of one checkbox, as read by CheckboxGroup.snapshot().
+    """
+    index: int
+    checked: bool
+    disabled: bool
+    displayed: bool
+    element: WebElement
+
+
+class CheckboxGroup(page_objects.base.BaseElement):
+    """
+    The checkboxes inside an element (e.g. a <form> or <fieldset>), read and set
+    together.
+    """
+
+    def __init__(self, element: WebElement) -> None:
+        super().__init__(element=element)
+        self._name = 'Checkbox Group'
+        return
+
+    @property
+    def checked(self) -> list[bool]:
+        return [i['checked'] for i in self.snapshot()]
+
+    def set_checked(self, states: Sequence[Optional[bool]]) -> None:
+        """
+        Sets every checkbox to the state at the same index of states (None leaves
+        a checkbox as it is), e.g. set_checked([False, True]).
+
+        One round trip to read the current state, one click per checkbox that
+        needs to change, and one round trip to verify the result. The clicks don't
+        wait for the page to settle; the verification covers that.
+        """
+        snapshot = self.snapshot()
+        if len(states) != len(snapshot):
+            log_str = f"Got {len(states)} states for the {len(snapshot)} checkboxes of {self}."
+            logging.error(log_str)
+            raise ValueError(log_str)
+
+        to_click = [i for i in snapshot if states[i['index']] is not None and i['checked'] != states[i['index']]]
+        disabled = [i['index'] for i in to_click if i['disabled']]
+        if disabled:
+            log_str = f"Checkbox(es) {disabled} of {self} are disabled."
+            logging.error(log_str)
+            raise InvalidElementStateException(log_str)
+        if not to_click:
+            logging.debug('%s already %s; no need to click.', self, [i['checked'] for i in snapshot])
+            return
+
+        for i_state in to_click:
+            self._get_checkbox(state=i_state).click(settle='none')
+
+        snapshot = self.snapshot()
+        mismatched = [i['index'] for i in snapshot if states[i['index']] is not None and i['checked'] != states[i['index']]]
+        if mismatched:
+            log_str = f"Checkbox(es) {mismatched} of {self} did not change state."
+            logging.error(log_str)
+            raise InvalidElementStateException(log_str)
+        return
+
+    def get_checkboxes(self) -> list[Checkbox]:
+        return [self._get_checkbox(state=i) for i in self.snapshot()]
+
+    def snapshot(self) -> list[CheckboxState]:
+        """
+        Reads the checked, disabled and displayed state (and WebElement) of every
+        checkbox in a single round trip.
+        """
+        return self.driver.execute_script(page_objects.scripts.CHECKBOX_GROUP_SNAPSHOT, self.element)
+
+    # Misc
+
+    def _get_checkbox(self, state: CheckboxState) -> Checkbox:
+        checkbox = Checkbox(element=state['element'])
+        checkbox.name = f"{self} - Checkbox {state['index'] + 1}"
+        return checkbox
+
+
+class OptionState(TypedDict):
+    """
+    State of one <option>, as read by Dropdown.snapshot().
+    """
+    index: int
+    text: str
+    value: str
+    selected: bool
+    disabled: bool
+    element: WebElement
+
+
 class Dropdown(CanDisable):
     """
     <select>
     """
 
+    _locators = {
+        'options': page_objects.base.Locator(scope='element', by=By.CSS_SELECTOR, value='option'),
+    }
+
     def __init__(self, element: WebElement) -> None:
         super().__init__(element=element)
-        self._locators['options'] = {'scope': 'element', 'by': By.CSS_SELECTOR, 'value': 'option'}
         self._name = 'Dropdown'
         return
 
@@ -68,24 +164,17 @@ class Dropdown(CanDisable):
 
     @property
     def options(self) -> list[str]:
-        options_list = []
-        for i in self._get_options():
-            options_list.append(i.text)
-
-        log_str = f"Options for {self}:"
-        for i in options_list:
-            log_str += f'\n    {i}'
-        logging.debug(log_str)
-
-        return options_list
+        snapshot = self.snapshot()
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(self._describe_snapshot(snapshot=snapshot))
+        return [i['text'] for i in snapshot]
 
     @property
     def selected_option(self) -> str:
-        for i_option in self._get_options():
-            if i_option.is_selected():
-                log_str = f"'{i_option.text}' currently selected for {self}."
-                logging.debug(log_str)
-                return i_option.text
+        for i_option in self.snapshot():
+            if i_option['selected']:
+                logging.debug("'%s' currently selected for %s.", i_option['text'], self)
+                return i_option['text']
 
         log_str = f"{self} has no option selected. (How is this possible???)"
         logging.error(log_str)
@@ -93,51 +182,69 @@ class Dropdown(CanDisable):
 
     @selected_option.setter
     def selected_option(self, value: str) -> None:
-        self._verify_no_duplicate_options()
+        # Two round trips: one to read every option, one to click.
+        snapshot = self.snapshot()
+        self._verify_no_duplicate_options(snapshot=snapshot)
 
-        for i_option in self._get_options():
-            if i_option.text == value:
-                i_option.click()
+        for i_option in snapshot:
+            if i_option['text'] == value:
+                self._click_option(option=i_option)
                 return
 
         log_str = f"Option '{value}' not found for {self}."
         logging.error(log_str)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(self._describe_snapshot(snapshot=snapshot))
         raise ValueError(log_str)
 
+    def snapshot(self) -> list[OptionState]:
+        """
+        Reads the text, value, selected and disabled state (and WebElement) of every
+        option in a single round trip.
+        """
+        return self.driver.execute_script(page_objects.scripts.DROPDOWN_SNAPSHOT, self.element)
+
     # Misc
 
-    def _contains_duplicate_options(self) -> bool:
-        i = self.options
+    def _click_option(self, option: OptionState) -> None:
+        # Same as Option.click(), but using the state we already have.
+        if option['selected']:
+            logging.debug("Option '%s' is already selected.", option['text'])
+        if option['disabled']:
+            logging.warning("Option '%s' is disabled.", option['text'])
+        logging.info("Clicking option '%s' of %s...", option['text'], self)
+        option['element'].click()
+        return
+
+    def _describe_snapshot(self, snapshot: list[OptionState]) -> str:
+        log_str = f"Options for {self}:"
+        for i_option in snapshot:
+            log_str += f"\n    {i_option['text']}"
+            if i_option['selected']:
+                log_str += ' (selected)'
+            if i_option['disabled']:
+                log_str += ' (disabled)'
+        return log_str
+
+    def _contains_duplicate_options(self, snapshot: Optional[list[OptionState]] = None) -> bool:
+        if snapshot is None:
+            snapshot = self.snapshot()
+        i = [i_option['text'] for i_option in snapshot]
         if len(i) != len(set(i)):
-            log_str = f'{self} contains duplicate options.'
-            logging.warning(log_str)
+            logging.warning('%s contains duplicate options.', self)
             return True
         else:
             return False
 
     def _get_options(self) -> list['Option']:
-        elements_list = self.find_elements(locator=self._locators['options'])
+        # Built from a snapshot, so each option knows its text (and name) already.
         options_list = []
-        for i in elements_list:
-            options_list.append(Option(element=i))
+        for i in self.snapshot():
+            options_list.append(Option(element=i['element'], text=i['text']))
         return options_list
 
-    @staticmethod
-    def _option_is_disabled(element: WebElement) -> bool:
-        if element.get_attribute('disabled') == 'true':
-            return True
-        else:
-            return False
-
-    @staticmethod
-    def _option_is_selected(element: WebElement) -> bool:
-        if element.get_attribute('selected') == 'true':
-            return True
-        else:
-            return False
-
-    def _verify_no_duplicate_options(self) -> None:
-        if self._contains_duplicate_options():
+    def _verify_no_duplicate_options(self, snapshot: Optional[list[OptionState]] = None) -> None:
+        if self._contains_duplicate_options(snapshot=snapshot):
             log_str = f'{self} contains duplicate options.'
             logging.error(log_str)
             raise ValueError(log_str)
@@ -166,24 +273,72 @@ class TextField(CanDisable):
     @value.setter
     def value(self, input_: str) -> None:
         self.clear()
-        logging.info(f"Sending keys '{input_}' to {self}...")
+        logging.info("Sending keys '%s' to %s...", input_, self)
         self.element.send_keys(input_)
         return
 
     def clear(self):
-        logging.info(f"Clearing {self}...")
+        logging.info("Clearing %s...", self)
         self.element.clear()
         return
 
 
+def fill_text_fields(parent: page_objects.base.BaseMethods,
+                     values: Mapping[Union[page_objects.base.Locator, TextField], str]) -> None:
+    """
+    Sets several text fields at once, in a single round trip, e.g.
+        page_objects.common.fill_text_fields(page, {
+            page._locators['full_name_input']: 'Alpha Bravo',
+            page._get_email_input(): 'charlie@deltaecho.com',
+        })
+
+    Fields are given as TextFields or as locators, which are resolved like parent's
+    own (so 'element' scoped locators are relative to parent). Values are set
+    directly rather than typed, with 'input' and 'change' events fired so
+    React-style inputs register them. Use TextField.value when a test needs real
+    keystrokes.
+
+    Raises NoSuchElementException if a locator doesn't match, and
+    InvalidElementStateException if a field is disabled, read-only or not an
+    <input> or <textarea>; in either case no field is changed.
+    """
+    if not values:
+        return
+
+    script_args = []
+    for i_field, i_value in values.items():
+        if isinstance(i_field, TextField):
+            script_args.append([i_field.element, None, None, None, i_value])
+        else:
+            i_locator = page_objects.base.Locator.coerce(i_field)
+            script_args.append([None, i_locator.scope, i_locator.by, i_locator.value, i_value])
+    logging.info("Filling %d text field(s) of %s...", len(script_args), parent)
+    response = parent.driver.execute_script(page_objects.scripts.FILL_FIELDS, script_args, parent.element)
+
+    fields = list(values.keys())
+    if response['missing']:
+        log_str = f"Unable to locate text field(s) {[fields[i] for i in response['missing']]} for {parent}."
+        logging.error(log_str)
+        raise NoSuchElementException(log_str)
+    if response['unwritable']:
+        log_str = f"Text field(s) {[str(fields[i]) for i in response['unwritable']]} of {parent} are disabled, read-only or not text fields."
+        logging.error(log_str)
+        raise InvalidElementStateException(log_str)
+    return
+
+
 class Option(CanDisable):
     """
     <option>
     """
 
-    def __init__(self, element: WebElement) -> None:
+    def __init__(self, element: WebElement, text: Optional[str] = None) -> None:
         super().__init__(element=element)
-        self._name = f"Option: '{self.text}'"
+        # Given if already known (e.g. from Dropdown.snapshot()); otherwise loaded on
+        #   first use, see the text property.
+        self._text = text
+        if text is not None:
+            self._name = self._load_name()
         return
 
     def is_selected(self) -> bool:
@@ -194,18 +349,24 @@ class Option(CanDisable):
 
     @property
     def text(self) -> str:
-        return self.element.text
+        if self._text is None:
+            self._text = self.element.text
+        return self._text
+
+    def _load_name(self) -> str:
+        return f"Option: '{self.text}'"
 
     def click(self, scroll_into_view: bool = False) -> None:
+        # Clicking sends commands anyway, so name the option by its text in the
+        #   log: free if it's known, one round trip (once) if not.
+        name = self.name
         if self.is_selected():
-            log_str = f"Option '{self}' is already selected."
-            logging.debug(log_str)
+            logging.debug("Option '%s' is already selected.", name)
         if self.is_disabled():
-            log_str = f"Option '{self}' is disabled."
-            logging.warning(log_str)
+            logging.warning("Option '%s' is disabled.", name)
         if scroll_into_view:
-            logging.debug(f"Scrolling {self} into view...")
+            logging.debug("Scrolling %s into view...", name)
             self.driver.execute_script("arguments[0].scrollIntoView(true);", self.element)
-        logging.info(f"Clicking '{self}'...")
+        logging.info("Clicking '%s'...", name)
         self.element.click()
         return
@@ -0,0 +1,173 @@
+"""
+Counts and times the WebDriver commands sent by page objects.
+
+Every Selenium call (find_element, get_attribute, execute_script, click, ...)
+ends up as one HTTP command sent through WebDriver.execute(). CommandRecorder
+wraps that method on a driver instance, and attributes each command to the
+outermost page object method on the call stack, e.g. 'SideNav.click_link_button'
+rather than the SideNavLinkButton.click() it calls.
+
+    recorder = CommandRecorder()
+    recorder.install(driver)
+    ...
+    print(recorder.to_json())
+"""
+
+import inspect
+import json
+import logging
+import sys
+import time
+from types import CodeType
+from typing import Optional, TypedDict
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+import page_objects.base
+
+# Caller recorded for commands sent from outside any page object method.
+NO_CALLER = '<outside page objects>'
+
+
+class CommandRecord(TypedDict):
+    command: str
+    caller: str
+    duration: float
+
+
+class CommandStats(TypedDict):
+    count: int
+    time: float
+
+
+class CallerStats(TypedDict):
+    count: int
+    time: float
+    commands: dict[str, int]
+
+
+class Offender(TypedDict):
+    caller: str
+    count: int
+    time: float
+
+
+class CommandReport(TypedDict):
+    total: CommandStats
+    commands: dict[str, CommandStats]
+    callers: dict[str, CallerStats]
+    top_offenders: list[Offender]
+
+
+class CommandRecorder:
+
+    def __init__(self) -> None:
+        self.records: list[CommandRecord] = []
+        return
+
+    def install(self, driver: WebDriver) -> None:
+        """
+        Starts recording the commands sent through driver. Installing twice on the
+        same driver does nothing.
+        """
+        if getattr(driver.execute, '_command_recorder', None) is self:
+            return
+
+        original_execute = driver.execute
+
+        def execute(driver_command: str, params: Optional[dict] = None) -> dict:
+            caller = self._find_caller()
+            start_time = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self.records.append({'command': driver_command,
+                                     'caller': caller,
+                                     'duration': time.perf_counter() - start_time})
+
+        execute._command_recorder = self
+        execute._original_execute = original_execute
+        driver.execute = execute
+        logging.debug('Recording WebDriver commands...')
+        return
+
+    @staticmethod
+    def uninstall(driver: WebDriver) -> None:
+        original_execute = getattr(driver.execute, '_original_execute', None)
+        if original_execute is not None:
+            driver.execute = original_execute
+        return
+
+    def reset(self) -> None:
+        self.records = []
+        return
+
+    def report(self, top: int = 10) -> CommandReport:
+        """
+        Summarizes the recorded commands: totals, per command, per page object
+        method, and the top methods by number of commands.
+        """
+        commands = dict()
+        callers = dict()
+        for i_record in self.records:
+            command_stats = commands.setdefault(i_record['command'], {'count': 0, 'time': 0.0})
+            command_stats['count'] += 1
+            command_stats['time'] += i_record['duration']
+
+            caller_stats = callers.setdefault(i_record['caller'], {'count': 0, 'time': 0.0, 'commands': dict()})
+            caller_stats['count'] += 1
+            caller_stats['time'] += i_record['duration']
+            caller_stats['commands'][i_record['command']] = caller_stats['commands'].get(i_record['command'], 0) + 1
+
+        offenders = sorted(callers.items(), key=lambda i: (i[1]['count'], i[1]['time']), reverse=True)
+        return {
+            'total': {'count': len(self.records), 'time': sum(i['duration'] for i in self.records)},
+            'commands': commands,
+            'callers': callers,
+            'top_offenders': [{'caller': caller, 'count': stats['count'], 'time': stats['time']}
+                              for caller, stats in offenders[:top]],
+        }
+
+    def to_json(self, path: Optional[str] = None, top: int = 10) -> str:
+        """
+        Returns the report as JSON, and writes it to path if one is given.
+        """
+        report_json = json.dumps(self.report(top=top), indent=2)
+        if path:
+            with open(path, 'w') as f:
+                f.write(report_json)
+        return report_json
+
+    @staticmethod
+    def _find_caller() -> str:
+        # Walk up from the caller of execute(), keeping the last (outermost) frame
+        #   that's a page object method. Nested functions (e.g. the retry_on_stale
+        #   wrapper) are skipped.
+        caller = NO_CALLER
+        frame = sys._getframe(2)
+        while frame is not None:
+            instance = frame.f_locals.get('self')
+            if (isinstance(instance, page_objects.base.BaseMethods) and
+                    CommandRecorder._is_method_of(cls=type(instance), code=frame.f_code)):
+                caller = f'{instance.__class__.__name__}.{frame.f_code.co_name}'
+            frame = frame.f_back
+        return caller
+
+    @staticmethod
+    def _is_method_of(cls: type, code: CodeType) -> bool:
+        # Whether code is the body of a method or property that cls has under its
+        #   own name. code.co_qualname would tell nested functions apart directly,
+        #   but only exists from Python 3.11.
+        for i_class in cls.__mro__:
+            member = vars(i_class).get(code.co_name)
+            if isinstance(member, property):
+                functions = [member.fget, member.fset, member.fdel]
+            else:
+                functions = [member]
+            for i_function in functions:
+                if i_function is None:
+                    continue
+                # Look through wrappers such as retry_on_stale's.
+                if getattr(inspect.unwrap(i_function), '__code__', None) is code:
+                    return True
+        return False
@@ -0,0 +1,555 @@
+"""
+JavaScript snippets sent to the browser by the base classes.
+
+Each snippet is a complete script body for execute_script() or
+execute_async_script(). They're kept here, rather than inline, so they can be
+reused by several methods and recognized by anything that needs to (e.g. a fake
+driver used for testing).
+"""
+
+# Helper function definitions. Not a script on its own; prepend it to scripts that
+#   need to resolve locators in the browser.
+#
+# pboFind(root, by, value) mirrors WebDriver's locator strategies and returns an
+#   array of matching elements. 'root' is either the document or an element.
+FIND_FUNCTIONS = """
+function pboFind(root, by, value) {
+  var doc = root.ownerDocument || root;
+  var matches = [];
+  var i;
+  switch (by) {
+    case 'css selector':
+      return Array.prototype.slice.call(root.querySelectorAll(value));
+    case 'id':
+      return Array.prototype.slice.call(root.querySelectorAll('#' + CSS.escape(value)));
+    case 'name':
+      return Array.prototype.slice.call(root.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+    case 'class name':
+      return Array.prototype.slice.call(root.querySelectorAll('.' + CSS.escape(value)));
+    case 'tag name':
+      return Array.prototype.slice.call(root.querySelectorAll(value));
+    case 'xpath':
+      var snapshot = doc.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      for (i = 0; i < snapshot.snapshotLength; i++) {
+        matches.push(snapshot.snapshotItem(i));
+      }
+      return matches;
+    case 'link text':
+    case 'partial link text':
+      var links = root.querySelectorAll('a');
+      for (i = 0; i < links.length; i++) {
+        var text = (links[i].innerText || '').trim();
+        if ((by === 'link text' && text === value) ||
+            (by === 'partial link text' && text.indexOf(value) !== -1)) {
+          matches.push(links[i]);
+        }
+      }
+      return matches;
+    default:
+      throw new Error('Unsupported locator strategy: ' + by);
+  }
+}
+"""
+
+# arguments[0]: list of [scope, by, value]
+# arguments[1]: element used for 'element' scoped locators (may be null)
+#
+# Returns a list, in the same order, of the first matching element or null.
+FIND_MANY = FIND_FUNCTIONS + """
+var locators = arguments[0];
+var scopeElement = arguments[1];
+return locators.map(function (locator) {
+  var root = locator[0] === 'element' ? scopeElement : document;
+  var found = pboFind(root, locator[1], locator[2]);
+  return found.length ? found[0] : null;
+});
+"""
+
+# Helper function definitions. Not a script on its own.
+#
+# pboIsDisplayed(element) approximates WebDriver's isDisplayed() check.
+DISPLAY_FUNCTIONS = """
+function pboIsDisplayed(element) {
+  if (!element || !element.isConnected) {
+    return false;
+  }
+  if (element.tagName === 'OPTION' || element.tagName === 'OPTGROUP') {
+    var select = element.closest('select');
+    return select ? pboIsDisplayed(select) : false;
+  }
+  for (var node = element; node && node.nodeType === 1; node = node.parentElement) {
+    var nodeStyle = window.getComputedStyle(node);
+    if (nodeStyle.display === 'none' || parseFloat(nodeStyle.opacity) === 0) {
+      return false;
+    }
+  }
+  var style = window.getComputedStyle(element);
+  if (style.visibility !== 'visible') {
+    return false;
+  }
+  var rect = element.getBoundingClientRect();
+  return rect.width > 0 && rect.height > 0;
+}
+"""
+
+# arguments[0]: list of [scope, by, value]
+# arguments[1]: element used for 'element' scoped locators (may be null)
+#
+# Returns a list, in the same order, of {exists: bool, displayed: bool} for the
+#   first matching element. Runs in the page, so it never waits on the driver's
+#   implicit wait timeout.
+PROBE = FIND_FUNCTIONS + DISPLAY_FUNCTIONS + """
+var locators = arguments[0];
+var scopeElement = arguments[1];
+return locators.map(function (locator) {
+  var root = locator[0] === 'element' ? scopeElement : document;
+  var found = pboFind(root, locator[1], locator[2]);
+  return {exists: found.length > 0, displayed: found.length > 0 && pboIsDisplayed(found[0])};
+});
+"""
+
+# Async script.
+# arguments[0]: condition as [scope, by, value, check, name, expected]
+# arguments[1]: element used for 'element' scoped locators (may be null)
+# arguments[2]: timeout in milliseconds
+#
+# Checks the condition immediately, then again after every DOM mutation under the
+#   search root, until it holds or the timeout expires. Calls back with
+#   {satisfied: bool, checks: int}.
+WAIT_FOR_CONDITION = FIND_FUNCTIONS + DISPLAY_FUNCTIONS + """
+var condition = arguments[0];
+var scopeElement = arguments[1];
+var timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var root = condition[0] === 'element' ? scopeElement : document;
+var checks = 0;
+var finished = false;
+var observer = null;
+var timer = null;
+
+function pboCheck() {
+  checks++;
+  var found = pboFind(root, condition[1], condition[2]);
+  var element = found.length ? found[0] : null;
+  switch (condition[3]) {
+    case 'exists':
+      return element !== null;
+    case 'absent':
+      return element === null;
+    case 'displayed':
+      return pboIsDisplayed(element);
+    case 'not_displayed':
+      return !pboIsDisplayed(element);
+    case 'class_contains':
+      return element !== null && element.classList.contains(condition[4]);
+    case 'class_not_contains':
+      return element !== null && !element.classList.contains(condition[4]);
+    case 'attribute_present':
+      return element !== null && element.hasAttribute(condition[4]);
+    case 'attribute_absent':
+      return element !== null && !element.hasAttribute(condition[4]);
+    case 'attribute_equals':
+      return element !== null && element.getAttribute(condition[4]) === condition[5];
+    case 'text_equals':
+      return element !== null && (element.innerText || '').trim() === condition[5];
+    default:
+      throw new Error('Unsupported condition check: ' + condition[3]);
+  }
+}
+
+function pboFinish(satisfied) {
+  if (finished) {
+    return;
+  }
+  finished = true;
+  if (observer) {
+    observer.disconnect();
+  }
+  clearTimeout(timer);
+  done({satisfied: satisfied, checks: checks});
+}
+
+if (pboCheck()) {
+  pboFinish(true);
+} else {
+  observer = new MutationObserver(function () {
+    if (!finished && pboCheck()) {
+      pboFinish(true);
+    }
+  });
+  observer.observe(root === document ? document.documentElement : root,
+                   {subtree: true, childList: true, attributes: true, characterData: true});
+  timer = setTimeout(function () { pboFinish(pboCheck()); }, timeoutMs);
+}
+"""
+
+# Counts the document's pending fetch/XHR requests in window.__pboPendingRequests,
+#   by wrapping fetch() and XMLHttpRequest.send(). Only requests started after it's
+#   installed are counted; installing again is a no-op.
+REQUEST_TRACKER_FUNCTIONS = """
+function pboInstallRequestTracker() {
+  if (window.__pboPendingRequests !== undefined) {
+    return;
+  }
+  window.__pboPendingRequests = 0;
+  var originalFetch = window.fetch;
+  if (originalFetch) {
+    window.fetch = function () {
+      window.__pboPendingRequests++;
+      return originalFetch.apply(this, arguments).finally(function () {
+        window.__pboPendingRequests--;
+      });
+    };
+  }
+  var originalSend = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    window.__pboPendingRequests++;
+    this.addEventListener('loadend', function () { window.__pboPendingRequests--; });
+    return originalSend.apply(this, arguments);
+  };
+}
+"""
+
+# Installs the request tracker (see REQUEST_TRACKER_FUNCTIONS), so the requests an
+#   action starts are counted by a later 'idle' settle.
+INSTALL_REQUEST_TRACKER = REQUEST_TRACKER_FUNCTIONS + """
+pboInstallRequestTracker();
+"""
+
+# Async script.
+# arguments[0]: settle policy; one of 'scroll_end', 'idle', 'dom_quiet'
+# arguments[1]: quiet period in milliseconds
+# arguments[2]: timeout in milliseconds
+# arguments[3]: element whose position is watched for 'scroll_end' (may be null)
+#
+# Calls back with {settled: bool} as soon as the page is quiescent per the policy:
+#   'scroll_end': the element (or the window, if no element) hasn't moved for two
+#       consecutive animation frames.
+#   'idle': no running animations and no pending fetch/XHR requests. Requests are
+#       tracked once INSTALL_REQUEST_TRACKER has run on the document (click()
+#       runs it first), or from this settle onwards.
+#   'dom_quiet': no DOM mutations for the quiet period.
+#   Calls back with {settled: false} after the timeout, even if animation frames
+#   are paused (hidden or background windows).
+SETTLE = REQUEST_TRACKER_FUNCTIONS + """
+var policy = arguments[0];
+var quietMs = arguments[1];
+var timeoutMs = arguments[2];
+var element = arguments[3];
+var done = arguments[arguments.length - 1];
+var start = performance.now();
+var finished = false;
+
+function pboFinish(settled) {
+  if (!finished) {
+    finished = true;
+    done({settled: settled});
+  }
+}
+
+function pboTimedOut() {
+  return performance.now() - start >= timeoutMs;
+}
+
+function pboPosition() {
+  if (element && element.isConnected) {
+    var rect = element.getBoundingClientRect();
+    return rect.left + ',' + rect.top;
+  }
+  return window.scrollX + ',' + window.scrollY;
+}
+
+function pboIsIdle() {
+  var animations = document.getAnimations ? document.getAnimations() : [];
+  for (var i = 0; i < animations.length; i++) {
+    if (animations[i].playState === 'running') {
+      return false;
+    }
+  }
+  return window.__pboPendingRequests === 0;
+}
+
+if (policy === 'scroll_end') {
+  // Browsers don't run animation frames in hidden windows; don't wait on them
+  //   past the timeout.
+  setTimeout(function () { pboFinish(false); }, timeoutMs);
+  var lastPosition = pboPosition();
+  var stableFrames = 0;
+  var onFrame = function () {
+    var position = pboPosition();
+    stableFrames = position === lastPosition ? stableFrames + 1 : 0;
+    lastPosition = position;
+    if (stableFrames >= 2) {
+      pboFinish(true);
+    } else if (pboTimedOut()) {
+      pboFinish(false);
+    } else {
+      requestAnimationFrame(onFrame);
+    }
+  };
+  requestAnimationFrame(onFrame);
+} else if (policy === 'idle') {
+  pboInstallRequestTracker();
+  var idleChecks = 0;
+  var onTick = function () {
+    idleChecks = pboIsIdle() ? idleChecks + 1 : 0;
+    if (idleChecks >= 2) {
+      pboFinish(true);
+    } else if (pboTimedOut()) {
+      pboFinish(false);
+    } else {
+      setTimeout(onTick, 16);
+    }
+  };
+  onTick();
+} else if (policy === 'dom_quiet') {
+  var quietTimer = null;
+  var observer = new MutationObserver(function () {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(onQuiet, quietMs);
+  });
+  var onQuiet = function () {
+    observer.disconnect();
+    clearTimeout(timeoutTimer);
+    pboFinish(true);
+  };
+  var timeoutTimer = setTimeout(function () {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    pboFinish(false);
+  }, timeoutMs);
+  observer.observe(document.documentElement, {subtree: true, childList: true, attributes: true, characterData: true});
+  quietTimer = setTimeout(onQuiet, quietMs);
+} else {
+  throw new Error('Unsupported settle policy: ' + policy);
+}
+"""
+
+# arguments[0]: <select> element
+#
+# Returns a list with one entry per <option>:
+#   {index, text, value, selected, disabled, element}
+DROPDOWN_SNAPSHOT = """
+var select = arguments[0];
+return Array.prototype.map.call(select.querySelectorAll('option'), function (option, index) {
+  return {
+    index: index,
+    text: option.text.trim(),
+    value: option.value,
+    selected: option.selected,
+    disabled: option.disabled,
+    element: option
+  };
+});
+"""
+
+# arguments[0]: element containing the checkboxes
+#
+# Returns a list with one entry per <input type="checkbox"> in it, in document order:
+#   {index, checked, disabled, displayed, element}
+CHECKBOX_GROUP_SNAPSHOT = DISPLAY_FUNCTIONS + """
+var container = arguments[0];
+return Array.prototype.map.call(container.querySelectorAll('input[type="checkbox"]'), function (checkbox, index) {
+  return {
+    index: index,
+    checked: checkbox.checked,
+    disabled: checkbox.disabled,
+    displayed: pboIsDisplayed(checkbox),
+    element: checkbox
+  };
+});
+"""
+
+# arguments[0]: navigation marker
+#
+# Leaves the marker on the current window before navigating, so READINESS can tell
+#   when the new document has replaced it. Returns the current URL.
+MARK_NAVIGATION = """
+window.pboNavigationMarker = arguments[0];
+return window.location.href;
+"""
+
+# Async script.
+# arguments[0]: navigation marker set by MARK_NAVIGATION ('' if there's none)
+# arguments[1]: document.readyState to wait for ('interactive' or 'complete'), or
+#   null not to wait
+# arguments[2]: network quiet period in milliseconds, or 0 not to wait for it
+# arguments[3]: timeout in milliseconds
+#
+# If the marker is still there, the old document hasn't been replaced yet; calls
+#   back right away with {navigated: false}. Otherwise waits until the ready state
+#   is reached and, if asked, no resource (per the Resource Timing API) has
+#   finished loading for the quiet period. Calls back with
+#   {navigated, ready, readyState}.
+READINESS = """
+var marker = arguments[0];
+var readyState = arguments[1];
+var quietMs = arguments[2];
+var timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var states = ['loading', 'interactive', 'complete'];
+var start = Date.now();
+
+if (marker && window.pboNavigationMarker === marker) {
+  done({navigated: false, ready: false, readyState: document.readyState});
+  return;
+}
+
+function pboLastResourceEnd() {
+  var entries = performance.getEntriesByType('resource');
+  var last = 0;
+  for (var i = 0; i < entries.length; i++) {
+    last = Math.max(last, entries[i].responseEnd);
+  }
+  return last;
+}
+
+function pboCheck() {
+  var stateReached = !readyState || states.indexOf(document.readyState) >= states.indexOf(readyState);
+  var idle = !quietMs || performance.now() - pboLastResourceEnd() >= quietMs;
+  if (stateReached && idle) {
+    done({navigated: true, ready: true, readyState: document.readyState});
+  } else if (Date.now() - start >= timeoutMs) {
+    done({navigated: true, ready: false, readyState: document.readyState});
+  } else {
+    setTimeout(pboCheck, 50);
+  }
+}
+pboCheck();
+"""
+
+# Counts what the current document loaded: itself and every resource (per the
+#   Resource Timing API), and their transfer size. Returns {requests, bytes}.
+#   Cross-origin responses without a Timing-Allow-Origin header report 0 bytes.
+RESOURCE_USAGE = """
+var entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+var bytes = 0;
+for (var i = 0; i < entries.length; i++) {
+  bytes += entries[i].transferSize || 0;
+}
+return {requests: entries.length, bytes: bytes};
+"""
+
+# arguments[0]: root element
+# arguments[1]: group locator as [by, value], relative to the root
+# arguments[2]: header locator as [by, value], relative to a group
+# arguments[3]: link list locator as [by, value], relative to a group
+# arguments[4]: link locator as [by, value], relative to a group
+# arguments[5]: class the link list has when the group is expanded
+#
+# Reads a collapsible nav tree (groups with a header and a list of links). Returns
+#   a list with one entry per group:
+#   {name, expanded, element, links: [{name, element}, ...]}
+NAV_TREE_SNAPSHOT = FIND_FUNCTIONS + """
+var root = arguments[0];
+var groupLocator = arguments[1];
+var headerLocator = arguments[2];
+var listLocator = arguments[3];
+var linkLocator = arguments[4];
+var expandedClass = arguments[5];
+
+function pboText(element) {
+  return element ? (element.innerText || element.textContent || '').trim() : '';
+}
+
+return pboFind(root, groupLocator[0], groupLocator[1]).map(function (group) {
+  var header = pboFind(group, headerLocator[0], headerLocator[1])[0];
+  var list = pboFind(group, listLocator[0], listLocator[1])[0];
+  return {
+    name: pboText(header),
+    expanded: list ? list.classList.contains(expandedClass) : false,
+    element: group,
+    links: pboFind(group, linkLocator[0], linkLocator[1]).map(function (link) {
+      return {name: pboText(link), element: link};
+    })
+  };
+});
+"""
+
+# Clears the page's local and session storage. Either may be unavailable (e.g.
+#   on about:blank, or when blocked by the browser), which is ignored.
+CLEAR_STORAGE = """
+try {
+  window.localStorage.clear();
+} catch (e) {}
+try {
+  window.sessionStorage.clear();
+} catch (e) {}
+"""
+
+# arguments[0]: list of [element, scope, by, value, text]. If element is null, the
+#   field is found with the [scope, by, value] locator instead.
+# arguments[1]: element used for 'element' scoped locators (may be null)
+#
+# Sets each field's value to text through the native value setter, then fires
+#   'input' and 'change' so frameworks that track the value themselves (e.g.
+#   React) pick it up. Fields are checked first: if any is missing, disabled,
+#   read-only or not an <input> or <textarea> (e.g. a <select> or a
+#   contenteditable <div>), nothing is set. Returns {missing: [indexes],
+#   unwritable: [indexes]}.
+FILL_FIELDS = FIND_FUNCTIONS + """
+var fields = arguments[0];
+var scopeElement = arguments[1];
+var missing = [];
+var unwritable = [];
+var elements = fields.map(function (field, index) {
+  var element = field[0];
+  if (!element) {
+    var root = field[1] === 'element' ? scopeElement : document;
+    element = pboFind(root, field[2], field[3])[0] || null;
+  }
+  if (!element) {
+    missing.push(index);
+  } else if (!(element instanceof HTMLInputElement || element instanceof HTMLTextAreaElement) ||
+             element.disabled || element.readOnly) {
+    // The native setters below only apply to these two (from this document;
+    //   elements of another frame have their own prototypes).
+    unwritable.push(index);
+  }
+  return element;
+});
+if (missing.length || unwritable.length) {
+  return {missing: missing, unwritable: unwritable};
+}
+elements.forEach(function (element, index) {
+  var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+  Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, fields[index][4]);
+  element.dispatchEvent(new Event('input', {bubbles: true}));
+  element.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return {missing: missing, unwritable: unwritable};
+"""
+
+# arguments[0]: list of [scope, by, value, read, name]
+# arguments[1]: element used for 'element' scoped locators (may be null)
+#
+# Returns a list, in the same order, of what each field reads from the first
+#   matching element (see page_objects.base.FIELD_READS): its rendered text ('' if
+#   not displayed, as WebDriver does), value, attribute 'name', whether it's
+#   displayed, or whether it exists. Missing elements read as null, or false for
+#   'displayed' and 'exists'.
+READ_FIELDS = FIND_FUNCTIONS + DISPLAY_FUNCTIONS + """
+var fields = arguments[0];
+var scopeElement = arguments[1];
+return fields.map(function (field) {
+  var root = field[0] === 'element' ? scopeElement : document;
+  var element = pboFind(root, field[1], field[2])[0] || null;
+  switch (field[3]) {
+    case 'exists':
+      return element !== null;
+    case 'displayed':
+      return pboIsDisplayed(element);
+    case 'text':
+      if (!element) {
+        return null;
+      }
+      return pboIsDisplayed(element) ? (element.innerText || '').trim() : '';
+    case 'value':
+      return element ? element.value : null;
+    case 'attribute':
+      return element ? element.getAttribute(field[4]) : null;
+    default:
+      throw new Error('Unsupported field read: ' + field[3]);
+  }
+});
+"""
@@ -0,0 +1,140 @@
+"""
+Wait engine used by the wait_until_*() methods in base.py.
+
+Two modes are supported:
+    'poll': the condition is checked immediately, then polled from Python with
+        exponential backoff until it holds or the timeout expires. Timing uses a
+        monotonic clock, so it's unaffected by system clock changes.
+    'observe': a DomCondition is evaluated in the browser, which re-checks it on
+        every DOM mutation. The whole wait is a single round trip.
+
+wait_for_async() is the same engine for the asyncio page objects in
+page_objects.aio; it sleeps with asyncio.sleep() so other sessions keep running.
+"""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, NamedTuple, Type, Union
+
+WAIT_MODES = ['poll', 'observe']
+
+# How BaseElement waits for the page to settle after scrolling or clicking.
+#   'none': don't wait
+#   'scroll_end': until the element has stopped moving (scrolling has ended)
+#   'idle': until no animations are running and no fetch/XHR requests are pending
+#   'dom_quiet': until the DOM hasn't changed for a quiet period
+#   'legacy': sleep 0.5s, as BaseElement.click() used to
+SETTLE_POLICIES = ['none', 'scroll_end', 'idle', 'dom_quiet', 'legacy']
+
+# Checks a DomCondition can make against the element found at its locator.
+DOM_CONDITION_CHECKS = ['exists', 'absent', 'displayed', 'not_displayed',
+                        'class_contains', 'class_not_contains',
+                        'attribute_present', 'attribute_absent', 'attribute_equals',
+                        'text_equals']
+
+
+class PollProfile(NamedTuple):
+    """
+    How a condition is polled.
+
+    After the immediate first check, the engine sleeps initial_delay seconds
+    before the next one. Each following delay is multiplied by backoff, capped at
+    max_delay. jitter randomizes each delay by up to +/- that fraction so many
+    waits don't poll in lockstep.
+    """
+    initial_delay: float = 0.05
+    backoff: float = 1.5
+    max_delay: float = 0.5
+    jitter: float = 0.1
+
+
+class WaitResult(NamedTuple):
+    """
+    Outcome of a wait.
+
+    satisfied: whether the condition held before the timeout
+    elapsed: seconds spent waiting
+    polls: number of times the condition was checked
+    """
+    satisfied: bool
+    elapsed: float
+    polls: int
+
+
+class DomCondition(NamedTuple):
+    """
+    A condition the browser can evaluate by itself, for 'observe' mode waits.
+
+    locator: a key of the page object's _locators, or a Locator
+    check: one of DOM_CONDITION_CHECKS
+    name: class or attribute name, for the class_* and attribute_* checks
+    expected: expected value, for attribute_equals and text_equals
+
+    e.g. an accordion is open once its body has the 'show' class:
+        DomCondition(locator='body', check='class_contains', name='show')
+    """
+    locator: Union[str, 'page_objects.base.Locator']
+    check: str
+    name: str = ''
+    expected: str = ''
+
+
+def wait_for(condition: Callable[[], bool], timeout: float, profile: PollProfile = PollProfile(),
+             ignored_exceptions: tuple[Type[Exception], ...] = ()) -> WaitResult:
+    """
+    Polls condition until it returns True or timeout seconds have passed.
+
+    The condition is always checked at least once, and once more at the deadline.
+    If the condition raises one of ignored_exceptions, it's treated as not yet
+    satisfied (e.g. an element that's being re-rendered).
+    """
+    start_time = time.monotonic()
+    end_time = start_time + timeout
+    delay = profile.initial_delay
+    polls = 0
+
+    while True:
+        polls += 1
+        try:
+            satisfied = condition()
+        except ignored_exceptions:
+            satisfied = False
+        if satisfied:
+            return WaitResult(satisfied=True, elapsed=time.monotonic() - start_time, polls=polls)
+
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            return WaitResult(satisfied=False, elapsed=time.monotonic() - start_time, polls=polls)
+
+        sleep_time = delay * (1 + random.uniform(-profile.jitter, profile.jitter))
+        time.sleep(max(0.0, min(sleep_time, remaining)))
+        delay = min(delay * profile.backoff, profile.max_delay)
+
+
+async def wait_for_async(condition: Callable[[], Awaitable[bool]], timeout: float, profile: PollProfile = PollProfile(),
+                         ignored_exceptions: tuple[Type[Exception], ...] = ()) -> WaitResult:
+    """
+    Same as wait_for(), for a coroutine condition.
+    """
+    start_time = time.monotonic()
+    end_time = start_time + timeout
+    delay = profile.initial_delay
+    polls = 0
+
+    while True:
+        polls += 1
+        try:
+            satisfied = await condition()
+        except ignored_exceptions:
+            satisfied = False
+        if satisfied:
+            return WaitResult(satisfied=True, elapsed=time.monotonic() - start_time, polls=polls)
+
+        remaining = end_time - time.monotonic()
+        if remaining <= 0:
+            return WaitResult(satisfied=False, elapsed=time.monotonic() - start_time, polls=polls)
+
+        sleep_time = delay * (1 + random.uniform(-profile.jitter, profile.jitter))
+        await asyncio.sleep(max(0.0, min(sleep_time, remaining)))
+        delay = min(delay * profile.backoff, profile.max_delay)
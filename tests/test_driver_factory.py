@@ -0,0 +1,143 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import misc.driver_factory
+import misc.driver_pool
+from benchmarks import sites
+from benchmarks.fake_webdriver import FakeWebDriver
+
+
+class QuitCountingDriver(FakeWebDriver):
+
+    def __init__(self) -> None:
+        super().__init__(site=sites.SITE)
+        self.quits = 0
+        return
+
+    def quit(self) -> None:
+        self.quits += 1
+        return
+
+
+@pytest.fixture
+def launched_options(monkeypatch) -> list:
+    """
+    Makes factories start QuitCountingDrivers instead of Chrome, and collects the
+    options each one was started with.
+    """
+    launched_options = []
+
+    def chrome(options) -> QuitCountingDriver:
+        launched_options.append(options)
+        return QuitCountingDriver()
+
+    monkeypatch.setattr(misc.driver_factory.webdriver, 'Chrome', chrome)
+    return launched_options
+
+
+def test_headless_fast_options() -> None:
+    options = misc.driver_factory.DriverFactory(profile='headless-fast').options()
+    assert '--headless=new' in options.arguments
+    assert '--window-size=1920,1080' in options.arguments
+    assert set(misc.driver_factory.TUNED_ARGUMENTS) <= set(options.arguments)
+    assert '--disable-renderer-backgrounding' in options.arguments
+    assert options.page_load_strategy == 'eager'
+    assert 'prefs' not in options.experimental_options
+    assert not any(i.startswith('--disk-cache-dir') for i in options.arguments)
+    return
+
+
+def test_debug_visible_options() -> None:
+    options = misc.driver_factory.DriverFactory(profile='debug-visible').options()
+    assert '--headless=new' not in options.arguments
+    assert '--disable-gpu' not in options.arguments
+    assert options.page_load_strategy == 'normal'
+    return
+
+
+def test_low_memory_options() -> None:
+    options = misc.driver_factory.DriverFactory(profile='low-memory').options()
+    assert '--headless=new' in options.arguments
+    assert '--renderer-process-limit=2' in options.arguments
+    assert options.experimental_options['prefs'] == {'profile.managed_default_content_settings.images': 2}
+    assert options.page_load_strategy == 'eager'
+    return
+
+
+def test_cache_dir_option(tmp_path) -> None:
+    factory = misc.driver_factory.DriverFactory(cache_dir=str(tmp_path), name='gw1')
+    options = factory.options(cache_slot=2)
+    assert f'--disk-cache-dir={os.path.join(str(tmp_path), "gw1-2")}' in options.arguments
+    return
+
+
+def test_invalid_profile() -> None:
+    with pytest.raises(ValueError):
+        misc.driver_factory.DriverFactory(profile='turbo')
+    return
+
+
+def test_quit_frees_cache_slot(launched_options, tmp_path) -> None:
+    factory = misc.driver_factory.DriverFactory(cache_dir=str(tmp_path), name='main')
+    driver_1 = factory()
+    driver_2 = factory()
+    factory.quit(driver_1)
+    driver_3 = factory()
+    cache_dirs = [next(i for i in options.arguments if i.startswith('--disk-cache-dir')) for options in launched_options]
+    assert cache_dirs[0] != cache_dirs[1]
+    assert cache_dirs[2] == cache_dirs[0]
+
+    factory.quit(driver_2)
+    factory.quit(driver_3)
+    assert [driver_1.quits, driver_2.quits, driver_3.quits] == [1, 1, 1]
+    sessions = factory.sessions()
+    assert [i['number'] for i in sessions] == [1, 2, 3]
+    assert all(i['profile'] == 'headless-fast' and i['startup_time'] >= 0 for i in sessions)
+    return
+
+
+def test_quit_unknown_driver(launched_options) -> None:
+    factory = misc.driver_factory.DriverFactory()
+    driver = QuitCountingDriver()
+    factory.quit(driver)
+    assert driver.quits == 1
+    assert factory.sessions() == []
+    return
+
+
+def test_pool_quits_through_factory(launched_options, tmp_path, monkeypatch) -> None:
+    factory = misc.driver_factory.DriverFactory(cache_dir=str(tmp_path))
+    quit_drivers = []
+    quit_ = factory.quit
+    monkeypatch.setattr(factory, 'quit', lambda driver: quit_drivers.append(driver) or quit_(driver))
+    pool = misc.driver_pool.DriverPool(factory=factory, size=1, max_uses=1)
+
+    with pool.lease() as driver_1:
+        pass
+    with pool.lease() as driver_2:
+        pass
+    pool.close()
+    assert quit_drivers == [driver_1, driver_2]
+    assert driver_1.quits == 1
+    return
+
+
+@pytest.mark.skipif(not os.path.isdir('/proc'), reason='needs /proc')
+def test_process_tree_rss() -> None:
+    child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+    try:
+        child_rss = misc.driver_factory.process_tree_rss(pid=child.pid)
+        children_rss = misc.driver_factory.process_tree_rss(pid=os.getpid(), include_root=False)
+        tree_rss = misc.driver_factory.process_tree_rss(pid=os.getpid())
+    finally:
+        child.kill()
+        child.wait()
+    assert child_rss > 0
+    assert children_rss >= child_rss
+    assert tree_rss > children_rss
+    # A process that doesn't exist has nothing resident.
+    assert misc.driver_factory.process_tree_rss(pid=child.pid) == 0
+    return
@@ -0,0 +1,164 @@
+import threading
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+import misc.driver_pool
+from benchmarks import sites
+from benchmarks.fake_webdriver import FakeWebDriver
+
+
+class Factory:
+    """
+    Starts FakeWebDrivers, and remembers which ones were quit.
+    """
+
+    def __init__(self) -> None:
+        self.started: list[FakeWebDriver] = []
+        self.quit_drivers: list[FakeWebDriver] = []
+        return
+
+    def __call__(self) -> FakeWebDriver:
+        driver = FakeWebDriver(site=sites.SITE)
+        driver.quit = lambda: self.quit_drivers.append(driver)
+        self.started.append(driver)
+        return driver
+
+
+def crash(driver: FakeWebDriver) -> None:
+    def execute(command: str, params: dict) -> dict:
+        raise WebDriverException('chrome not reachable')
+
+    driver.command_executor.execute = execute
+    return
+
+
+def test_lease_reuses_session() -> None:
+    factory = Factory()
+    pool = misc.driver_pool.DriverPool(factory=factory, size=1)
+
+    with pool.lease() as driver_1:
+        pass
+    with pool.lease() as driver_2:
+        pass
+    assert driver_1 is driver_2
+    assert pool.stats() == {'started': 1, 'recycled': 0, 'crashed': 0, 'leases': 2}
+    return
+
+
+def test_start_fills_pool() -> None:
+    factory = Factory()
+    pool = misc.driver_pool.DriverPool(factory=factory, size=3)
+
+    pool.start()
+    pool.start()
+    assert len(factory.started) == 3
+    with pool.lease(), pool.lease(), pool.lease():
+        pass
+    assert pool.stats()['started'] == 3
+    return
+
+
+def test_session_recycled_after_max_uses() -> None:
+    factory = Factory()
+    pool = misc.driver_pool.DriverPool(factory=factory, size=1, max_uses=2)
+
+    drivers = []
+    for _ in range(3):
+        with pool.lease() as driver:
+            drivers.append(driver)
+    assert drivers[0] is drivers[1]
+    assert drivers[2] is not drivers[0]
+    assert factory.quit_drivers == [drivers[0]]
+    assert pool.stats() == {'started': 2, 'recycled': 1, 'crashed': 0, 'leases': 3}
+    return
+
+
+def test_concurrent_leases_counted() -> None:
+    factory = Factory()
+    pool = misc.driver_pool.DriverPool(factory=factory, size=4, max_uses=3)
+
+    def lease_many() -> None:
+        for _ in range(250):
+            with pool.lease():
+                pass
+        return
+
+    threads = [threading.Thread(target=lease_many) for _ in range(8)]
+    for i_thread in threads:
+        i_thread.start()
+    for i_thread in threads:
+        i_thread.join()
+    stats = pool.stats()
+    assert stats['leases'] == 2000
+    assert stats['recycled'] == len(factory.quit_drivers)
+    # Every session started was either recycled or is idle again.
+    assert stats['started'] == len(factory.started) == stats['recycled'] + pool._idle.qsize()
+    return
+
+
+def test_crashed_session_replaced() -> None:
+    factory = Factory()
+    pool = misc.driver_pool.DriverPool(factory=factory, size=1)
+
+    with pool.lease() as driver_1:
+        pass
+    crash(driver_1)
+    with pool.lease() as driver_2:
+        pass
+    assert driver_2 is not driver_1
+    assert factory.quit_drivers == [driver_1]
+    assert pool.stats() == {'started': 2, 'recycled': 0, 'crashed': 1, 'leases': 2}
+    return
+
+
+def test_acquire_times_out_when_pool_is_full() -> None:
+    pool = misc.driver_pool.DriverPool(factory=Factory(), size=1)
+
+    with pool.lease():
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.05)
+    return
+
+
+def test_failed_start_frees_slot() -> None:
+    factory = Factory()
+    calls = []
+
+    def flaky_factory() -> FakeWebDriver:
+        calls.append(None)
+        if len(calls) == 1:
+            raise WebDriverException('session not created')
+        return factory()
+
+    pool = misc.driver_pool.DriverPool(factory=flaky_factory, size=1)
+    with pytest.raises(WebDriverException):
+        pool.acquire()
+    with pool.lease() as driver:
+        assert driver is factory.started[0]
+    return
+
+
+def test_close_quits_idle_and_released_sessions() -> None:
+    factory = Factory()
+    pool = misc.driver_pool.DriverPool(factory=factory, size=2)
+    pool.start()
+
+    leased = pool.acquire()
+    pool.close()
+    assert len(factory.quit_drivers) == 1
+    assert leased.driver not in factory.quit_drivers
+
+    pool.release(leased)
+    assert sorted(map(id, factory.quit_drivers)) == sorted(map(id, factory.started))
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+    return
+
+
+def test_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        misc.driver_pool.DriverPool(factory=Factory(), size=0)
+    with pytest.raises(ValueError):
+        misc.driver_pool.DriverPool(factory=Factory(), max_uses=-1)
+    return
@@ -0,0 +1,78 @@
+import http.server
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+import misc.fixture_server
+
+
+class OriginHandler(http.server.BaseHTTPRequestHandler):
+    # Stands in for a real site: a page linking back to its own origin, and a
+    #   redirect to it.
+
+    def do_GET(self) -> None:
+        origin = f'http://{self.server.server_address[0]}:{self.server.server_address[1]}'
+        if self.path == '/old':
+            self.send_response(301)
+            self.send_header('Location', f'{origin}/page')
+            body = b''
+        else:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            body = f'<script src="{origin}/main.js"></script>'.encode('utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return
+
+    def log_message(self, format, *args) -> None:
+        return
+
+
+def fetch(url: str) -> tuple[int, dict, bytes]:
+    opener = urllib.request.build_opener(misc.fixture_server._NoRedirects)
+    try:
+        with opener.open(url, timeout=5) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+@pytest.fixture
+def origin_server() -> misc.fixture_server.Server:
+    server = misc.fixture_server.Server(('127.0.0.1', 0), OriginHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    return
+
+
+def test_record_then_replay(origin_server: misc.fixture_server.Server, tmp_path) -> None:
+    host, port = origin_server.server_address[:2]
+    origin = f'http://{host}:{port}'
+    archive_path = str(tmp_path / 'sites.har')
+    with misc.fixture_server.FixtureServer(archive_path=archive_path, origins=[origin], mode='record') as server:
+        for i_path in ['/page', '/old']:
+            assert fetch(server.rewrite(origin + i_path))[0] in [200, 301]
+        assert server.stats['recorded'] == 2
+
+    # Replay from the archive alone.
+    origin_server.shutdown()
+    origin_server.server_close()
+    with misc.fixture_server.FixtureServer(archive_path=archive_path, origins=[origin], mode='replay') as server:
+        local_origin = server.local_origin(origin)
+        status, _, body = fetch(server.rewrite(origin + '/page'))
+        assert status == 200
+        assert body.decode('utf-8') == f'<script src="{local_origin}/main.js"></script>'
+
+        status, headers, _ = fetch(server.rewrite(origin + '/old'))
+        assert status == 301
+        assert headers['Location'] == f'{local_origin}/page'
+
+        status, _, _ = fetch(server.rewrite(origin + '/main.js'))
+        assert status == 404
+        assert server.stats == {'served': 2, 'recorded': 0, 'missing': 1}
+    return
@@ -0,0 +1,35 @@
+import copy
+import pickle
+
+from selenium.webdriver.common.by import By
+
+import page_objects.base
+from page_objects.base import Locator
+
+
+def test_copy_returns_same_locator() -> None:
+    locator = Locator(scope='driver', by=By.ID, value='title')
+    assert copy.copy(locator) is locator
+    assert copy.deepcopy(locator) is locator
+    return
+
+
+def test_deepcopy_of_containers_holding_locators() -> None:
+    locators = {'title': Locator(scope='driver', by=By.ID, value='title')}
+    table = page_objects.base.LocatorTable(locators)
+
+    copied = copy.deepcopy({'locators': locators, 'table': table})
+    assert copied['locators'] == locators
+    assert copied['locators']['title'] is locators['title']
+    assert dict(copied['table']) == dict(table)
+    return
+
+
+def test_pickle_round_trip() -> None:
+    locator = Locator(scope='ELEMENT', by=By.CSS_SELECTOR, value='div > a')
+
+    unpickled = pickle.loads(pickle.dumps(locator))
+    assert unpickled == locator
+    assert hash(unpickled) == hash(locator)
+    assert unpickled.scope == 'element'
+    return
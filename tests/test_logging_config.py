@@ -0,0 +1,203 @@
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import misc.logging_config
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class RecordingHandler(logging.Handler):
+    """
+    Keeps the messages it handles. While gate is cleared, handling blocks, so
+    the logging queue fills up.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        return
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.gate.wait()
+        self.messages.append(record.getMessage())
+        return
+
+
+@pytest.fixture
+def handler(monkeypatch) -> RecordingHandler:
+    """
+    Configures logging in 'queue' mode with only a RecordingHandler, and puts the
+    root logger back afterwards.
+    """
+    handler = RecordingHandler()
+    monkeypatch.setattr(misc.logging_config, 'config', {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'handlers': {
+            'recording': {'()': lambda: handler, 'level': logging.DEBUG},
+            'debug_buffer': {'()': misc.logging_config.DebugRingBufferHandler, 'level': logging.DEBUG},
+        },
+        'root': {'handlers': ['recording', 'debug_buffer'], 'level': logging.DEBUG},
+    })
+    monkeypatch.setattr(misc.logging_config, '_configured', False)
+    monkeypatch.setattr(misc.logging_config, '_debug_buffer', None)
+    monkeypatch.setattr(misc.logging_config.atexit, 'register', lambda function: None)
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+
+    yield handler
+
+    handler.gate.set()
+    misc.logging_config.shutdown()
+    root.handlers = handlers
+    root.setLevel(level)
+    return
+
+
+def enqueue(queue_handler: misc.logging_config.BoundedQueueHandler, *messages: str) -> None:
+    for i_message in messages:
+        queue_handler.enqueue(logging.makeLogRecord({'msg': i_message}))
+    return
+
+
+def queued(queue_: queue.Queue) -> list[str]:
+    return [i.getMessage() for i in list(queue_.queue)]
+
+
+def test_drop_oldest() -> None:
+    queue_handler = misc.logging_config.BoundedQueueHandler(queue.Queue(maxsize=2), overflow='drop_oldest')
+    enqueue(queue_handler, 'a', 'b', 'c')
+    assert queued(queue_handler.queue) == ['b', 'c']
+    assert queue_handler.dropped == 1
+    return
+
+
+def test_drop_newest() -> None:
+    queue_handler = misc.logging_config.BoundedQueueHandler(queue.Queue(maxsize=2), overflow='drop_newest')
+    enqueue(queue_handler, 'a', 'b', 'c')
+    assert queued(queue_handler.queue) == ['a', 'b']
+    assert queue_handler.dropped == 1
+    return
+
+
+def test_block() -> None:
+    queue_handler = misc.logging_config.BoundedQueueHandler(queue.Queue(maxsize=2), overflow='block')
+    enqueue(queue_handler, 'a', 'b')
+    thread = threading.Thread(target=enqueue, args=(queue_handler, 'c'))
+    thread.start()
+    time.sleep(0.05)
+    assert thread.is_alive()
+
+    queue_handler.queue.get_nowait()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+    assert queued(queue_handler.queue) == ['b', 'c']
+    assert queue_handler.dropped == 0
+    return
+
+
+def test_invalid_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        misc.logging_config.BoundedQueueHandler(queue.Queue(), overflow='drop_all')
+    return
+
+
+def test_flush_waits_for_listener(handler: RecordingHandler) -> None:
+    misc.logging_config.configure(mode='queue', queue_size=100)
+    handler.gate.clear()
+    for i in range(20):
+        logging.info('record %d', i)
+    assert handler.messages == []
+
+    threading.Timer(0.05, handler.gate.set).start()
+    misc.logging_config.flush()
+    assert handler.messages == [f'record {i}' for i in range(20)]
+    assert len(misc.logging_config.debug_buffer().records) == 20
+    return
+
+
+def test_shutdown_with_full_queue(handler: RecordingHandler) -> None:
+    misc.logging_config.configure(mode='queue', queue_size=2, overflow='drop_newest')
+    handler.gate.clear()
+    logging.info('record 0')
+    while not misc.logging_config._queue_handler.queue.empty():
+        time.sleep(0.001)
+    for i in range(1, 10):
+        logging.info('record %d', i)
+
+    threading.Timer(0.05, handler.gate.set).start()
+    misc.logging_config.shutdown()
+    root = logging.getLogger()
+    assert handler in root.handlers
+    assert not any(isinstance(i, misc.logging_config.BoundedQueueHandler) for i in root.handlers)
+    # The record being handled, and the 2 that fit in the queue.
+    assert handler.messages[:3] == ['record 0', 'record 1', 'record 2']
+    assert handler.messages[3].startswith('7 log record(s) were dropped')
+
+    logging.info('after shutdown')
+    assert handler.messages[-1] == 'after shutdown'
+    return
+
+
+def test_shutdown_restores_handlers_if_stop_fails(handler: RecordingHandler, monkeypatch) -> None:
+    misc.logging_config.configure(mode='queue')
+    listener = misc.logging_config._listener
+
+    def stop() -> None:
+        raise RuntimeError('listener failed')
+
+    monkeypatch.setattr(listener, 'stop', stop)
+    with pytest.raises(RuntimeError):
+        misc.logging_config.shutdown()
+    assert handler in logging.getLogger().handlers
+    misc.logging_config._QueueListener.stop(listener)
+    return
+
+
+def test_debug_buffer_keeps_last_records(tmp_path) -> None:
+    debug_buffer = misc.logging_config.DebugRingBufferHandler(capacity=3)
+    debug_buffer.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+    for i in range(5):
+        debug_buffer.handle(logging.makeLogRecord({'msg': f'record {i}', 'levelname': 'DEBUG'}))
+
+    path = tmp_path / 'failures' / 'test.log'
+    assert debug_buffer.dump(path=str(path)) == 3
+    assert path.read_text().splitlines() == ['DEBUG record 2', 'DEBUG record 3', 'DEBUG record 4']
+    debug_buffer.clear()
+    assert debug_buffer.dump(path=str(path)) == 0
+    return
+
+
+def test_debug_records_written_only_for_failed_tests(tmp_path) -> None:
+    # Runs a test module with the examples' conftest hooks, in its own process
+    #   (they configure the root logger, and write under the working directory).
+    (tmp_path / 'test_module.py').write_text(
+        'import logging\n'
+        '\n'
+        'def test_passes():\n'
+        '    logging.debug("debug record of a passing test")\n'
+        '\n'
+        'def test_fails():\n'
+        '    logging.debug("debug record of a failing test")\n'
+        '    assert False\n')
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join([REPO_ROOT, os.environ.get('PYTHONPATH', '')]))
+    process = subprocess.run([sys.executable, '-m', 'pytest', '-p', 'examples.conftest', '-p', 'no:cacheprovider',
+                              'test_module.py'],
+                             cwd=tmp_path, env=environment, capture_output=True, text=True)
+    assert process.returncode == 1, process.stdout + process.stderr
+
+    failure_logs = list((tmp_path / 'Logs' / 'failures').iterdir())
+    assert [i.name for i in failure_logs] == ['test_module.py_test_fails.log']
+    text = failure_logs[0].read_text()
+    assert 'debug record of a failing test' in text
+    assert 'debug record of a passing test' not in text
+    return
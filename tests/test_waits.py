@@ -0,0 +1,141 @@
+import asyncio
+import types
+from typing import Callable
+
+import pytest
+
+import page_objects.waits
+from page_objects.waits import PollProfile
+
+
+class FakeClock:
+    """
+    Stands in for the time module in page_objects.waits: sleeping advances the
+    clock instantly, and every sleep is recorded.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+        return
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        return
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+        return
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(page_objects.waits, 'time', clock)
+    monkeypatch.setattr(page_objects.waits, 'asyncio', types.SimpleNamespace(sleep=clock.async_sleep))
+    return clock
+
+
+def satisfied_on_check(number: int) -> Callable[[], bool]:
+    # A condition that holds from its number-th check on.
+    checks = []
+
+    def condition() -> bool:
+        checks.append(None)
+        return len(checks) >= number
+
+    return condition
+
+
+def wait_both(clock: FakeClock, condition: Callable[[], Callable[[], bool]],
+              **kwargs) -> list[page_objects.waits.WaitResult]:
+    # Runs the same wait with wait_for() and wait_for_async(), from the same clock
+    #   time, and returns both results. Each gets its own condition.
+    results = []
+    start = clock.now
+    results.append(page_objects.waits.wait_for(condition=condition(), **kwargs))
+    sleeps = list(clock.sleeps)
+    clock.now, clock.sleeps = start, []
+
+    async_condition = condition()
+
+    async def coroutine_condition() -> bool:
+        return async_condition()
+
+    results.append(asyncio.run(page_objects.waits.wait_for_async(condition=coroutine_condition, **kwargs)))
+    assert clock.sleeps == sleeps
+    return results
+
+
+def test_satisfied_condition_returns_without_sleeping(clock) -> None:
+    for result in wait_both(clock, lambda: satisfied_on_check(1), timeout=5.0):
+        assert result == page_objects.waits.WaitResult(satisfied=True, elapsed=0.0, polls=1)
+    assert clock.sleeps == []
+    return
+
+
+def test_backoff_grows_to_max_delay(clock) -> None:
+    profile = PollProfile(initial_delay=0.1, backoff=2.0, max_delay=0.5, jitter=0.0)
+    for result in wait_both(clock, lambda: satisfied_on_check(7), timeout=10.0, profile=profile):
+        assert result.satisfied
+        assert result.polls == 7
+        assert result.elapsed == pytest.approx(2.2)
+    assert clock.sleeps == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5, 0.5])
+    return
+
+
+def test_jitter_stays_within_bounds(clock) -> None:
+    profile = PollProfile(initial_delay=0.1, backoff=1.5, max_delay=0.5, jitter=0.2)
+    page_objects.waits.wait_for(condition=satisfied_on_check(200), timeout=1000.0, profile=profile)
+    assert len(clock.sleeps) == 199
+
+    delay = profile.initial_delay
+    for i_sleep in clock.sleeps:
+        assert delay * 0.8 <= i_sleep <= delay * 1.2
+        delay = min(delay * profile.backoff, profile.max_delay)
+    # Randomized, not stuck at either bound.
+    assert len(set(clock.sleeps)) > 100
+    return
+
+
+def test_deadline_is_kept(clock) -> None:
+    profile = PollProfile(initial_delay=0.3, backoff=1.0, max_delay=0.3, jitter=0.0)
+    for result in wait_both(clock, lambda: satisfied_on_check(100), timeout=1.0, profile=profile):
+        # Checked at 0, 0.3, 0.6, 0.9 and at the deadline.
+        assert result.satisfied is False
+        assert result.polls == 5
+        assert result.elapsed == pytest.approx(1.0)
+    # The last sleep is cut short to end at the deadline.
+    assert clock.sleeps == pytest.approx([0.3, 0.3, 0.3, 0.1])
+    return
+
+
+def test_zero_timeout_checks_once(clock) -> None:
+    for result in wait_both(clock, lambda: satisfied_on_check(2), timeout=0.0):
+        assert result == page_objects.waits.WaitResult(satisfied=False, elapsed=0.0, polls=1)
+    assert clock.sleeps == []
+    return
+
+
+def test_ignored_exceptions(clock) -> None:
+    checks = []
+
+    def condition() -> bool:
+        checks.append(None)
+        if len(checks) < 3:
+            raise LookupError('not rendered yet')
+        return True
+
+    result = page_objects.waits.wait_for(condition=condition, timeout=5.0, ignored_exceptions=(LookupError,))
+    assert result.satisfied
+    assert result.polls == 3
+
+    checks.clear()
+    with pytest.raises(LookupError):
+        page_objects.waits.wait_for(condition=condition, timeout=5.0)
+    assert len(checks) == 1
+    return